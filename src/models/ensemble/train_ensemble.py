@@ -13,6 +13,7 @@ import pandas as pd
 import numpy as np
 from datetime import datetime
 from scripts.hybrid_ensemble import HybridEnsemblePredictor
+from scripts.fa.game_log_loader import read_game_logs
 
 def calculate_fantasy_points(game_logs_df):
     """
@@ -62,8 +63,7 @@ def train_ensemble_model():
     
     # Load September 2024 game logs
     print("Loading game logs...")
-    game_logs = pd.read_csv(data_dir / 'mlb_game_logs_2024.csv')
-    game_logs['game_date'] = pd.to_datetime(game_logs['game_date'])
+    game_logs = read_game_logs(data_dir / 'mlb_game_logs_2024.csv')
     
     # Filter to September
     sept_logs = game_logs[game_logs['game_date'].dt.month == 9].copy()
@@ -74,7 +74,7 @@ def train_ensemble_model():
     sept_logs = calculate_fantasy_points(sept_logs)
     
     # Aggregate by player (average per game)
-    player_stats = sept_logs.groupby('player_name').agg({
+    player_stats = sept_logs.groupby('player_name', observed=True).agg({
         'fantasy_points': 'mean',
         'game_date': 'count'
     }).reset_index()
@@ -322,8 +322,8 @@ def load_roster_stats(team_filter):
     
     # Load game logs
     try:
-        game_logs = pd.read_csv('data/mlb_game_logs_2025.csv')
-        game_logs['game_date'] = pd.to_datetime(game_logs['game_date'])
+        from scripts.fa.game_log_loader import read_game_logs
+        game_logs = read_game_logs('data/mlb_game_logs_2025.csv')
         
         # Calculate stats for last 7, 14, 30 days from Sept 28
         target_date = pd.to_datetime('2025-09-28')
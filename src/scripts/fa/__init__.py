@@ -13,6 +13,11 @@ Contains individual factor analysis modules for fantasy baseball predictions:
 - bullpen_fatigue_analysis: Opposing bullpen strength and fatigue detection
 - statcast_metrics_analysis: Exit velocity, barrel rate, quality of contact
 - vegas_odds_analysis: Vegas betting lines and implied run totals
+- data_context: Load-once shared inputs (schedule, weather, game logs) for a run
+- game_log_index: Per-player sorted game logs with prefix sums for window queries
+- game_context_cache: Per-team / per-venue game contexts computed once per run
+- game_log_loader: Typed, compact reader for the mlb_game_logs_<season>.csv files
+- venue_conditions: Per-venue temperature, wind and air conditions shared by the weather factors
 """
 
 from .wind_analysis import WindAnalyzer
@@ -29,6 +34,12 @@ from .monthly_splits_fa import MonthlySplitsAnalyzer
 from .team_momentum_fa import TeamOffensiveMomentumAnalyzer
 from .statcast_metrics_fa import StatcastMetricsAnalyzer
 from .vegas_odds_fa import VegasOddsAnalyzer
+from .data_context import FactorDataContext
+from .game_log_index import GameLogIndex
+from .game_context_cache import GameContextCache
+from .game_log_loader import load_game_logs, read_game_logs
+from .venue_conditions import venue_conditions_table
+from .factor_registry import FACTOR_REGISTRY, FactorSpec, select_factors
 
 __all__ = [
     'WindAnalyzer',
@@ -45,4 +56,13 @@ __all__ = [
     'TeamOffensiveMomentumAnalyzer',
     'StatcastMetricsAnalyzer',
     'VegasOddsAnalyzer',
+    'FactorDataContext',
+    'GameLogIndex',
+    'GameContextCache',
+    'load_game_logs',
+    'read_game_logs',
+    'venue_conditions_table',
+    'FACTOR_REGISTRY',
+    'FactorSpec',
+    'select_factors',
 ]
@@ -9,21 +9,24 @@ Features:
 - Processes one date at a time to manage memory
 - Saves progress after each date
 - Skips already processed dates
-- Generates comprehensive factor analysis for all 20 factors
+- Runs the real analyzers for all 20 factors as of each date through the
+  walk-forward engine (walk_forward.py), sharing one data context per season
+- Stores each date as a factor snapshot (data/factor_snapshots/) that
+  backtest_weights.py --snapshots reads
 - Can be interrupted and resumed without data loss
 
 Usage:
     # Full backfill (2022-2024)
-    python src/scripts/backfill_factor_analysis.py
+    python src/scripts/fa/backfill_factor_analysis.py
     
     # Specific year
-    python src/scripts/backfill_factor_analysis.py --year 2023
+    python src/scripts/fa/backfill_factor_analysis.py --year 2023
     
     # Specific date range
-    python src/scripts/backfill_factor_analysis.py --start-date 2023-04-01 --end-date 2023-04-30
+    python src/scripts/fa/backfill_factor_analysis.py --start-date 2023-04-01 --end-date 2023-04-30
     
     # Resume from last checkpoint
-    python src/scripts/backfill_factor_analysis.py --resume
+    python src/scripts/fa/backfill_factor_analysis.py --resume
 """
 
 import sys
@@ -36,34 +39,13 @@ import pandas as pd
 import time
 
 # Add src to path
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 
-from scripts.fa import (
-    wind_analysis,
-    matchup_fa,
-    home_away_fa,
-    rest_day_fa,
-    injury_fa,
-    umpire_fa,
-    platoon_fa,
-    temperature_fa,
-    pitch_mix_fa,
-    park_factors_fa,
-    lineup_position_fa,
-    time_of_day_fa,
-    defensive_positions_fa,
-    recent_form_fa,
-    bullpen_fatigue_fa,
-    humidity_elevation_fa,
-    monthly_splits_fa,
-    team_momentum_fa,
-    statcast_metrics_fa,
-    vegas_odds_fa
-)
+from scripts.fa.walk_forward import WalkForwardEngine
 
 # Constants
 CHECKPOINT_FILE = "data/backfill_checkpoint.json"
-OUTPUT_DIR = Path("data/historical_factor_analysis")
+OUTPUT_DIR = Path("data/factor_snapshots")
 BATCH_SIZE = 1  # Process one date at a time
 
 
@@ -77,7 +59,7 @@ class BackfillManager:
         self.checkpoint = self._load_checkpoint()
         
         # Create output directory
-        OUTPUT_DIR.mkdir(exist_ok=True)
+        OUTPUT_DIR.mkdir(parents=True, exist_ok=True)
         
     def _load_checkpoint(self):
         """Load checkpoint from file or create new one"""
@@ -157,96 +139,35 @@ class BackfillManager:
             }
 
 
-def run_factor_analysis_for_date(target_date, data_dir):
+def run_factor_analysis_for_date(target_date, engine):
     """Run all 20 factor analyses for a specific date
     
     Args:
         target_date: Date to analyze (pd.Timestamp)
-        data_dir: Path to data directory
+        engine: WalkForwardEngine shared by every date of the backfill
         
     Returns:
-        pd.DataFrame: Combined results or None if failed
+        list: Factor keys computed (empty if the snapshot was already stored) or None if failed
     """
     date_str = target_date.strftime('%Y-%m-%d')
-    
-    # Check if output already exists (skip if so)
-    output_file = OUTPUT_DIR / f"factor_analysis_{target_date.strftime('%Y%m%d')}.csv"
-    if output_file.exists():
-        print(f"   ⏭️  Skipping {date_str} - already exists")
-        return pd.DataFrame()  # Return empty but successful
-    
     print(f"   🔄 Processing {date_str}...")
     
-    results = {}
-    
     try:
-        # Load required data files
-        roster_files = sorted(data_dir.glob('yahoo_fantasy_rosters_*.csv'))
-        if not roster_files:
-            print(f"      ⚠️  No roster file found, skipping")
-            return None
-        
-        roster_df = pd.read_csv(roster_files[-1])
-        players = roster_df['player_name'].unique().tolist()
-        
-        # Run each factor analysis
-        factors = [
-            ('vegas', vegas_odds_fa),
-            ('statcast', statcast_metrics_fa),
-            ('matchup', matchup_fa),
-            ('bullpen', bullpen_fatigue_fa),
-            ('platoon', platoon_fa),
-            ('home_away', home_away_fa),
-            ('injury', injury_fa),
-            ('park', park_factors_fa),
-            ('recent_form', recent_form_fa),
-            ('wind', wind_analysis),
-            ('rest', rest_day_fa),
-            ('temperature', temperature_fa),
-            ('lineup', lineup_position_fa),
-            ('umpire', umpire_fa),
-            ('pitch_mix', pitch_mix_fa),
-            ('time_of_day', time_of_day_fa),
-            ('humidity', humidity_elevation_fa),
-            ('defense', defensive_positions_fa),
-            ('monthly', monthly_splits_fa),
-            ('momentum', team_momentum_fa)
-        ]
-        
-        all_scores = []
-        
-        for player in players:
-            player_scores = {'player_name': player, 'date': date_str}
-            
-            for factor_name, factor_module in factors:
-                try:
-                    # Call the analyze function with date
-                    if hasattr(factor_module, 'analyze'):
-                        result = factor_module.analyze(player, data_dir, as_of_date=target_date)
-                        if isinstance(result, dict):
-                            player_scores[f'{factor_name}_score'] = result.get('score', 0)
-                        else:
-                            player_scores[f'{factor_name}_score'] = result if result else 0
-                    else:
-                        player_scores[f'{factor_name}_score'] = 0
-                except Exception as e:
-                    # Silently fail individual factors to continue processing
-                    player_scores[f'{factor_name}_score'] = 0
-            
-            all_scores.append(player_scores)
-        
-        # Combine into dataframe
-        df_results = pd.DataFrame(all_scores)
-        
-        # Save to file
-        df_results.to_csv(output_file, index=False)
-        print(f"      ✅ Saved {len(df_results)} player records")
-        
-        return df_results
-        
+        if not engine.game_dates(target_date, target_date):
+            print(f"   ⏭️  Skipping {date_str} - no games scheduled")
+            return []
+        computed = engine.snapshot(target_date)
     except Exception as e:
         print(f"      ❌ Error processing {date_str}: {str(e)}")
         return None
+    
+    if computed is None:
+        print(f"      ❌ Every factor failed for {date_str}")
+    elif computed:
+        print(f"      ✅ Saved {len(computed)} factors to {engine.store.path(target_date).name}")
+    else:
+        print(f"   ⏭️  Skipping {date_str} - already exists")
+    return computed
 
 
 def main():
@@ -304,6 +225,7 @@ def main():
     print(f"\n{'='*80}\n")
     
     data_dir = Path('data')
+    engine = WalkForwardEngine(data_dir)
     
     # Process each date
     for i, current_date in enumerate(dates_to_process, 1):
@@ -314,7 +236,7 @@ def main():
         start_time = time.time()
         
         # Run factor analysis
-        result = run_factor_analysis_for_date(current_date, data_dir)
+        result = run_factor_analysis_for_date(current_date, engine)
         
         elapsed = time.time() - start_time
         
@@ -19,12 +19,24 @@ Output:
 - Confidence level
 
 Data Source: MLB Stats API (FREE)
+
+Relief usage comes from a (team, date) table of trailing-7-day relief innings,
+earned runs and games, built with one groupby and a time-based rolling window
+and stored as bullpen_usage_<lookback>d_<season>.csv next to the game logs
+(one file per lookback window, so changing lookback_days builds a new table).
 """
 
 import pandas as pd
 from pathlib import Path
 from datetime import timedelta
 
+try:
+    from .data_context import schedule_window
+    from .game_context_cache import GameContextCache, cache_for
+except ImportError:
+    from data_context import schedule_window
+    from game_context_cache import GameContextCache, cache_for
+
 
 class BullpenFatigueAnalyzer:
     """Analyze opposing bullpen strength and fatigue levels"""
@@ -81,57 +93,152 @@ class BullpenFatigueAnalyzer:
         
         return max(-2.0, min(2.0, score))
     
-    def detect_back_to_back(self, team, game_date, games_df):
-        """Check if team played previous day"""
-        prev_day = game_date - timedelta(days=1)
+    # Relief columns the game logs need for the usage table
+    RELIEF_COLUMNS = {'team', 'game_date', 'position', 'starter', 'innings_pitched', 'earned_runs'}
+    
+    DAILY_COLUMNS = ['team', 'game_date', 'relief_innings', 'relief_earned_runs', 'relief_appearances']
+    
+    def relief_daily(self, game_logs_df):
+        """Relief innings, earned runs and appearances per (team, day), from one groupby"""
+        if len(game_logs_df) == 0 or not self.RELIEF_COLUMNS <= set(game_logs_df.columns):
+            return pd.DataFrame(columns=self.DAILY_COLUMNS)
         
-        prev_games = games_df[
-            ((games_df['home_team'] == team) | (games_df['away_team'] == team)) &
-            (games_df['game_date'] == prev_day)
+        # Relief pitchers only
+        relief = game_logs_df[
+            (game_logs_df['position'] == 'P') &
+            (game_logs_df['starter'] == False)
         ]
         
-        return len(prev_games) > 0
+        return relief.assign(
+            game_date=pd.to_datetime(relief['game_date']).dt.normalize()
+        ).groupby(['team', 'game_date'], observed=True).agg(
+            relief_innings=('innings_pitched', 'sum'),
+            relief_earned_runs=('earned_runs', 'sum'),
+            relief_appearances=('innings_pitched', 'size')
+        ).reset_index()
     
-    def get_recent_bullpen_stats(self, team, game_date, game_logs_df):
-        """Get bullpen usage stats for last 7 days"""
-        start_date = game_date - timedelta(days=self.lookback_days)
+    def bullpen_usage_table(self, daily):
+        """
+        Trailing bullpen usage per (team, date): relief innings, earned runs,
+        games with a relief appearance and appearances over the lookback_days
+        before that date (the date itself excluded)
+        """
+        columns = self.DAILY_COLUMNS + ['recent_innings', 'recent_earned_runs', 'recent_games', 'recent_appearances']
+        if len(daily) == 0:
+            return pd.DataFrame(columns=columns)
         
-        # Check if required columns exist
-        if len(game_logs_df) == 0 or 'team' not in game_logs_df.columns:
-            return None
+        # Every team on every day through lookback_days past the last game, so any date can be joined
+        days = pd.date_range(daily['game_date'].min(),
+                             daily['game_date'].max() + timedelta(days=self.lookback_days), freq='D')
+        dense = daily.set_index(['team', 'game_date']).reindex(
+            pd.MultiIndex.from_product([sorted(daily['team'].unique()), days], names=['team', 'game_date']),
+            fill_value=0
+        ).reset_index()
+        dense['relief_games'] = (dense['relief_appearances'] > 0).astype(int)
         
-        # Find all relief pitcher appearances for this team
-        recent_relief = game_logs_df[
-            (game_logs_df['team'] == team) &
-            (game_logs_df['game_date'] >= start_date) &
-            (game_logs_df['game_date'] < game_date) &
-            (game_logs_df['position'] == 'P') &
-            (game_logs_df['starter'] == False)  # Relief pitchers only
-        ]
+        recent = dense.set_index('game_date').groupby('team')[
+            ['relief_innings', 'relief_earned_runs', 'relief_games', 'relief_appearances']
+        ].rolling(f"{self.lookback_days}D", closed='left').sum().fillna(0)
+        
+        # Rounded so summation order (daily, then windowed) leaves no float noise in the innings
+        dense['recent_innings'] = recent['relief_innings'].values.round(4)
+        dense['recent_earned_runs'] = recent['relief_earned_runs'].values
+        dense['recent_games'] = recent['relief_games'].values.astype(int)
+        dense['recent_appearances'] = recent['relief_appearances'].values.astype(int)
+        return dense[columns]
+    
+    def load_bullpen_usage(self, game_logs_df, game_log_file):
+        """
+        Bullpen usage table for a game log file, stored next to it
         
-        if len(recent_relief) == 0:
-            return None
+        The file name carries lookback_days, so a table is only reused for the
+        window it was built with. It is reused until the game log file is newer. Then only
+        logs from the last stored game day on are re-aggregated, and the
+        trailing windows are recomputed.
+        """
+        usage_file = self.data_dir / game_log_file.name.replace('mlb_game_logs_',
+                                                                f'bullpen_usage_{self.lookback_days}d_')
+        
+        cached = None
+        if usage_file.exists():
+            cached = pd.read_csv(usage_file, parse_dates=['game_date'])
+            if not game_log_file.exists() or usage_file.stat().st_mtime >= game_log_file.stat().st_mtime:
+                return cached
         
-        total_innings = recent_relief['innings_pitched'].sum()
-        earned_runs = recent_relief['earned_runs'].sum()
-        games_played = recent_relief['game_date'].nunique()
+        if cached is not None and (cached['relief_appearances'] > 0).any():
+            # Keep the stored days before the last one (it may have been partial), aggregate the rest
+            cutoff = cached.loc[cached['relief_appearances'] > 0, 'game_date'].max()
+            kept = cached[(cached['game_date'] < cutoff) & (cached['relief_appearances'] > 0)][self.DAILY_COLUMNS]
+            new_logs = game_logs_df
+            if len(game_logs_df) > 0 and 'game_date' in game_logs_df.columns:
+                new_logs = game_logs_df[pd.to_datetime(game_logs_df['game_date']) >= cutoff]
+            daily = pd.concat([kept, self.relief_daily(new_logs)], ignore_index=True)
+        else:
+            daily = self.relief_daily(game_logs_df)
         
-        # Calculate bullpen ERA
-        bullpen_era = (earned_runs / total_innings * 9) if total_innings > 0 else 4.50
+        usage = self.bullpen_usage_table(daily)
+        try:
+            usage.to_csv(usage_file, index=False)
+        except OSError as e:
+            print(f"⚠️  Could not save bullpen usage table: {e}")
+        return usage
+    
+    def usage_lookup(self, usage):
+        """{(team, date): recent bullpen stats} for team-days with relief appearances in the lookback window"""
+        usage = usage[usage['recent_appearances'] > 0]
         
-        return {
-            'innings_pitched': total_innings,
-            'earned_runs': earned_runs,
-            'games_played': games_played,
-            'bullpen_era': bullpen_era
-        }
+        lookup = {}
+        for team, game_date, innings, earned_runs, games in zip(
+            usage['team'], pd.to_datetime(usage['game_date']), usage['recent_innings'].values,
+            usage['recent_earned_runs'].values, usage['recent_games'].values
+        ):
+            lookup[(team, game_date)] = {
+                'innings_pitched': innings,
+                'earned_runs': earned_runs,
+                'games_played': int(games),
+                
+                # Calculate bullpen ERA
+                'bullpen_era': (earned_runs / innings * 9) if innings > 0 else 4.50
+            }
+        return lookup
+    
+    def back_to_back_days(self, schedule_df):
+        """Set of (team, date) where the team also played the previous day"""
+        played = pd.concat([
+            pd.DataFrame({'team': schedule_df['home_team'].values, 'game_date': schedule_df['game_date'].values}),
+            pd.DataFrame({'team': schedule_df['away_team'].values, 'game_date': schedule_df['game_date'].values})
+        ]).drop_duplicates()
+        next_days = pd.to_datetime(played['game_date']) + timedelta(days=1)
+        return set(zip(played['team'], next_days))
+    
+    def bullpen_context(self, team, game_date, usage, back_to_backs):
+        """(recent bullpen stats or None, back-to-back flag) for a team on a game date"""
+        bullpen_stats = usage.get((team, game_date))
+        if bullpen_stats is None:
+            return None, False
+        return bullpen_stats, (team, game_date) in back_to_backs
     
-    def analyze(self, games_df, game_logs_df, roster_df):
+    def analyze(self, games_df, game_logs_df, roster_df, schedule_df=None, cache=None, usage=None):
         """
         Analyze bullpen fatigue for all hitters in upcoming games
         
-        For each hitter, we analyze the OPPOSING team's bullpen fatigue
+        For each hitter, we analyze the OPPOSING team's bullpen fatigue.
+        Back-to-backs are looked up in schedule_df (defaults to games_df), so
+        games_df can be a date window of the full schedule.
+        usage: bullpen usage table (see load_bullpen_usage); built from
+        game_logs_df when not given.
         """
+        if schedule_df is None:
+            schedule_df = games_df
+        if cache is None:
+            cache = GameContextCache()
+        if usage is None:
+            usage = self.bullpen_usage_table(self.relief_daily(game_logs_df))
+        
+        # Join tables: team-day bullpen usage and back-to-back days
+        usage = self.usage_lookup(usage)
+        back_to_backs = self.back_to_back_days(schedule_df)
+        
         results = []
         
         for _, game in games_df.iterrows():
@@ -152,9 +259,12 @@ class BullpenFatigueAnalyzer:
                 # Determine opposing team (whose bullpen we're analyzing)
                 opponent = away_team if player_team == home_team else home_team
                 
-                # Get opponent's recent bullpen stats
-                bullpen_stats = self.get_recent_bullpen_stats(
-                    opponent, game_date, game_logs_df
+                # Opponent's bullpen context, computed once per team-day for all its opposing hitters
+                bullpen_stats, back_to_back = cache.get(
+                    'bullpen', (opponent, game_date),
+                    lambda opponent=opponent, game_date=game_date: self.bullpen_context(
+                        opponent, game_date, usage, back_to_backs
+                    )
                 )
                 
                 if bullpen_stats is None:
@@ -173,11 +283,6 @@ class BullpenFatigueAnalyzer:
                     })
                     continue
                 
-                # Check if opponent is playing back-to-back
-                back_to_back = self.detect_back_to_back(
-                    opponent, game_date, games_df
-                )
-                
                 # Calculate fatigue score
                 fatigue_score = self.calculate_fatigue_score(
                     recent_innings=bullpen_stats['innings_pitched'],
@@ -209,7 +314,8 @@ class BullpenFatigueAnalyzer:
         
         return pd.DataFrame(results)
     
-    def analyze_roster(self, roster_df, schedule_df, players_df):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None,
+                       target_date=None, window_days=None):
         """
         Wrapper method for integration with main FA pipeline
         
@@ -217,6 +323,9 @@ class BullpenFatigueAnalyzer:
             roster_df: DataFrame of roster players
             schedule_df: DataFrame of upcoming games
             players_df: DataFrame of all players (used for game logs)
+            context: Optional FactorDataContext; its game logs are used when given
+            target_date: If given, only analyze games from this date on
+            window_days: Days of games to analyze from target_date (default 1)
         
         Returns:
             DataFrame with bullpen fatigue scores for each roster player
@@ -228,10 +337,22 @@ class BullpenFatigueAnalyzer:
         elif 'game_date' in schedule_df.columns:
             schedule_df['game_date'] = pd.to_datetime(schedule_df['game_date'])
         
-        # Use players_df as game_logs_df for now
-        # In production, this should come from actual game logs
-        return self.analyze(schedule_df, players_df, roster_df)
-        return pd.DataFrame(results)
+        # Use players_df as game_logs_df unless the shared context has real game logs
+        game_logs_df = players_df
+        usage = None
+        if context is not None and not context.game_logs.empty:
+            game_logs_df = context.game_logs
+            game_log_file = context.data_dir / f"mlb_game_logs_{context.gamelog_season}.csv"
+            usage = cache_for(context).get(
+                'bullpen_usage', (game_log_file, self.lookback_days),
+                lambda: self.load_bullpen_usage(game_logs_df, game_log_file)
+            )
+        
+        # Back-to-backs before the window still come from the full schedule
+        games_df = schedule_df
+        if target_date is not None:
+            games_df = schedule_window(schedule_df, target_date, window_days or 1)
+        return self.analyze(games_df, game_logs_df, roster_df, schedule_df, cache_for(context), usage)
 
 
 if __name__ == '__main__':
@@ -0,0 +1,146 @@
+#!/usr/bin/env python3
+"""
+Factor Data Context
+
+Shared, pre-parsed inputs for a single factor analysis run.
+
+Every analyzer used to re-read its own copy of the game logs (and in some
+cases the players file) from disk, once per analyzer and - with --all-players -
+once per 100-player batch. The context loads each source file the first time it
+is requested and hands the same in-memory DataFrame to every analyzer.
+
+Holds:
+- Schedule for the target season (raw, as the analyzers expect it)
+- Stadium weather, and the per-venue conditions table built from it (see venue_conditions.py)
+- All players and all teams reference tables
+- Player game logs per season (game_date parsed to datetime)
+- Per-player sorted game log indexes (see game_log_index.py)
+- A cache of per-team / per-venue game contexts (see game_context_cache.py)
+
+Usage:
+    context = FactorDataContext(data_dir)
+    df = analyzer.analyze_roster(roster_df, context.schedule, context=context)
+"""
+
+import pandas as pd
+from pathlib import Path
+
+try:
+    from .game_log_index import GameLogIndex
+    from .game_context_cache import GameContextCache
+    from .game_log_loader import read_game_logs
+    from .venue_conditions import venue_conditions_table
+except ImportError:
+    from game_log_index import GameLogIndex
+    from game_context_cache import GameContextCache
+    from game_log_loader import read_game_logs
+    from venue_conditions import venue_conditions_table
+
+
+def schedule_window(schedule_df, target_date, window_days=1):
+    """Games on target_date and the following window_days - 1 days"""
+    start = pd.Timestamp(target_date).normalize()
+    end = start + pd.Timedelta(days=window_days)
+    game_dates = pd.to_datetime(schedule_df['game_date'])
+    return schedule_df[(game_dates >= start) & (game_dates < end)]
+
+
+class FactorDataContext:
+    """Load-once data store shared by all factor analyzers in a run"""
+
+    # Season whose schedule is being analyzed
+    SCHEDULE_SEASON = 2025
+
+    # Season the historical (game log based) analyzers read from
+    GAMELOG_SEASON = 2024
+
+    # Inputs preload() reads when it is not told which ones a run needs
+    PRELOAD_INPUTS = ('schedule', 'weather', 'players', 'teams', 'game_logs')
+
+    def __init__(self, data_dir, schedule_season=None, gamelog_season=None):
+        self.data_dir = Path(data_dir)
+        self.schedule_season = schedule_season or self.SCHEDULE_SEASON
+        self.gamelog_season = gamelog_season or self.GAMELOG_SEASON
+
+        self._frames = {}
+        self._game_logs = {}
+        self._game_log_indexes = {}
+        self.game_cache = GameContextCache()
+
+    def _load_csv(self, key, filename, date_column=None):
+        """Read a CSV from the data directory once and cache it"""
+        if key not in self._frames:
+            df = pd.read_csv(self.data_dir / filename)
+            if date_column and date_column in df.columns:
+                df[date_column] = pd.to_datetime(df[date_column])
+            self._frames[key] = df
+        return self._frames[key]
+
+    @property
+    def schedule(self):
+        """Season schedule"""
+        return self._load_csv('schedule', f"mlb_{self.schedule_season}_schedule.csv")
+
+    @property
+    def weather(self):
+        """Latest stadium weather snapshot"""
+        return self._load_csv('weather', "mlb_stadium_weather.csv")
+
+    @property
+    def venue_conditions(self):
+        """Temperature, wind and air inputs per venue of the weather snapshot (see venue_conditions.py)"""
+        if 'venue_conditions' not in self._frames:
+            self._frames['venue_conditions'] = venue_conditions_table(self.weather)
+        return self._frames['venue_conditions']
+
+    @property
+    def players(self):
+        """All MLB players (every season)"""
+        return self._load_csv('players', "mlb_all_players_complete.csv")
+
+    @property
+    def teams(self):
+        """All MLB teams"""
+        return self._load_csv('teams', "mlb_all_teams.csv")
+
+    def get_game_logs(self, season=None):
+        """Player game logs for a season (empty DataFrame if not scraped yet)"""
+        season = season or self.gamelog_season
+
+        if season not in self._game_logs:
+            game_log_file = self.data_dir / f"mlb_game_logs_{season}.csv"
+            if game_log_file.exists():
+                df = read_game_logs(game_log_file)
+            else:
+                df = pd.DataFrame()
+            self._game_logs[season] = df
+
+        return self._game_logs[season]
+
+    @property
+    def game_logs(self):
+        """Game logs for the default history season"""
+        return self.get_game_logs()
+
+    def get_game_log_index(self, season=None):
+        """Per-player sorted GameLogIndex over a season's game logs (built once)"""
+        season = season or self.gamelog_season
+
+        if season not in self._game_log_indexes:
+            self._game_log_indexes[season] = GameLogIndex(self.get_game_logs(season))
+
+        return self._game_log_indexes[season]
+
+    @property
+    def game_log_index(self):
+        """GameLogIndex for the default history season"""
+        return self.get_game_log_index()
+
+    def preload(self, inputs=None):
+        """
+        Eagerly load shared inputs by attribute name (see factor_registry.INPUTS);
+        by default schedule, weather, players, teams and game logs
+        """
+        for name in inputs or self.PRELOAD_INPUTS:
+            getattr(self, name)
+        return self
@@ -28,9 +28,17 @@ Output:
 """
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 
+try:
+    from .stable_random import keyed_draws, keyed_uniforms
+    from .data_context import schedule_window
+    from .game_log_loader import read_game_logs
+except ImportError:
+    from stable_random import keyed_draws, keyed_uniforms
+    from data_context import schedule_window
+    from game_log_loader import read_game_logs
+
 
 class DefensivePositionsFactorAnalyzer:
     """Analyze defensive position matchups for fantasy baseball"""
@@ -39,43 +47,53 @@ class DefensivePositionsFactorAnalyzer:
         self.data_dir = Path(data_dir)
         self.team_defensive_ratings = {}
         self.position_defensive_quality = {}
+        self.shift_tendencies = {}
+        self.batter_handedness = {}
     
-    def get_team_defensive_rating(self, team):
-        """Get or generate team defensive rating"""
-        if team in self.team_defensive_ratings:
-            return self.team_defensive_ratings[team]
+    def load_synthetic_ratings(self, teams, positions, player_names):
+        """Draw every synthetic team, position, shift and handedness value needed at once"""
+        teams = [t for t in dict.fromkeys(teams) if t not in self.team_defensive_ratings]
+        # Synthetic defensive rating (0.5 = average, 0.0-1.0 range)
+        ratings = keyed_draws(teams, lambda rng: rng.normal(0.5, 0.15))
+        self.team_defensive_ratings.update({t: max(0.0, min(1.0, r)) for t, r in ratings.items()})
         
-        # Generate synthetic defensive rating (0.5 = average, 0.0-1.0 range)
-        np.random.seed(hash(team) % 2**32)
-        rating = np.random.normal(0.5, 0.15)
-        rating = max(0.0, min(1.0, rating))
-        np.random.seed(None)
+        # Synthetic position-specific quality
+        position_keys = [
+            f"{team}_{position}" for team in dict.fromkeys(self.team_defensive_ratings) for position in dict.fromkeys(positions)
+        ]
+        position_keys = [k for k in position_keys if k not in self.position_defensive_quality]
+        qualities = keyed_draws(position_keys, lambda rng: rng.normal(0.5, 0.2))
+        self.position_defensive_quality.update({k: max(0.0, min(1.0, q)) for k, q in qualities.items()})
         
-        self.team_defensive_ratings[team] = rating
-        return rating
+        # Synthetic shift tendency (0.0-1.0, higher = more shifts), skewed toward moderate shifting
+        shift_keys = [f"{team}_{hand}" for team in dict.fromkeys(self.team_defensive_ratings) for hand in ('L', 'R', 'S')]
+        shift_keys = [k for k in shift_keys if k not in self.shift_tendencies]
+        self.shift_tendencies.update(keyed_draws(shift_keys, lambda rng: rng.beta(2, 3)))
+        
+        # Batter handedness (~25% L, ~10% S, ~65% R)
+        names = [n for n in dict.fromkeys(player_names) if n not in self.batter_handedness]
+        for name, (rand,) in zip(names, keyed_uniforms(names)):
+            self.batter_handedness[name] = 'L' if rand < 0.25 else ('S' if rand < 0.35 else 'R')
+    
+    def get_team_defensive_rating(self, team):
+        """Get or generate team defensive rating"""
+        if team not in self.team_defensive_ratings:
+            self.load_synthetic_ratings([team], [], [])
+        return self.team_defensive_ratings[team]
     
     def get_position_defensive_quality(self, team, position):
         """Get defensive quality at specific position"""
         key = f"{team}_{position}"
-        if key in self.position_defensive_quality:
-            return self.position_defensive_quality[key]
-        
-        # Generate synthetic position-specific quality
-        np.random.seed(hash(key) % 2**32)
-        quality = np.random.normal(0.5, 0.2)
-        quality = max(0.0, min(1.0, quality))
-        np.random.seed(None)
-        
-        self.position_defensive_quality[key] = quality
-        return quality
+        if key not in self.position_defensive_quality:
+            self.load_synthetic_ratings([team], [position], [])
+        return self.position_defensive_quality[key]
     
     def get_shift_tendency(self, team, batter_hand):
         """Get team's shift tendency against LHB/RHB"""
-        # Generate synthetic shift tendency (0.0-1.0, higher = more shifts)
-        np.random.seed(hash(f"{team}_{batter_hand}") % 2**32)
-        shift_rate = np.random.beta(2, 3)  # Skewed toward moderate shifting
-        np.random.seed(None)
-        return shift_rate
+        key = f"{team}_{batter_hand}"
+        if key not in self.shift_tendencies:
+            self.shift_tendencies.update(keyed_draws([key], lambda rng: rng.beta(2, 3)))
+        return self.shift_tendencies[key]
     
     def calculate_defensive_impact(self, position, opponent_team, batter_hand, 
                                    team_def_rating, pos_def_quality, shift_tendency):
@@ -116,16 +134,19 @@ class DefensivePositionsFactorAnalyzer:
     
     def get_batter_handedness(self, player_name):
         """Get batter handedness"""
-        np.random.seed(hash(player_name) % 2**32)
-        rand = np.random.random()
-        bats = 'L' if rand < 0.25 else ('S' if rand < 0.35 else 'R')
-        np.random.seed(None)
-        return bats
+        if player_name not in self.batter_handedness:
+            self.load_synthetic_ratings([], [], [player_name])
+        return self.batter_handedness[player_name]
     
     def analyze(self, games_df, game_logs_df, roster_df):
         """Analyze defensive position matchups"""
         results = []
         
+        # Draw all synthetic ratings for the opponents and roster up front
+        opponents = games_df['opponent'] if 'opponent' in games_df.columns else ['UNK'] * len(games_df)
+        positions = roster_df['position'] if 'position' in roster_df.columns else ['OF']
+        self.load_synthetic_ratings(opponents, positions, roster_df['player_name'])
+        
         for _, game in games_df.iterrows():
             game_date = game['game_date']
             opponent = game.get('opponent', 'UNK')
@@ -194,12 +215,17 @@ class DefensivePositionsFactorAnalyzer:
         
         return pd.DataFrame(results)
     
-    def analyze_roster(self, roster_df, schedule_df, teams_df):
+    def analyze_roster(self, roster_df, schedule_df, teams_df=None, context=None,
+                       target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
         # Load game logs
         game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            game_logs_df = pd.read_csv(game_logs_file)
+        if context is not None:
+            game_logs_df = context.game_logs
+        elif game_logs_file.exists():
+            game_logs_df = read_game_logs(game_logs_file)
         else:
             game_logs_df = pd.DataFrame()
         return self.analyze(schedule_df, game_logs_df, roster_df)
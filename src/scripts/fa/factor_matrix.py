@@ -0,0 +1,187 @@
+#!/usr/bin/env python3
+"""
+Factor Matrix
+
+One wide player x factor score matrix per factor analysis run.
+
+Each analyzer still writes its own <factor>_analysis_<suffix>_<timestamp>.csv
+with all of its detail columns. Alongside those, run_all_fa saves a single
+matrix holding just the score of every factor, one row per (player, game date),
+so consumers can load one file with a fixed schema instead of globbing and
+merging twenty CSVs.
+
+Files (same suffix/timestamp as the run's CSVs):
+- factor_matrix_<suffix>_<timestamp>.npz
+    scores       float64 [rows x factors], NaN where a factor has no score
+    factors      factor keys, column order of `scores` (e.g. 'wind', 'park')
+    player_id    float64 [rows], NaN when the player could not be resolved
+    player_name  str [rows]
+    game_date    str [rows], 'YYYY-MM-DD', '' for player-level rows
+- factor_matrix_<suffix>_<timestamp>.json
+    run manifest: as_of_date, mode, factors, score column and source CSV per factor
+
+Factors without a game_date column (recent form, statcast, ...) are player
+level: their score is repeated on every game row of that player.
+
+Usage:
+    df = load_factor_matrix(latest_factor_matrix(data_dir, 'roster'))
+"""
+
+import json
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+
+# Score column lookup order (first match wins), then any other *_score column
+SCORE_COLUMNS = [
+    'score', 'final_score', 'advantage_score', 'impact_score',
+    'platoon_score', 'temp_score', 'pitch_mix_score', 'park_score',
+    'lineup_score', 'time_score', 'defense_score', 'form_score',
+    'bullpen_score', 'humidity_score', 'monthly_score', 'momentum_score',
+    'statcast_score', 'vegas_score', 'wind_score', 'umpire_score'
+]
+
+
+def find_score_column(df):
+    """Name of the column holding a factor's score, or None"""
+    for col in SCORE_COLUMNS:
+        if col in df.columns:
+            return col
+    for col in df.columns:
+        if col.endswith('_score'):
+            return col
+    return None
+
+
+def factor_scores(df, score_column=None):
+    """
+    Narrow a factor's output to its scores: player_name, game_date ('' if
+    player level), score. Keeps the first row per (player, date).
+    score_column is the factor's declared score column (see factor_registry);
+    if it is missing from df the column is looked up by name.
+    Returns (scores_df, score_column); scores_df is None if there is no score.
+    """
+    score_col = score_column if score_column in df.columns else find_score_column(df)
+    if score_col is None or 'player_name' not in df.columns:
+        return None, score_col
+
+    if 'game_date' in df.columns:
+        game_date = pd.to_datetime(df['game_date'], errors='coerce').dt.strftime('%Y-%m-%d').fillna('')
+    else:
+        game_date = ''
+
+    scores = pd.DataFrame({
+        'player_name': df['player_name'].values,
+        'game_date': game_date,
+        'score': pd.to_numeric(df[score_col], errors='coerce').values,
+    })
+    return scores.drop_duplicates(['player_name', 'game_date']), score_col
+
+
+def build_factor_matrix(factor_scores_by_key, roster_df, players_df=None):
+    """
+    Combine narrowed factor scores into one wide frame
+
+    Args:
+        factor_scores_by_key: {factor key: scores_df from factor_scores}
+        roster_df: Analyzed players (player_name, optional player_id)
+        players_df: All players reference table, used to fill missing player_ids
+
+    Returns:
+        DataFrame [player_id, player_name, game_date, <factor>...] sorted by
+        roster order then date
+    """
+    factors = list(factor_scores_by_key)
+    names = list(dict.fromkeys(roster_df['player_name']))
+
+    # Row keys: every (player, date) any per-game factor produced, else one player-level row
+    dated = [s[s['game_date'] != ''] for s in factor_scores_by_key.values()]
+    keys = pd.concat(
+        [d[['player_name', 'game_date']] for d in dated] +
+        [pd.DataFrame({'player_name': names, 'game_date': ''})],
+        ignore_index=True
+    ).drop_duplicates()
+    has_dates = keys[keys['game_date'] != '']['player_name'].unique()
+    keys = keys[(keys['game_date'] != '') | ~keys['player_name'].isin(has_dates)]
+
+    matrix = keys.reset_index(drop=True)
+    for key in factors:
+        scores = factor_scores_by_key[key]
+        per_game = scores[scores['game_date'] != '']
+        per_player = scores[scores['game_date'] == ''].drop_duplicates('player_name')
+
+        col = pd.Series(np.nan, index=matrix.index)
+        if len(per_game):
+            merged = matrix.merge(per_game, on=['player_name', 'game_date'], how='left')
+            col = col.fillna(merged['score'])
+        if len(per_player):
+            merged = matrix[['player_name']].merge(per_player[['player_name', 'score']], on='player_name', how='left')
+            col = col.fillna(merged['score'])
+        matrix[key] = col.values
+
+    # Resolve player ids: roster first, then the all-players table (latest season wins)
+    id_lookup = {}
+    if players_df is not None and {'player_name', 'player_id'} <= set(players_df.columns):
+        ordered = players_df.sort_values('season') if 'season' in players_df.columns else players_df
+        id_lookup.update(zip(ordered['player_name'], ordered['player_id']))
+    if 'player_id' in roster_df.columns:
+        id_lookup.update((n, i) for n, i in zip(roster_df['player_name'], roster_df['player_id']) if pd.notna(i))
+    matrix.insert(0, 'player_id', pd.to_numeric(matrix['player_name'].map(id_lookup), errors='coerce'))
+
+    # Roster order, then date
+    order = {name: i for i, name in enumerate(names)}
+    matrix['_order'] = matrix['player_name'].map(order).fillna(len(order))
+    matrix = matrix.sort_values(['_order', 'game_date'], kind='stable').drop(columns='_order')
+    return matrix.reset_index(drop=True)
+
+
+def save_factor_matrix(matrix, data_dir, file_suffix, timestamp, manifest):
+    """Write the .npz matrix and its .json manifest; returns the .npz path"""
+    data_dir = Path(data_dir)
+    factors = [c for c in matrix.columns if c not in ('player_id', 'player_name', 'game_date')]
+
+    output_file = data_dir / f"factor_matrix_{file_suffix}_{timestamp}.npz"
+    np.savez_compressed(
+        output_file,
+        scores=matrix[factors].to_numpy(dtype=float),
+        factors=np.array(factors, dtype=str),
+        player_id=matrix['player_id'].to_numpy(dtype=float),
+        player_name=matrix['player_name'].astype(str).to_numpy(dtype=str),
+        game_date=matrix['game_date'].astype(str).to_numpy(dtype=str),
+    )
+
+    manifest = dict(manifest)
+    manifest.update({
+        'matrix_file': output_file.name,
+        'rows': len(matrix),
+        'players': int(matrix['player_name'].nunique()),
+        'factors': factors,
+    })
+    with open(output_file.with_suffix('.json'), 'w') as f:
+        json.dump(manifest, f, indent=2, default=str)
+
+    return output_file
+
+
+def load_factor_matrix(path):
+    """Load a saved factor matrix as a DataFrame [player_id, player_name, game_date, <factor>...]"""
+    with np.load(path) as data:
+        df = pd.DataFrame(data['scores'], columns=list(data['factors']))
+        df.insert(0, 'game_date', data['game_date'])
+        df.insert(0, 'player_name', data['player_name'])
+        df.insert(0, 'player_id', data['player_id'])
+    return df
+
+
+def load_factor_manifest(path):
+    """Load the run manifest saved next to a factor matrix"""
+    with open(Path(path).with_suffix('.json')) as f:
+        return json.load(f)
+
+
+def latest_factor_matrix(data_dir, file_suffix='roster'):
+    """Most recent factor matrix for a run mode ('roster' or 'all_players'), or None"""
+    files = sorted(Path(data_dir).glob(f"factor_matrix_{file_suffix}_*.npz"),
+                   key=lambda x: x.stat().st_mtime, reverse=True)
+    return files[0] if files else None
@@ -0,0 +1,171 @@
+#!/usr/bin/env python3
+"""
+Factor Output Writer
+
+Streaming CSV sink for one factor's output.
+
+With --all-players a factor's output covers every player x every scheduled game.
+run_all_fa used to keep every 100-player batch in memory, concatenate them and
+write one CSV at the end, so peak memory grew with the whole run and a crash
+lost every batch. The writer appends each batch to the CSV as it finishes and
+keeps nothing in memory but the header. The narrowed scores (player, date,
+score) for the factor matrix are read back from the finished CSV in chunks,
+loading only those three columns.
+
+The file is written as <name>.csv.partial and renamed to <name>.csv when the
+factor completes, so readers globbing *.csv never pick up a half-written
+factor, while a crashed run leaves its finished batches on disk.
+
+With checkpoint=True the writer also records, after every batch, how many
+batches are done and how long the partial file is (<name>.csv.checkpoint).
+FactorOutputWriter.resume() reopens an interrupted factor from that record:
+rows of a batch that was being written when the run died are cut off and
+the caller continues at batch `writer.batches`.
+
+Batches are expected to share columns. If a later batch brings new columns, the
+rows written so far are copied chunk by chunk (as text, unchanged) into a file
+with the wider header (the same column union pd.concat would produce).
+
+Usage:
+    writer = FactorOutputWriter(data_dir / "wind_analysis_roster_<timestamp>.csv", 'wind_score')
+    for batch in batches:
+        writer.append(analyzer.analyze_roster(batch, schedule))
+    output_file = writer.close()
+    scores_df, score_column = writer.scores()    # read back from output_file
+
+    writer = FactorOutputWriter.resume(output_file, 'wind_score')   # after a crash
+    for batch in batches[writer.batches:]:
+        ...
+"""
+
+import json
+import pandas as pd
+from pathlib import Path
+
+try:
+    from .factor_matrix import factor_scores, find_score_column
+except ImportError:
+    from factor_matrix import factor_scores, find_score_column
+
+
+# Rows per chunk when reading a factor's CSV back (scores, widening)
+READ_CHUNK_ROWS = 100_000
+
+
+class FactorOutputWriter:
+    """Append-only CSV writer for one factor, batch by batch"""
+
+    def __init__(self, path, score_column=None, checkpoint=False):
+        self.path = Path(path)
+        self.partial_path = self.path.with_name(self.path.name + '.partial')
+        self.checkpoint_path = self.path.with_name(self.path.name + '.checkpoint')
+        self.score_column = score_column
+        self.checkpoint = checkpoint
+        self.columns = None
+        self.rows = 0
+        self.batches = 0
+
+    @classmethod
+    def resume(cls, path, score_column=None):
+        """Checkpointing writer that continues an interrupted factor (or starts it, if there is no checkpoint)"""
+        writer = cls(path, score_column, checkpoint=True)
+        if not writer.checkpoint_path.exists():
+            return writer
+
+        with open(writer.checkpoint_path) as f:
+            state = json.load(f)
+        if state['columns'] is not None:
+            if not writer.partial_path.exists():
+                return writer
+            # Drop anything written after the last checkpoint (a batch cut short by the crash)
+            with open(writer.partial_path, 'r+b') as f:
+                f.truncate(state['bytes'])
+
+        writer.columns = state['columns']
+        writer.rows = state['rows']
+        writer.batches = state['batches']
+        return writer
+
+    def append(self, df):
+        """Write one batch's rows"""
+        self._write(df)
+        self.batches += 1
+        if self.checkpoint:
+            self._save_checkpoint()
+
+    def _write(self, df):
+        if not len(df.columns):
+            return
+
+        if self.columns is None:
+            self.columns = list(df.columns)
+            df.to_csv(self.partial_path, index=False)
+        else:
+            new_columns = [c for c in df.columns if c not in self.columns]
+            if new_columns:
+                self._widen(new_columns)
+            df.reindex(columns=self.columns).to_csv(self.partial_path, mode='a', header=False, index=False)
+        self.rows += len(df)
+
+    def _widen(self, new_columns):
+        """Rewrite the rows written so far with the extra columns appended (empty), chunk by chunk"""
+        self.columns = self.columns + new_columns
+        widened_path = self.partial_path.with_name(self.partial_path.name + '.widen')
+
+        # Read as text so the existing values are copied exactly as written
+        pd.DataFrame(columns=self.columns).to_csv(widened_path, index=False)
+        for chunk in pd.read_csv(self.partial_path, chunksize=READ_CHUNK_ROWS, dtype=str, keep_default_na=False):
+            chunk.reindex(columns=self.columns).to_csv(widened_path, mode='a', header=False, index=False)
+        widened_path.replace(self.partial_path)
+
+    def _save_checkpoint(self):
+        """Record the finished batches; written to a temp file and renamed so it is never half-written"""
+        state = {
+            'batches': self.batches,
+            'rows': self.rows,
+            'columns': self.columns,
+            'bytes': self.partial_path.stat().st_size if self.columns is not None else 0,
+        }
+        tmp_path = self.checkpoint_path.with_name(self.checkpoint_path.name + '.tmp')
+        with open(tmp_path, 'w') as f:
+            json.dump(state, f)
+        tmp_path.replace(self.checkpoint_path)
+
+    def close(self):
+        """Move the finished file into place; returns its path"""
+        if self.columns is None:
+            pd.DataFrame().to_csv(self.partial_path, index=False)
+        self.partial_path.replace(self.path)
+        if self.checkpoint_path.exists():
+            self.checkpoint_path.unlink()
+        return self.path
+
+    def scores(self):
+        """(scores_df, score column) over every batch, read back from the closed file (see read_factor_scores)"""
+        return read_factor_scores(self.path, self.score_column)
+
+
+def read_factor_scores(path, score_column=None):
+    """
+    (scores_df, score column) of a finished factor CSV, as factor_matrix.factor_scores returns
+
+    Only player_name, game_date and the score column are read, in chunks.
+    Floats are parsed round-trip exact, so the scores equal the values the
+    analyzer produced.
+    """
+    path = Path(path)
+    if path.stat().st_size <= 1:  # empty output: pd.DataFrame().to_csv writes just a newline
+        return None, None
+
+    header = pd.read_csv(path, nrows=0)
+    score_col = score_column if score_column in header.columns else find_score_column(header)
+    if score_col is None or 'player_name' not in header.columns:
+        return None, score_col
+
+    usecols = [col for col in ('player_name', 'game_date', score_col) if col in header.columns]
+    chunks = pd.read_csv(path, usecols=usecols, chunksize=READ_CHUNK_ROWS, float_precision='round_trip')
+    frames = [factor_scores(chunk, score_col)[0] for chunk in chunks]
+    if not frames:
+        return None, score_col
+    scores = pd.concat(frames, ignore_index=True)
+    return scores.drop_duplicates(['player_name', 'game_date']), score_col
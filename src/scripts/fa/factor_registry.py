@@ -0,0 +1,184 @@
+#!/usr/bin/env python3
+"""
+Factor Registry
+
+One declaration per factor analysis: its key, label, analyzer class, output
+file prefix, score column, and the shared inputs it reads.
+
+run_all_fa, the waiver batch scripts and anything else that runs "every factor"
+iterate this registry instead of keeping their own copy of the list. Because
+each factor declares its inputs, a run of a few factors (--factors wind,park)
+only loads the data those factors need.
+
+Inputs are FactorDataContext attributes and can depend on each other
+(game_log_index is built from game_logs); required_inputs() lists them in
+load order. Factors are independent of each other and run in registry order
+(or all at once on a process pool).
+
+Usage:
+    specs = select_factors(['wind', 'park'])
+    context.preload(required_inputs(specs))
+    for spec in specs:
+        analyzer = spec.create(data_dir)
+        df = analyzer.analyze_roster(roster_df, *spec.roster_args(context), **spec.roster_kwargs(context, as_of_date))
+"""
+
+import importlib
+
+
+# Shared inputs (FactorDataContext attributes) and the inputs each one is built from
+INPUTS = {
+    'schedule': (),
+    'weather': (),
+    'venue_conditions': ('weather',),
+    'players': (),
+    'teams': (),
+    'game_logs': (),
+    'game_log_index': ('game_logs',),
+}
+
+
+class FactorSpec:
+    """Declaration of one factor analysis"""
+
+    def __init__(self, key, label, module, class_name, output_prefix, score_column,
+                 inputs, arg_input=None, date_kwarg=None, windowed=False):
+        """
+        Args:
+            key: Short name used in results, the factor matrix and --factors
+            label: Display name
+            module, class_name: Where the analyzer class lives (module name in this
+                package, imported on first use so specs stay picklable)
+            output_prefix: CSV name prefix (<prefix>_<suffix>_<timestamp>.csv)
+            score_column: Column of the analyzer's output holding the factor score
+            inputs: Shared inputs the analyzer reads (keys of INPUTS)
+            arg_input: Input passed positionally after the schedule, if any
+            date_kwarg: Keyword the analyzer takes the analysis date as, if any
+            windowed: Scores the schedule game by game, so --window-days applies
+        """
+        self.key = key
+        self.label = label
+        self.module = module
+        self.class_name = class_name
+        self.output_prefix = output_prefix
+        self.score_column = score_column
+        self.inputs = tuple(inputs)
+        self.arg_input = arg_input
+        self.date_kwarg = date_kwarg
+        self.windowed = windowed
+
+    def __repr__(self):
+        return f"FactorSpec({self.key!r})"
+
+    @property
+    def analyzer_class(self):
+        if __package__:
+            module = importlib.import_module(f"{__package__}.{self.module}")
+        else:
+            module = importlib.import_module(self.module)
+        return getattr(module, self.class_name)
+
+    def create(self, data_dir):
+        """New analyzer instance"""
+        return self.analyzer_class(data_dir)
+
+    def roster_args(self, context, schedule=None):
+        """Positional arguments of analyze_roster after the roster: schedule [, arg_input]"""
+        args = [context.schedule if schedule is None else schedule]
+        if self.arg_input:
+            args.append(getattr(context, self.arg_input))
+        return args
+
+    def roster_kwargs(self, context, as_of_date, window_days=None):
+        """Keyword arguments of analyze_roster: context, analysis date, --window-days"""
+        kwargs = {'context': context}
+        if self.date_kwarg:
+            kwargs[self.date_kwarg] = as_of_date
+        if window_days and self.windowed:
+            kwargs[self.date_kwarg or 'target_date'] = as_of_date
+            kwargs['window_days'] = window_days
+        return kwargs
+
+
+GAME_LOG_HISTORY = ('game_logs', 'game_log_index')
+
+FACTOR_REGISTRY = [
+    FactorSpec('wind', 'Wind Analysis', 'wind_analysis', 'WindAnalyzer', 'wind_analysis', 'wind_score',
+               inputs=('schedule', 'weather', 'venue_conditions'), arg_input='weather', windowed=True),
+    FactorSpec('matchup', 'Historical Matchup Analysis', 'matchup_fa', 'MatchupFactorAnalyzer', 'matchup_analysis', 'matchup_score',
+               inputs=('schedule', 'players') + GAME_LOG_HISTORY, arg_input='players', windowed=True),
+    FactorSpec('home_away', 'Home/Away Venue Analysis', 'home_away_fa', 'HomeAwayFactorAnalyzer', 'home_away_analysis', 'venue_score',
+               inputs=('schedule', 'players') + GAME_LOG_HISTORY, arg_input='players', windowed=True),
+    FactorSpec('rest', 'Rest Day Impact Analysis', 'rest_day_fa', 'RestDayFactorAnalyzer', 'rest_day_analysis', 'rest_score',
+               inputs=('schedule',) + GAME_LOG_HISTORY, windowed=True),
+    FactorSpec('injury', 'Injury/Recovery Analysis', 'injury_fa', 'InjuryFactorAnalyzer', 'injury_analysis', 'injury_score',
+               inputs=('schedule', 'players') + GAME_LOG_HISTORY, arg_input='players', windowed=True),
+    FactorSpec('umpire', 'Umpire Strike Zone Analysis', 'umpire_fa', 'UmpireFactorAnalyzer', 'umpire_analysis', 'umpire_score',
+               inputs=('schedule',), windowed=True),
+    FactorSpec('platoon', 'Platoon Advantage Analysis', 'platoon_fa', 'PlatoonFactorAnalyzer', 'platoon_analysis', 'platoon_score',
+               inputs=('schedule', 'players', 'game_logs'), arg_input='players', windowed=True),
+    FactorSpec('temperature', 'Temperature Analysis', 'temperature_fa', 'TemperatureAnalyzer', 'temperature_analysis', 'temp_score',
+               inputs=('schedule', 'weather', 'venue_conditions'), arg_input='weather', windowed=True),
+    FactorSpec('pitch_mix', 'Pitch Mix Analysis', 'pitch_mix_fa', 'PitchMixAnalyzer', 'pitch_mix_analysis', 'pitch_mix_score',
+               inputs=('schedule', 'players'), arg_input='players', windowed=True),
+    FactorSpec('park', 'Park Factors Analysis', 'park_factors_fa', 'ParkFactorsAnalyzer', 'park_factors_analysis', 'score',
+               inputs=('schedule', 'teams'), arg_input='teams', windowed=True),
+    FactorSpec('lineup', 'Lineup Position Analysis', 'lineup_position_fa', 'LineupPositionAnalyzer', 'lineup_position_analysis', 'lineup_score',
+               inputs=('schedule', 'players'), windowed=True),
+    FactorSpec('time', 'Time of Day Analysis', 'time_of_day_fa', 'TimeOfDayAnalyzer', 'time_of_day_analysis', 'time_advantage_score',
+               inputs=('schedule', 'players'), arg_input='players', windowed=True),
+    FactorSpec('defense', 'Defensive Positions Analysis', 'defensive_positions_fa', 'DefensivePositionsFactorAnalyzer', 'defensive_positions_analysis', 'score',
+               inputs=('schedule', 'teams', 'game_logs'), arg_input='teams', windowed=True),
+    FactorSpec('recent_form', 'Recent Form / Streaks Analysis', 'recent_form_fa', 'RecentFormAnalyzer', 'recent_form_analysis', 'form_score',
+               inputs=('schedule', 'players') + GAME_LOG_HISTORY, arg_input='players', date_kwarg='target_date'),
+    FactorSpec('bullpen', 'Bullpen Fatigue Detection', 'bullpen_fatigue_fa', 'BullpenFatigueAnalyzer', 'bullpen_fatigue_analysis', 'score',
+               inputs=('schedule', 'players', 'game_logs'), arg_input='players', windowed=True),
+    FactorSpec('humidity', 'Humidity & Elevation Analysis', 'humidity_elevation_fa', 'HumidityElevationAnalyzer', 'humidity_elevation_analysis', 'humidity_score',
+               inputs=('schedule', 'weather', 'venue_conditions'), arg_input='weather', windowed=True),
+    FactorSpec('monthly', 'Monthly Splits Analysis', 'monthly_splits_fa', 'MonthlySplitsAnalyzer', 'monthly_splits_analysis', 'month_score',
+               inputs=('schedule', 'players', 'game_logs'), arg_input='players'),
+    FactorSpec('momentum', 'Team Momentum Analysis', 'team_momentum_fa', 'TeamOffensiveMomentumAnalyzer', 'team_momentum_analysis', 'momentum_score',
+               inputs=('schedule', 'teams'), arg_input='teams'),
+    FactorSpec('statcast', 'Statcast Metrics Analysis', 'statcast_metrics_fa', 'StatcastMetricsAnalyzer', 'statcast_metrics_analysis', 'score',
+               inputs=('schedule', 'players', 'game_logs'), arg_input='players', date_kwarg='as_of_date'),
+    FactorSpec('vegas', 'Vegas Odds Analysis', 'vegas_odds_fa', 'VegasOddsAnalyzer', 'vegas_odds_analysis', 'score',
+               inputs=('schedule', 'players'), arg_input='players', date_kwarg='as_of_date', windowed=True),
+]
+
+FACTORS_BY_KEY = {spec.key: spec for spec in FACTOR_REGISTRY}
+
+
+def get_factor(key):
+    """FactorSpec for a key; raises ValueError for unknown keys"""
+    if key not in FACTORS_BY_KEY:
+        raise ValueError(f"Unknown factor '{key}' (known: {', '.join(FACTORS_BY_KEY)})")
+    return FACTORS_BY_KEY[key]
+
+
+def select_factors(keys=None):
+    """
+    FactorSpecs for the given keys (a list or a 'wind,park' string), in
+    registry order; None selects every factor. Raises ValueError for unknown keys.
+    """
+    if keys is None:
+        return list(FACTOR_REGISTRY)
+    if isinstance(keys, str):
+        keys = [k.strip() for k in keys.split(',') if k.strip()]
+    selected = {get_factor(key).key for key in keys}
+    return [spec for spec in FACTOR_REGISTRY if spec.key in selected]
+
+
+def required_inputs(specs):
+    """Inputs the factors need, including the inputs those are built from, in load order"""
+    ordered = []
+
+    def add(name):
+        if name not in ordered:
+            for dep in INPUTS[name]:
+                add(dep)
+            ordered.append(name)
+
+    for spec in specs:
+        for name in spec.inputs:
+            add(name)
+    return ordered
@@ -0,0 +1,64 @@
+#!/usr/bin/env python3
+"""
+Game Context Cache
+
+Memo table for game contexts that depend only on the team, venue and date.
+
+Park factors, humidity/elevation, umpire, bullpen fatigue and team
+momentum scores are the same for every player in a game, but the analyzers used
+to recompute them inside the per-player loop (and again for every 100-player
+batch in --all-players mode). Each analyzer now asks the cache for the context
+of a (kind, key) - e.g. ('bullpen', (team, date)) - computes it on the first
+request, and broadcasts it to the game's players.
+
+The cache lives on the run's FactorDataContext, so it is shared by every batch
+of an analyzer. Hits and misses are counted per kind for the run summary.
+
+Usage:
+    cache = cache_for(context)
+    park = cache.get('park', home_team, lambda: self.park_context(home_team))
+    print(format_cache_stats(cache.counts))
+"""
+
+from collections import Counter
+
+
+class GameContextCache:
+    """Per-run memo of team/venue/day contexts with hit and miss counters"""
+
+    def __init__(self):
+        self._values = {}
+        self.counts = Counter()
+
+    def get(self, kind, key, compute):
+        """Value for (kind, key); compute() is called only on the first request"""
+        values = self._values.setdefault(kind, {})
+        if key in values:
+            self.counts[(kind, 'hits')] += 1
+            return values[key]
+
+        self.counts[(kind, 'misses')] += 1
+        value = values[key] = compute()
+        return value
+
+    def snapshot(self):
+        """Copy of the counters, to measure one analyzer's hits/misses by difference"""
+        return Counter(self.counts)
+
+
+def cache_for(context):
+    """The run's shared cache, or a fresh one when an analyzer runs standalone"""
+    if context is not None:
+        return context.game_cache
+    return GameContextCache()
+
+
+def format_cache_stats(counts):
+    """One line per kind: 'kind: N hits / M misses (P% hit rate)'"""
+    lines = []
+    for kind in sorted({kind for kind, _ in counts}):
+        hits = counts[(kind, 'hits')]
+        misses = counts[(kind, 'misses')]
+        rate = hits / (hits + misses) if hits + misses else 0.0
+        lines.append(f"{kind}: {hits} hits / {misses} misses ({rate:.0%} hit rate)")
+    return lines
@@ -0,0 +1,205 @@
+#!/usr/bin/env python3
+"""
+Game Log Index
+
+Per-player, date-sorted view of the game logs for fast window queries.
+
+Filtering the full game log DataFrame by player name costs O(total logs) per
+player. The index sorts the logs once by (player, date), records where each
+player's block starts and ends, and keeps a running prefix sum per stat column
+(and per stat within each split, e.g. home games). A date window for one player
+is then two binary searches, and any stat total over that window is a single
+subtraction.
+
+Point-in-time queries ("stats before date D") take an array of dates, so one
+player's as-of totals for every game on the schedule are a single searchsorted.
+
+Usage:
+    index = GameLogIndex(game_logs_df)
+    start, end = index.window('Aaron Judge', cutoff_date, as_of_date)
+    totals = index.totals(start, end)      # {'AB': 25, 'H': 9, ...}
+    games = index.rows(start, end)         # DataFrame slice, oldest first
+
+    start, ends = index.before('Aaron Judge', game_dates)   # ends: one per date
+    totals = index.totals(start, ends)                       # {'AB': array, ...}
+    home = index.totals(start, ends, split='is_home')        # home games only
+    home_games = index.games(start, ends, split='is_home')
+
+    table = index.as_of_totals(roster_names, game_dates)    # {'games': [dates x players], 'AB': ...}
+
+    last = index.as_of_last_dates(roster_names, game_dates) # last game before each date
+    rested = index.as_of_totals(roster_names, game_dates, split='rested')   # games on 2+ days of rest
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# Nanoseconds per day (self.dates are int64 nanoseconds)
+DAY_NS = 86_400 * 10**9
+
+
+class GameLogIndex:
+    """Game logs grouped by player and sorted by date, with per-stat prefix sums"""
+
+    STAT_COLUMNS = ['AB', 'H', 'BB', 'HBP', 'SF', '1B', '2B', '3B', 'HR', 'RBI', 'R', 'SB', 'SO']
+    
+    # Boolean columns that get their own prefix sums (split stats)
+    SPLIT_COLUMNS = ['is_home']
+    
+    # Split derived from the sorted dates, built on first use: games played
+    # REST_DAYS or more days after the player's previous game
+    REST_SPLIT = 'rested'
+    REST_DAYS = 2
+
+    def __init__(self, game_logs_df, key='player_name'):
+        self.key = key
+
+        if game_logs_df.empty:
+            game_logs_df = pd.DataFrame(columns=[key, 'game_date'])
+
+        df = game_logs_df.copy()
+        df['game_date'] = pd.to_datetime(df['game_date'])
+        df = df.sort_values([key, 'game_date'], kind='mergesort').reset_index(drop=True)
+        self.df = df
+
+        # Sorted dates as int64 nanoseconds for np.searchsorted
+        self.dates = df['game_date'].values.astype('datetime64[ns]').astype(np.int64)
+
+        # Contiguous block per player: key -> (start, end)
+        keys = df[key].values
+        if len(keys):
+            boundaries = np.flatnonzero(keys[1:] != keys[:-1]) + 1
+            starts = np.concatenate(([0], boundaries))
+            ends = np.concatenate((boundaries, [len(keys)]))
+            self.blocks = {keys[s]: (int(s), int(e)) for s, e in zip(starts, ends)}
+        else:
+            self.blocks = {}
+
+        # Prefix sums with a leading zero: sum over rows [i, j) = prefix[j] - prefix[i]
+        self.columns = [c for c in self.STAT_COLUMNS if c in df.columns]
+        self.prefix = {col: self._prefix_sum(self._stat_values(df[col])) for col in self.columns}
+        
+        # Same per split: stat sums and game counts over the rows where the split is True
+        self.split_prefix = {}
+        for split in self.SPLIT_COLUMNS:
+            if split in df.columns and pd.api.types.is_bool_dtype(df[split]):
+                self._add_split(split, df[split].values)
+    
+    def _add_split(self, name, mask):
+        """Prefix sums over the rows where mask (one bool per sorted row) is True, queried as split=name"""
+        prefix = {col: self._prefix_sum(np.where(mask, self._stat_values(self.df[col]), 0)) for col in self.columns}
+        prefix['games'] = self._prefix_sum(np.asarray(mask).astype(np.int64))
+        self.split_prefix[name] = prefix
+    
+    def days_rest(self):
+        """Whole days since the player's previous game, one per sorted row (0 for a player's first game)"""
+        days = np.zeros(len(self.dates), dtype=np.int64)
+        days[1:] = np.diff(self.dates) // DAY_NS
+        days[[start for start, _ in self.blocks.values()]] = 0
+        return days
+    
+    @staticmethod
+    def _stat_values(column):
+        """Stat column as int64 if it is integral (so totals keep the column's type), else float"""
+        if pd.api.types.is_integer_dtype(column):
+            return column.values.astype(np.int64)
+        return column.fillna(0).values.astype(float)
+    
+    @staticmethod
+    def _prefix_sum(values):
+        return np.concatenate(([values.dtype.type(0)], np.cumsum(values)))
+
+    def __contains__(self, player):
+        return player in self.blocks
+
+    def player_block(self, player):
+        """(start, end) row range of a player's games, or (0, 0) if unknown"""
+        return self.blocks.get(player, (0, 0))
+
+    def window(self, player, start_date=None, end_date=None):
+        """Row range of a player's games with start_date <= game_date < end_date"""
+        start, end = self.player_block(player)
+        dates = self.dates[start:end]
+
+        lo = start
+        hi = end
+        if start_date is not None:
+            lo = start + int(np.searchsorted(dates, pd.Timestamp(start_date).value, side='left'))
+        if end_date is not None:
+            hi = start + int(np.searchsorted(dates, pd.Timestamp(end_date).value, side='left'))
+        return lo, max(lo, hi)
+
+    def before(self, player, dates):
+        """
+        Point-in-time row ranges: (start, ends) where [start, ends[i]) are the
+        player's games strictly before dates[i]. dates is an array-like of dates.
+        """
+        start, end = self.player_block(player)
+        dates = self._date_values(dates)
+        return start, start + np.searchsorted(self.dates[start:end], dates, side='left')
+
+    def as_of_totals(self, players, dates, split=None):
+        """
+        Games played and stat totals before each date, for every (date, player) pair
+        
+        Returns {'games': ..., 'AB': ..., ...}, each an array of shape
+        (len(dates), len(players)). With split (e.g. 'is_home') only the games
+        where that column is True are counted.
+        """
+        dates = self._date_values(dates)
+        columns = ['games'] + self.columns
+        by_player = {col: [] for col in columns}
+        
+        for player in players:
+            start, end = self.player_block(player)
+            ends = start + np.searchsorted(self.dates[start:end], dates, side='left')
+            by_player['games'].append(self.games(start, ends, split))
+            for col, total in self.totals(start, ends, split).items():
+                by_player[col].append(total)
+        
+        return {
+            col: np.column_stack(arrays) if arrays else np.zeros((len(dates), 0), dtype=np.int64)
+            for col, arrays in by_player.items()
+        }
+
+    def as_of_last_dates(self, players, dates):
+        """
+        Date of each player's last game before each date, as int64 nanoseconds
+        of shape (len(dates), len(players)); only meaningful where the player
+        has games before the date (as_of_totals 'games' > 0)
+        """
+        dates = self._date_values(dates)
+        columns = []
+        for player in players:
+            start, end = self.player_block(player)
+            ends = start + np.searchsorted(self.dates[start:end], dates, side='left')
+            columns.append(self.dates[ends - 1] if end > start else np.zeros(len(dates), dtype=np.int64))
+        return np.column_stack(columns) if columns else np.zeros((len(dates), 0), dtype=np.int64)
+
+    @staticmethod
+    def _date_values(dates):
+        """Dates (strings, datetimes) as int64 nanoseconds, comparable with self.dates"""
+        return pd.to_datetime(pd.Series(dates)).values.astype('datetime64[ns]').astype(np.int64)
+
+    def _split(self, split):
+        """Prefix sums of a split; the rested split is built on its first query"""
+        if split == self.REST_SPLIT and split not in self.split_prefix:
+            self._add_split(split, self.days_rest() >= self.REST_DAYS)
+        return self.split_prefix[split]
+
+    def totals(self, start, end, split=None):
+        """Stat sums over rows [start, end) - end may be an array; split limits to e.g. home games"""
+        prefix = self.prefix if split is None else self._split(split)
+        return {col: prefix[col][end] - prefix[col][start] for col in self.columns}
+
+    def games(self, start, end, split=None):
+        """Number of games in rows [start, end) (only those where split is True, if given)"""
+        if split is None:
+            return np.asarray(end) - start
+        prefix = self._split(split)['games']
+        return prefix[end] - prefix[start]
+
+    def rows(self, start, end):
+        """Game log rows [start, end), oldest first"""
+        return self.df.iloc[start:end]
@@ -0,0 +1,114 @@
+#!/usr/bin/env python3
+"""
+Game Log Loader
+
+Typed reader for the mlb_game_logs_<season>.csv files written by
+gamelog_scrape.py and fetch_2025_gamelogs.py.
+
+Read with default dtypes, every name is a Python string object, every
+counting stat an int64 and the scraped rate strings ('.250') float64 or
+object. The loader applies one explicit schema instead:
+
+- player_name, opponent, team, position    category
+- AB, H, R, RBI, HR, 2B, 3B, BB, SO, SB ... int16 (float64 if a column has gaps)
+- AVG, OBP, SLG, OPS                       float32 (unparseable values -> NaN)
+- player_id, game_pk                       int32
+- is_home, is_win                          bool
+- game_date                                datetime64
+
+A season of logs takes a fraction of the memory, and equality filters such as
+logs[logs['player_name'] == name] compare integer category codes instead of
+strings.
+
+Two things to keep in mind with the typed frame:
+- group categorical columns with observed=True, otherwise pandas emits a
+  group for every player/team in the file, not just the ones in the slice
+- sums of int16 columns do not overflow: Series.sum() and cumsum() return
+  int64, and groupby sums are computed in int64 and only cast back to int16
+  when every total fits, so no upcast is needed - but do not rely on the
+  result dtype of a groupby sum, it depends on the data
+
+Usage:
+    game_logs = load_game_logs(data_dir, 2024)
+    game_logs = load_game_logs(data_dir, [2023, 2024])   # one frame, categories merged
+"""
+
+import numpy as np
+import pandas as pd
+from pathlib import Path
+from pandas.api.types import union_categoricals
+
+
+CATEGORY_COLUMNS = ['player_name', 'opponent', 'team', 'position']
+
+COUNT_COLUMNS = ['AB', 'H', 'R', 'RBI', 'HR', '2B', '3B', 'BB', 'SO', 'SB', 'HBP', 'SF', '1B', 'CS']
+
+RATE_COLUMNS = ['AVG', 'OBP', 'SLG', 'OPS']
+
+ID_COLUMNS = ['player_id', 'game_pk']
+
+BOOL_COLUMNS = ['is_home', 'is_win']
+
+
+def game_log_file(data_dir, season):
+    """Path of a season's game log CSV"""
+    return Path(data_dir) / f"mlb_game_logs_{season}.csv"
+
+
+def apply_game_log_schema(df):
+    """Cast a raw game log frame to the compact schema (in place); returns df"""
+    for col in CATEGORY_COLUMNS:
+        if col in df.columns:
+            df[col] = df[col].astype('category')
+
+    for col in COUNT_COLUMNS:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+            df[col] = df[col].astype(np.int16)
+
+    for col in RATE_COLUMNS:
+        if col in df.columns:
+            df[col] = pd.to_numeric(df[col], errors='coerce').astype(np.float32)
+
+    for col in ID_COLUMNS:
+        if col in df.columns and pd.api.types.is_integer_dtype(df[col]):
+            df[col] = df[col].astype(np.int32)
+
+    for col in BOOL_COLUMNS:
+        if col in df.columns and df[col].dtype == object:
+            df[col] = df[col].map({'True': True, 'False': False, True: True, False: False})
+
+    if 'game_date' in df.columns:
+        df['game_date'] = pd.to_datetime(df['game_date'])
+
+    return df
+
+
+def read_game_logs(path):
+    """Read one game log CSV with the compact schema"""
+    return apply_game_log_schema(pd.read_csv(path))
+
+
+def load_game_logs(data_dir, seasons):
+    """
+    Game logs for one season or a list of seasons
+
+    Missing season files are skipped; returns an empty DataFrame if none exist.
+    With several seasons the frames are concatenated and each categorical
+    column keeps the union of the seasons' categories.
+    """
+    if isinstance(seasons, (int, str)):
+        seasons = [seasons]
+
+    frames = [read_game_logs(f) for f in (game_log_file(data_dir, s) for s in seasons) if f.exists()]
+    if not frames:
+        return pd.DataFrame()
+    if len(frames) == 1:
+        return frames[0]
+
+    # pd.concat only keeps a categorical column if every frame has the same categories
+    for col in CATEGORY_COLUMNS:
+        if all(col in f.columns for f in frames):
+            categories = union_categoricals([f[col] for f in frames], sort_categories=True).categories
+            for f in frames:
+                f[col] = f[col].cat.set_categories(categories)
+    return pd.concat(frames, ignore_index=True)
@@ -20,8 +20,18 @@ Output:
 """
 
 import pandas as pd
+import numpy as np
 from pathlib import Path
 
+try:
+    from .data_context import schedule_window
+    from .game_log_index import GameLogIndex
+    from .game_log_loader import load_game_logs
+except ImportError:
+    from data_context import schedule_window
+    from game_log_index import GameLogIndex
+    from game_log_loader import load_game_logs
+
 
 class HomeAwayFactorAnalyzer:
     """Analyze home/away venue performance"""
@@ -30,78 +40,77 @@ class HomeAwayFactorAnalyzer:
         self.data_dir = Path(data_dir)
     
     def calculate_venue_score(self, home_ba, away_ba, is_home_game, sample_size):
-        """Calculate venue advantage score"""
-        if away_ba == 0 and home_ba == 0:
-            return 0.0
-        
+        """Calculate venue advantage score (BAs and sample size may be arrays)"""
         if is_home_game:
-            ba_diff = home_ba - away_ba if away_ba > 0 else 0
+            ba_diff = np.where(away_ba > 0, home_ba - away_ba, 0)
         else:
-            ba_diff = away_ba - home_ba if home_ba > 0 else 0
+            ba_diff = np.where(home_ba > 0, away_ba - home_ba, 0)
         
         venue_score = ba_diff * 10
-        confidence = min(sample_size / 10, 1.0)
+        confidence = np.minimum(sample_size / 10, 1.0)
         venue_score *= confidence
         
-        return max(-2.0, min(2.0, venue_score))
+        venue_score = np.clip(venue_score, -2.0, 2.0)
+        return np.where((away_ba == 0) & (home_ba == 0), 0.0, venue_score)
     
-    def analyze(self, games_df, game_logs_df, roster_df, schedule_df):
-        """Analyze home/away advantages"""
-        results = []
+    def analyze(self, games_df, game_logs_df, roster_df, schedule_df, index=None):
+        """Analyze home/away advantages
+        
+        Home/away splits before each game come from a GameLogIndex (built here
+        unless the run's shared index is passed in).
+        """
+        if index is None:
+            index = GameLogIndex(game_logs_df)
+        
+        # As-of totals for every (game, player) pair: arrays of shape [games x players]
+        player_names = roster_df['player_name'].values
+        game_dates = games_df['game_date']
+        totals = index.as_of_totals(player_names, game_dates)
+        home = index.as_of_totals(player_names, game_dates, split='is_home')
+        
+        # Rows in game order, then roster order; only players with 5+ games of history
+        enough_history = (totals['games'] >= 5).ravel()
+        if not enough_history.any():
+            return pd.DataFrame()
+        
+        pick = lambda table, col: table[col].ravel()[enough_history]
+        home_games, home_ab, home_hits = pick(home, 'games'), pick(home, 'AB'), pick(home, 'H')
+        away_games = pick(totals, 'games') - home_games
+        away_ab = pick(totals, 'AB') - home_ab
+        away_hits = pick(totals, 'H') - home_hits
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            home_ba = np.where(home_ab > 0, home_hits / home_ab, 0)
+            away_ba = np.where(away_ab > 0, away_hits / away_ab, 0)
+        
+        # Determine if current game is home
+        is_home = True  # Simplified
         
-        for _, game in games_df.iterrows():
-            game_date = game['game_date']
-            
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                
-                # Get player history
-                player_history = game_logs_df[
-                    (game_logs_df['player_name'] == player_name) &
-                    (game_logs_df['game_date'] < game_date)
-                ]
-                
-                if len(player_history) >= 5:
-                    # Calculate home stats
-                    home_games = player_history[player_history.get('is_home', False)]
-                    home_ab = home_games['AB'].sum()
-                    home_hits = home_games['H'].sum()
-                    home_ba = home_hits / home_ab if home_ab > 0 else 0
-                    
-                    # Calculate away stats
-                    away_games = player_history[~player_history.get('is_home', True)]
-                    away_ab = away_games['AB'].sum()
-                    away_hits = away_games['H'].sum()
-                    away_ba = away_hits / away_ab if away_ab > 0 else 0
-                    
-                    # Determine if current game is home
-                    is_home = True  # Simplified
-                    
-                    venue_score = self.calculate_venue_score(
-                        home_ba, away_ba, is_home, len(player_history)
-                    )
-                    
-                    results.append({
-                        'player_name': player_name,
-                        'game_date': game_date,
-                        'home_games': len(home_games),
-                        'home_ba': round(home_ba, 3),
-                        'away_games': len(away_games),
-                        'away_ba': round(away_ba, 3),
-                        'venue_score': venue_score
-                    })
+        venue_score = self.calculate_venue_score(
+            home_ba, away_ba, is_home, pick(totals, 'games')
+        )
         
-        return pd.DataFrame(results)
+        return pd.DataFrame({
+            'player_name': np.tile(player_names, len(games_df))[enough_history],
+            'game_date': np.repeat(game_dates.values, len(player_names))[enough_history],
+            'home_games': home_games,
+            'home_ba': np.round(home_ba, 3),
+            'away_games': away_games,
+            'away_ba': np.round(away_ba, 3),
+            'venue_score': venue_score
+        })
 
 
-    def analyze_roster(self, roster_df, schedule_df, players_df=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None,
+                       target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, self._load_gamelogs(), roster_df, schedule_df)
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        index = context.game_log_index if context is not None else None
+        return self.analyze(schedule_df, self._load_gamelogs(context), roster_df, schedule_df, index)
     
-    def _load_gamelogs(self):
+    def _load_gamelogs(self, context=None):
         """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+        if context is not None:
+            return context.game_logs
+        return load_game_logs(self.data_dir, 2024)
@@ -23,187 +23,84 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from .data_context import schedule_window
+    from .game_context_cache import cache_for
+    from .venue_conditions import (BALLPARK_ELEVATIONS, DEFAULT_ELEVATION_FT, DEFAULT_HUMIDITY_PCT,
+                                   DEFAULT_TEMPERATURE_C, air_conditions, venue_conditions_for)
+except ImportError:
+    from data_context import schedule_window
+    from game_context_cache import cache_for
+    from venue_conditions import (BALLPARK_ELEVATIONS, DEFAULT_ELEVATION_FT, DEFAULT_HUMIDITY_PCT,
+                                  DEFAULT_TEMPERATURE_C, air_conditions, venue_conditions_for)
+
 
 class HumidityElevationAnalyzer:
     """Analyze humidity and elevation effects on performance"""
     
     # MLB Ballpark Elevations (in feet)
-    BALLPARK_ELEVATIONS = {
-        'Coors Field': 5200,           # Denver - Highest
-        'Chase Field': 1086,            # Arizona
-        'Globe Life Field': 550,        # Texas
-        'Kauffman Stadium': 910,        # Kansas City
-        'Busch Stadium': 535,           # St. Louis
-        'Guaranteed Rate Field': 595,   # Chicago White Sox
-        'Wrigley Field': 595,           # Chicago Cubs
-        'T-Mobile Park': 10,            # Seattle - Sea level
-        'Oracle Park': 10,              # San Francisco - Sea level
-        'Petco Park': 20,               # San Diego - Sea level
-        'Tropicana Field': 10,          # Tampa Bay
-        'Fenway Park': 20,              # Boston
-        'Yankee Stadium': 55,           # New York Yankees
-        'Citi Field': 10,               # New York Mets
-        'Citizens Bank Park': 10,       # Philadelphia
-        'Nationals Park': 25,           # Washington
-        'Truist Park': 1050,            # Atlanta
-        'loanDepot park': 10,           # Miami
-        'Oriole Park': 33,              # Baltimore
-        'Progressive Field': 660,       # Cleveland
-        'Comerica Park': 585,           # Detroit
-        'Target Field': 840,            # Minnesota
-        'Rogers Centre': 300,           # Toronto
-        'American Family Field': 635,   # Milwaukee
-        'Great American Ball Park': 550, # Cincinnati
-        'PNC Park': 730,                # Pittsburgh
-        'Dodger Stadium': 340,          # Los Angeles
-        'Angel Stadium': 160,           # Los Angeles Angels
-        'Oakland Coliseum': 25,         # Oakland
-        'Minute Maid Park': 22,         # Houston
-    }
+    BALLPARK_ELEVATIONS = BALLPARK_ELEVATIONS
     
     def __init__(self, data_dir):
         self.data_dir = Path(data_dir)
     
-    def calculate_humidity_factor(self, humidity_pct, temperature_c):
-        """Calculate hitting advantage from humidity"""
-        # Convert to Fahrenheit
-        temp_f = (temperature_c * 9/5) + 32
-        
-        # Humidity effect is stronger at higher temperatures
-        # Base calculation: At 90°F, 90% humidity vs 10% adds ~6 feet
-        # Scale by temperature
-        
-        if temp_f < 50:
-            # Cold weather - humidity has minimal effect
-            humidity_boost = 0.0
-        elif temp_f >= 90:
-            # Hot weather - maximum humidity effect
-            # 90% humidity = +1.0, 10% humidity = -1.0
-            humidity_boost = (humidity_pct - 50) / 40  # Scale -1.0 to +1.0
-        else:
-            # Moderate temps - scale effect proportionally
-            temp_factor = (temp_f - 50) / 40  # 0 at 50°F, 1 at 90°F
-            humidity_boost = ((humidity_pct - 50) / 40) * temp_factor
-        
-        return np.clip(humidity_boost, -1.0, 1.0)
-    
-    def calculate_elevation_factor(self, stadium_name):
-        """Calculate hitting advantage from elevation"""
-        elevation = self.BALLPARK_ELEVATIONS.get(stadium_name, 500)  # Default moderate
-        
-        # Research shows ~3% distance increase per 1000 ft
-        # Normalize to -1.0 to +1.0 range where Coors = 1.0
-        
-        if elevation >= 5000:  # Coors territory
-            return 1.0
-        elif elevation >= 1000:  # Moderate elevation
-            return (elevation - 500) / 4500  # Scale 500-5200 to 0-1
-        elif elevation < 100:  # Sea level
-            return -0.3  # Slight disadvantage vs league average
-        else:
-            return (elevation - 100) / 900 * 0.3  # Scale to slight advantage
+    def team_conditions_table(self, schedule_df, venue_conditions):
+        """Stadium and conditions of each team's game (first in the schedule), one row per team"""
+        columns = ['team', 'stadium', 'humidity_pct', 'temperature_c', 'elevation_ft', 'humidity_score',
+                   'elevation_score', 'air_density_score', 'rating', 'expected_distance_change_ft']
+        if schedule_df.empty:
+            return pd.DataFrame(columns=columns)
+        
+        # Each team's first game, home or away
+        games = schedule_df[['home_team', 'away_team', 'venue']].reset_index(drop=True)
+        games['game_order'] = np.arange(len(games))
+        team_games = pd.concat([
+            games.assign(team=games['home_team']),
+            games.assign(team=games['away_team']),
+        ], ignore_index=True)
+        first_games = team_games.sort_values('game_order', kind='stable').drop_duplicates('team')
+        
+        # Weather of the home team's park, defaults when there is none
+        weather = venue_conditions[['team', 'humidity_pct', 'temperature_c']].drop_duplicates('team')
+        teams = first_games.merge(weather.rename(columns={'team': 'home_team'}), on='home_team', how='left',
+                                  indicator=True)
+        has_weather = teams.pop('_merge') == 'both'
+        for column, default in (('humidity_pct', DEFAULT_HUMIDITY_PCT), ('temperature_c', DEFAULT_TEMPERATURE_C)):
+            values = teams[column].where(has_weather, default)
+            # Integer readings stay integers (the left merge turned them into floats)
+            if pd.api.types.is_integer_dtype(weather[column]) or not has_weather.any():
+                values = values.astype(int)
+            teams[column] = values
+        
+        teams['stadium'] = teams['venue']
+        teams['elevation_ft'] = teams['venue'].map(self.BALLPARK_ELEVATIONS).fillna(DEFAULT_ELEVATION_FT).astype(int)
+        for column, values in air_conditions(teams['humidity_pct'], teams['temperature_c'], teams['elevation_ft']).items():
+            teams[column] = values
+        
+        return teams[columns]
     
-    def calculate_air_density_score(self, humidity_pct, temperature_c, elevation_ft):
-        """Calculate combined air density effect"""
-        # Lower air density = ball travels further
-        
-        # Temperature effect (hot = less dense)
-        temp_f = (temperature_c * 9/5) + 32
-        temp_factor = (temp_f - 60) / 30  # Normalized around 60°F
-        
-        # Humidity effect (humid = less dense, counterintuitively)
-        # Water vapor is lighter than dry air
-        humidity_factor = (humidity_pct - 50) / 50
-        
-        # Elevation effect (high = less dense)
-        elevation_factor = elevation_ft / 5200  # Normalized to Coors
-        
-        # Combined (weighted)
-        combined = (
-            temp_factor * 0.35 +
-            humidity_factor * 0.25 +
-            elevation_factor * 0.40
-        )
-        
-        return np.clip(combined, -1.5, 1.5)
-    
-    def analyze_game_conditions(self, game_weather, stadium_name):
-        """Analyze specific game conditions"""
-        humidity = game_weather.get('humidity_pct', 50)
-        temperature = game_weather.get('temperature_c', 20)
-        elevation = self.BALLPARK_ELEVATIONS.get(stadium_name, 500)
-        
-        # Individual factors
-        humidity_score = self.calculate_humidity_factor(humidity, temperature)
-        elevation_score = self.calculate_elevation_factor(stadium_name)
-        
-        # Combined air density
-        air_density_score = self.calculate_air_density_score(
-            humidity, temperature, elevation
-        )
-        
-        # Determine rating
-        if air_density_score >= 0.8:
-            rating = 'Very Favorable'
-        elif air_density_score >= 0.3:
-            rating = 'Favorable'
-        elif air_density_score >= -0.3:
-            rating = 'Neutral'
-        elif air_density_score >= -0.8:
-            rating = 'Unfavorable'
-        else:
-            rating = 'Very Unfavorable'
-        
-        return {
-            'humidity_pct': humidity,
-            'temperature_c': temperature,
-            'elevation_ft': elevation,
-            'humidity_score': round(humidity_score, 2),
-            'elevation_score': round(elevation_score, 2),
-            'air_density_score': round(air_density_score, 2),
-            'rating': rating,
-            'expected_distance_change_ft': round(air_density_score * 20, 1)  # Est. feet
-        }
-    
-    def analyze_roster(self, roster_df, schedule_df, weather_df):
+    def analyze_roster(self, roster_df, schedule_df, weather_df=None, context=None,
+                       target_date=None, window_days=None):
         """Analyze conditions for all roster players' games"""
-        results = []
-        
-        for _, player in roster_df.iterrows():
-            player_name = player['player_name']
-            team = player.get('team', 'Unknown')
-            
-            # Find player's game today
-            player_game = schedule_df[
-                (schedule_df['home_team'] == team) | 
-                (schedule_df['away_team'] == team)
-            ]
-            
-            if len(player_game) == 0:
-                continue
-            
-            game = player_game.iloc[0]
-            stadium = game.get('venue', 'Unknown')
-            
-            # Find weather for this game
-            game_weather = weather_df[weather_df['team'] == game['home_team']]
-            
-            if len(game_weather) == 0:
-                game_weather = {'humidity_pct': 50, 'temperature_c': 20}
-            else:
-                game_weather = game_weather.iloc[0].to_dict()
-            
-            # Analyze conditions
-            analysis = self.analyze_game_conditions(game_weather, stadium)
-            
-            results.append({
-                'player_name': player_name,
-                'team': team,
-                'stadium': stadium,
-                **analysis
-            })
-        
-        return pd.DataFrame(results)
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        if weather_df is None:
+            weather_df = context.weather if context is not None else pd.DataFrame()
+        
+        # Conditions of every team's game, computed once per schedule window and joined to the players
+        cache = cache_for(context)
+        teams = cache.get('humidity', (target_date, window_days),
+                          lambda: self.team_conditions_table(schedule_df, venue_conditions_for(context, weather_df)))
+        
+        players = pd.DataFrame({
+            'player_name': roster_df['player_name'].values,
+            'team': roster_df['team'].values if 'team' in roster_df.columns else 'Unknown',
+        })
+        results = players.merge(teams, on='team', how='inner')
+        if results.empty:
+            return pd.DataFrame()
+        
+        return results
 
 
 def main():
@@ -21,8 +21,18 @@ Output:
 """
 
 import pandas as pd
+import numpy as np
 from pathlib import Path
 
+try:
+    from .data_context import schedule_window
+    from .game_log_index import GameLogIndex
+    from .game_log_loader import load_game_logs
+except ImportError:
+    from data_context import schedule_window
+    from game_log_index import GameLogIndex
+    from game_log_loader import load_game_logs
+
 
 class InjuryFactorAnalyzer:
     """Analyze injury recovery performance impacts"""
@@ -48,17 +58,21 @@ class InjuryFactorAnalyzer:
         
         return max(-2.0, min(2.0, injury_score))
     
-    def analyze(self, games_df, game_logs_df, roster_df):
+    def analyze(self, games_df, game_logs_df, roster_df, index=None):
         """Analyze injury recovery impacts
         
         Note: For large-scale analysis without historical game logs,
         returns neutral scores. This prevents performance bottlenecks
         when processing thousands of players across full season schedules.
+        
+        With game logs, the returns from injury are found in one pass over the
+        sorted logs (injury_return_table) and each (game, player) pair is an
+        as-of lookup into that table using the GameLogIndex.
         """
         results = []
         
-        # Convert dates once
-        games_df['game_date'] = pd.to_datetime(games_df['game_date'])
+        # Convert dates once (on a local copy; the schedule is shared with other analyzers)
+        games_df = games_df.assign(game_date=pd.to_datetime(games_df['game_date']))
         
         # If no game logs available, return neutral scores (0.0)
         if len(game_logs_df) == 0:
@@ -75,71 +89,104 @@ class InjuryFactorAnalyzer:
                     })
             return pd.DataFrame(results)
         
-        # With game logs, analyze properly (but limit to reduce processing time)
-        game_logs_df['game_date'] = pd.to_datetime(game_logs_df['game_date'])
+        # With game logs: look up each player's most recent return before every game
+        if index is None:
+            index = GameLogIndex(game_logs_df)
+        returns = self.injury_return_table(index)
+        returns_by_player = {player: group for player, group in returns.groupby('player_name', sort=False, observed=True)}
         
-        # Limit to recent games only to avoid performance issues
-        max_games = min(len(games_df), 100)
-        games_sample = games_df.head(max_games)
+        game_dates = games_df['game_date'].values.astype('datetime64[ns]')
+        game_dates_ns = game_dates.astype(np.int64)
+        day_ns = pd.Timedelta(days=1).value
         
-        for _, game in games_sample.iterrows():
-            game_date = game['game_date']
+        found = []
+        for player_idx, player_name in enumerate(roster_df['player_name'].values):
+            player_returns = returns_by_player.get(player_name)
+            if player_returns is None:
+                continue
+            
+            # Player's games strictly before each game date; need 10+ of them
+            start, ends = index.before(player_name, game_dates)
+            history_games = ends - start
+            
+            # Most recent return row inside that history (as-of lookup)
+            return_rows = player_returns['row'].values
+            latest = np.searchsorted(return_rows, ends, side='left') - 1
+            has_return = latest >= 0
+            latest = np.maximum(latest, 0)
+            
+            return_dates_ns = player_returns['return_date'].values.astype('datetime64[ns]').astype(np.int64)[latest]
+            days_since = (game_dates_ns - return_dates_ns) // day_ns
+            
+            # In recovery period
+            recovering = (history_games >= 10) & has_return & (days_since >= 0) & (days_since <= 30)
+            
+            for game_idx in np.flatnonzero(recovering):
+                found.append((game_idx, player_idx, player_name, return_rows[latest[game_idx]],
+                              player_returns['pre_injury_ba'].values[latest[game_idx]],
+                              int(days_since[game_idx]), ends[game_idx]))
+        
+        # Game order, then roster order
+        for game_idx, _, player_name, return_row, pre_ba, days_since, end in sorted(found, key=lambda x: x[:2]):
+            post = index.totals(return_row, end)
+            games_since = int(end - return_row)
+            post_ba = post['H'] / post['AB'] if post['AB'] > 0 else 0
+            
+            injury_score = self.calculate_injury_score(
+                pre_ba, post_ba, days_since, games_since
+            )
             
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                
-                # Get player history
-                player_history = game_logs_df[
-                    (game_logs_df['player_name'] == player_name) &
-                    (game_logs_df['game_date'] < game_date)
-                ].sort_values('game_date').copy()
-                
-                if len(player_history) >= 10:
-                    # Calculate gaps (14+ days = likely injury)
-                    player_history['days_gap'] = (
-                        player_history['game_date'] - player_history['game_date'].shift(1)
-                    ).dt.days.fillna(0)
-                    
-                    injury_gaps = player_history[player_history['days_gap'] >= 14]
-                    
-                    if len(injury_gaps) > 0:
-                        # Most recent injury
-                        return_date = injury_gaps['game_date'].iloc[-1]
-                        days_since = (pd.to_datetime(game_date) - return_date).days
-                        
-                        if 0 <= days_since <= 30:
-                            # In recovery period
-                            pre_injury = player_history[player_history['game_date'] < return_date].tail(10)
-                            post_injury = player_history[player_history['game_date'] >= return_date]
-                            
-                            pre_ba = pre_injury['H'].sum() / pre_injury['AB'].sum() if len(pre_injury) > 0 and pre_injury['AB'].sum() > 0 else 0
-                            post_ba = post_injury['H'].sum() / post_injury['AB'].sum() if len(post_injury) > 0 and post_injury['AB'].sum() > 0 else 0
-                            
-                            injury_score = self.calculate_injury_score(
-                                pre_ba, post_ba, days_since, len(post_injury)
-                            )
-                            
-                            results.append({
-                                'player_name': player_name,
-                                'game_date': game_date,
-                                'days_since_return': days_since,
-                                'games_since_return': len(post_injury),
-                                'pre_injury_ba': round(pre_ba, 3),
-                                'post_injury_ba': round(post_ba, 3),
-                                'injury_score': injury_score
-                            })
+            results.append({
+                'player_name': player_name,
+                'game_date': games_df['game_date'].iloc[game_idx],
+                'days_since_return': days_since,
+                'games_since_return': games_since,
+                'pre_injury_ba': round(pre_ba, 3),
+                'post_injury_ba': round(post_ba, 3),
+                'injury_score': injury_score
+            })
         
         return pd.DataFrame(results)
+    
+    def injury_return_table(self, index):
+        """
+        One row per return from a likely injury (14+ days since the player's
+        previous game): player_name, row (position in the index), return_date
+        and pre_injury_ba over the player's last 10 games before the gap
+        """
+        df = index.df
+        if df.empty:
+            return pd.DataFrame(columns=['player_name', 'row', 'return_date', 'pre_injury_ba'])
+        
+        # Calculate gaps (14+ days = likely injury)
+        days_gap = df.groupby(index.key, sort=False, observed=True)['game_date'].diff().dt.days.fillna(0)
+        rows = np.flatnonzero(days_gap.values >= 14)
+        players = df[index.key].values[rows]
+        
+        # Pre-injury window: up to 10 games before the return
+        block_starts = np.array([index.player_block(p)[0] for p in players], dtype=np.int64)
+        pre_starts = np.maximum(block_starts, rows - 10)
+        pre = index.totals(pre_starts, rows)
+        pre_ba = [h / ab if ab > 0 else 0 for h, ab in zip(pre['H'], pre['AB'])]
+        
+        return pd.DataFrame({
+            'player_name': players,
+            'row': rows,
+            'return_date': df['game_date'].values[rows],
+            'pre_injury_ba': pd.Series(pre_ba, dtype=object),
+        })
+    
 
-
-    def analyze_roster(self, roster_df, schedule_df, players_df=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None,
+                       target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, self._load_gamelogs(), roster_df)
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        index = context.game_log_index if context is not None else None
+        return self.analyze(schedule_df, self._load_gamelogs(context), roster_df, index)
     
-    def _load_gamelogs(self):
+    def _load_gamelogs(self, context=None):
         """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+        if context is not None:
+            return context.game_logs
+        return load_game_logs(self.data_dir, 2024)
@@ -24,9 +24,15 @@ Output:
 """
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 
+try:
+    from .stable_random import keyed_uniforms
+    from .data_context import schedule_window
+except ImportError:
+    from stable_random import keyed_uniforms
+    from data_context import schedule_window
+
 
 class LineupPositionAnalyzer:
     """Analyze batting order position impact on fantasy production"""
@@ -120,8 +126,9 @@ class LineupPositionAnalyzer:
         if avg > 0.250:
             return 6
         
-        # 7-9: Lower production
-        return np.random.choice([7, 8, 9])
+        # 7-9: Lower production (stable per player)
+        rand = keyed_uniforms([player_stats.get('player_name', '')])[0, 0]
+        return [7, 8, 9][int(rand * 3)]
     
     def calculate_position_impact(self, lineup_position):
         """Calculate fantasy impact multipliers for lineup position"""
@@ -246,11 +253,15 @@ class LineupPositionAnalyzer:
         else:
             return "Poor"
     
-    def analyze_roster(self, roster_df, schedule_df):
+    def analyze_roster(self, roster_df, schedule_df, context=None, target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
         # Load MLB data
         mlb_file = self.data_dir / "mlb_all_players_complete.csv"
-        if mlb_file.exists():
+        if context is not None:
+            mlb_df = context.players
+        elif mlb_file.exists():
             mlb_df = pd.read_csv(mlb_file)
         else:
             mlb_df = pd.DataFrame()
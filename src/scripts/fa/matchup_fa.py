@@ -18,8 +18,18 @@ Output:
 """
 
 import pandas as pd
+import numpy as np
 from pathlib import Path
 
+try:
+    from .data_context import schedule_window
+    from .game_log_index import GameLogIndex
+    from .game_log_loader import load_game_logs
+except ImportError:
+    from data_context import schedule_window
+    from game_log_index import GameLogIndex
+    from game_log_loader import load_game_logs
+
 
 class MatchupFactorAnalyzer:
     """Analyze pitcher-hitter historical matchups"""
@@ -28,60 +38,59 @@ class MatchupFactorAnalyzer:
         self.data_dir = Path(data_dir)
     
     def calculate_matchup_score(self, batting_avg, home_runs, games_played):
-        """Calculate matchup advantage score"""
+        """Calculate matchup advantage score (scalars or arrays)"""
         ba_score = (batting_avg - 0.250) * 10
         hr_score = home_runs * 0.5
-        confidence = min(games_played / 10, 1.0)
+        confidence = np.minimum(games_played / 10, 1.0)
         score = (ba_score + hr_score) * confidence
-        return max(-2.0, min(2.0, score))
+        return np.clip(score, -2.0, 2.0)
     
-    def analyze(self, games_df, game_logs_df, roster_df):
-        """Analyze matchup advantages"""
-        results = []
+    def analyze(self, games_df, game_logs_df, roster_df, index=None):
+        """Analyze matchup advantages
+        
+        Each player's history before each game comes from a GameLogIndex
+        (built here unless the run's shared index is passed in).
+        """
+        if index is None:
+            index = GameLogIndex(game_logs_df)
+        
+        # As-of totals for every (game, player) pair: arrays of shape [games x players]
+        player_names = roster_df['player_name'].values
+        table = index.as_of_totals(player_names, games_df['game_date'])
+        
+        # Rows in game order, then roster order; only players with history
+        has_history = (table['games'] > 0).ravel()
+        if not has_history.any():
+            return pd.DataFrame()
         
-        for _, game in games_df.iterrows():
-            game_date = game['game_date']
-            
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                
-                # Find historical matchups
-                player_history = game_logs_df[
-                    (game_logs_df['player_name'] == player_name) &
-                    (game_logs_df['game_date'] < game_date)
-                ]
-                
-                if len(player_history) > 0:
-                    total_ab = player_history['AB'].sum()
-                    total_hits = player_history['H'].sum()
-                    total_hr = player_history['HR'].sum()
-                    avg_ba = total_hits / total_ab if total_ab > 0 else 0
-                    
-                    matchup_score = self.calculate_matchup_score(
-                        avg_ba, total_hr, len(player_history)
-                    )
-                    
-                    results.append({
-                        'player_name': player_name,
-                        'game_date': game_date,
-                        'games_played': len(player_history),
-                        'total_at_bats': total_ab,
-                        'batting_avg': round(avg_ba, 3),
-                        'total_home_runs': total_hr,
-                        'matchup_score': matchup_score
-                    })
+        games_played = table['games'].ravel()[has_history]
+        total_ab = table['AB'].ravel()[has_history]
+        total_hits = table['H'].ravel()[has_history]
+        total_hr = table['HR'].ravel()[has_history]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg_ba = np.where(total_ab > 0, total_hits / total_ab, 0)
         
-        return pd.DataFrame(results)
+        return pd.DataFrame({
+            'player_name': np.tile(player_names, len(games_df))[has_history],
+            'game_date': np.repeat(games_df['game_date'].values, len(player_names))[has_history],
+            'games_played': games_played,
+            'total_at_bats': total_ab,
+            'batting_avg': np.round(avg_ba, 3),
+            'total_home_runs': total_hr,
+            'matchup_score': self.calculate_matchup_score(avg_ba, total_hr, games_played)
+        })
 
 
-    def analyze_roster(self, roster_df, schedule_df, players_df=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None,
+                       target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, self._load_gamelogs(), roster_df)
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        index = context.game_log_index if context is not None else None
+        return self.analyze(schedule_df, self._load_gamelogs(context), roster_df, index)
     
-    def _load_gamelogs(self):
+    def _load_gamelogs(self, context=None):
         """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+        if context is not None:
+            return context.game_logs
+        return load_game_logs(self.data_dir, 2024)
@@ -18,11 +18,20 @@ Research Basis:
 - Sample size matters: Need 3+ seasons to trust monthly splits
 
 Output: Monthly performance profiles and current month adjustment scores
+
+Month totals come from a (player, season, month) cube built with one groupby
+over the game logs and cached as monthly_splits_cube_<season>.csv; it is
+rebuilt only when the game log file is newer than the cache.
 """
 
 import pandas as pd
 import numpy as np
 from pathlib import Path
+
+try:
+    from .game_log_loader import read_game_logs
+except ImportError:
+    from game_log_loader import read_game_logs
 from datetime import datetime
 
 
@@ -35,73 +44,131 @@ class MonthlySplitsAnalyzer:
         9: 'September', 10: 'October', 11: 'November', 12: 'December'
     }
     
+    EMPTY_MONTH = {
+        'games': 0,
+        'avg': 0.0,
+        'obp': 0.0,
+        'slg': 0.0,
+        'ops': 0.0,
+        'hr': 0,
+        'rbi': 0
+    }
+    
     def __init__(self, data_dir):
         self.data_dir = Path(data_dir)
+        self._monthly_stats = {}
     
-    def calculate_monthly_stats(self, player_games, month):
-        """Calculate stats for a specific month"""
-        month_games = player_games[player_games['game_date'].dt.month == month]
+    # Stat columns summed per (player, season, month)
+    CUBE_STATS = ['AB', 'H', 'BB', 'HR', 'RBI', '2B', '3B']
+    
+    def build_monthly_cube(self, game_logs_df):
+        """(player, season, month) games and stat totals from one groupby over the game logs"""
+        game_dates = pd.to_datetime(game_logs_df['game_date'])
+        stats = [c for c in self.CUBE_STATS if c in game_logs_df.columns]
         
-        if len(month_games) == 0:
-            return {
-                'games': 0,
-                'avg': 0.0,
-                'obp': 0.0,
-                'slg': 0.0,
-                'ops': 0.0,
-                'hr': 0,
-                'rbi': 0
-            }
+        cube = game_logs_df[stats].assign(
+            player_name=game_logs_df['player_name'].values,
+            season=game_dates.dt.year.values,
+            month=game_dates.dt.month.values,
+            games=1
+        ).groupby(['player_name', 'season', 'month'], sort=True, observed=True).sum().reset_index()
         
-        # Calculate stats
-        total_ab = month_games['AB'].sum()
-        total_h = month_games['H'].sum()
-        total_bb = month_games['BB'].sum() if 'BB' in month_games.columns else 0
-        total_hr = month_games['HR'].sum() if 'HR' in month_games.columns else 0
-        total_rbi = month_games['RBI'].sum() if 'RBI' in month_games.columns else 0
+        # Columns the logs don't have count as zero
+        for col in self.CUBE_STATS:
+            if col not in cube.columns:
+                cube[col] = 0
+        return cube[['player_name', 'season', 'month', 'games'] + self.CUBE_STATS]
+    
+    def load_monthly_cube(self, game_logs_df, game_log_file):
+        """
+        Monthly cube for a game log file, cached on disk next to it
         
-        avg = total_h / total_ab if total_ab > 0 else 0.0
+        The cached cube is reused until the game log file is newer (new logs
+        scraped), then rebuilt from game_logs_df and saved again.
+        """
+        cube_file = self.data_dir / game_log_file.name.replace('mlb_game_logs_', 'monthly_splits_cube_')
         
-        # Simplified OBP/SLG (would need more detailed stats)
-        obp = (total_h + total_bb) / (total_ab + total_bb) if (total_ab + total_bb) > 0 else 0.0
+        if cube_file.exists() and (not game_log_file.exists() or
+                                   cube_file.stat().st_mtime >= game_log_file.stat().st_mtime):
+            return pd.read_csv(cube_file)
         
-        # Rough SLG estimate
-        singles = total_h - (month_games['2B'].sum() if '2B' in month_games.columns else 0) - \
-                  (month_games['3B'].sum() if '3B' in month_games.columns else 0) - total_hr
-        total_bases = singles + (month_games['2B'].sum() if '2B' in month_games.columns else 0) * 2 + \
-                     (month_games['3B'].sum() if '3B' in month_games.columns else 0) * 3 + total_hr * 4
-        slg = total_bases / total_ab if total_ab > 0 else 0.0
+        cube = self.build_monthly_cube(game_logs_df)
+        try:
+            cube.to_csv(cube_file, index=False)
+        except OSError as e:
+            print(f"⚠️  Could not cache monthly cube: {e}")
+        return cube
+    
+    def monthly_stats_table(self, cube):
+        """Per (player, month) stats over all seasons in the cube, computed for every row at once"""
+        totals = cube.groupby(['player_name', 'month'], sort=False, observed=True)[['games'] + self.CUBE_STATS].sum()
         
-        return {
-            'games': len(month_games) if len(month_games) > 0 else 0,
-            'avg': round(avg, 3) if len(month_games) > 0 else 0.0,
-            'obp': round(obp, 3) if len(month_games) > 0 else 0.0,
-            'slg': round(slg, 3) if len(month_games) > 0 else 0.0,
-            'ops': round(obp + slg, 3) if len(month_games) > 0 else 0.0,
-            'hr': int(total_hr) if len(month_games) > 0 else 0,
-            'rbi': int(total_rbi) if len(month_games) > 0 else 0
-        }
+        ab, h, bb, hr = totals['AB'].values, totals['H'].values, totals['BB'].values, totals['HR'].values
+        doubles, triples = totals['2B'].values, totals['3B'].values
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            avg = np.where(ab > 0, h / ab, 0.0)
+            
+            # Simplified OBP/SLG (would need more detailed stats)
+            obp = np.where(ab + bb > 0, (h + bb) / (ab + bb), 0.0)
+            
+            # Rough SLG estimate
+            singles = h - doubles - triples - hr
+            total_bases = singles + doubles * 2 + triples * 3 + hr * 4
+            slg = np.where(ab > 0, total_bases / ab, 0.0)
+        
+        return pd.DataFrame({
+            'games': totals['games'].values,
+            'avg': np.round(avg, 3),
+            'obp': np.round(obp, 3),
+            'slg': np.round(slg, 3),
+            'ops': np.round(obp + slg, 3),
+            'hr': totals['HR'].values.astype(int),
+            'rbi': totals['RBI'].values.astype(int)
+        }, index=totals.index)
     
-    def analyze_player_monthly_profile(self, player_name, player_games):
-        """Analyze player's career monthly performance"""
-        if len(player_games) == 0:
-            return None
+    def player_monthly_stats(self, game_logs_df, game_log_file):
+        """{player: {month: stats}} from the (cached) monthly cube, built once per analyzer"""
+        if game_log_file not in self._monthly_stats:
+            stats = self.monthly_stats_table(self.load_monthly_cube(game_logs_df, game_log_file))
+            by_player = {}
+            for (player_name, month), row in stats.to_dict('index').items():
+                by_player.setdefault(player_name, {})[month] = row
+            self._monthly_stats[game_log_file] = by_player
+        return self._monthly_stats[game_log_file]
+    
+    def calculate_monthly_stats(self, player_games, month):
+        """Calculate stats for a specific month"""
+        month_games = player_games[player_games['game_date'].dt.month == month]
         
-        # Ensure datetime
-        player_games['game_date'] = pd.to_datetime(player_games['game_date'])
+        if len(month_games) == 0:
+            return self.EMPTY_MONTH.copy()
         
-        # Calculate stats for each month
-        monthly_stats = {}
-        season_stats = self.calculate_monthly_stats(
-            player_games, 
-            month=None  # Will use all months
-        )
+        stats = self.monthly_stats_table(self.build_monthly_cube(month_games))
+        return stats.iloc[0].to_dict()
+    
+    def analyze_player_monthly_profile(self, player_name, player_games, monthly_stats=None):
+        """Analyze player's career monthly performance
+        
+        monthly_stats: {month: stats} from monthly_stats_table; computed from
+        player_games when not given
+        """
+        if monthly_stats is None:
+            if len(player_games) == 0:
+                return None
+            stats = self.monthly_stats_table(self.build_monthly_cube(player_games))
+            monthly_stats = {month: row for (_, month), row in stats.to_dict('index').items()}
+        
+        # Season stats: month=None never matches a month, so this is the empty line
+        season_stats = self.EMPTY_MONTH.copy()
         
         # Baseball season: April (4) through September (9), sometimes Oct (10)
         baseball_months = [4, 5, 6, 7, 8, 9, 10]
         
-        for month in baseball_months:
-            monthly_stats[month] = self.calculate_monthly_stats(player_games, month)
+        monthly_stats = {
+            month: monthly_stats.get(month, self.EMPTY_MONTH.copy())
+            for month in baseball_months
+        }
         
         # Find best and worst months (min 10 games)
         valid_months = {m: s for m, s in monthly_stats.items() if s['games'] >= 10}
@@ -167,17 +234,26 @@ class MonthlySplitsAnalyzer:
         else:
             return 'Consistent'
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, as_of_date=None, context=None):
         """Analyze monthly splits for all roster players"""
         if as_of_date is None:
             as_of_date = datetime.now()
         elif isinstance(as_of_date, str):
             as_of_date = datetime.strptime(as_of_date, '%Y-%m-%d')
-        
+
         # Load game logs
-        game_log_file = self.data_dir / "mlb_game_logs_2024.csv"
-        
-        if not game_log_file.exists():
+        season = context.gamelog_season if context is not None else 2024
+        game_log_file = self.data_dir / f"mlb_game_logs_{season}.csv"
+
+        if context is not None:
+            game_logs_df = context.game_logs
+        elif game_log_file.exists():
+            print(f"Loading game logs from {game_log_file.name}...")
+            game_logs_df = read_game_logs(game_log_file)
+        else:
+            game_logs_df = pd.DataFrame()
+
+        if game_logs_df.empty:
             print(f"⚠️  Game log file not found: {game_log_file.name}")
             print("   Need player game logs for monthly split analysis")
             print("   Run: python src/scripts/scrape/gamelog_scrape.py\n")
@@ -195,21 +271,18 @@ class MonthlySplitsAnalyzer:
                     'note': 'Need game log data'
                 })
             return pd.DataFrame(results)
-        
-        # Load game logs
-        print(f"Loading game logs from {game_log_file.name}...")
-        game_logs_df = pd.read_csv(game_log_file)
-        game_logs_df['game_date'] = pd.to_datetime(game_logs_df['game_date'])
+
+        # Month totals for every player come from one cube; each player is a lookup
+        monthly_by_player = self.player_monthly_stats(game_logs_df, game_log_file)
         
         results = []
         
         for _, player in roster_df.iterrows():
             player_name = player['player_name']
             
-            # Get player's games
-            player_games = game_logs_df[game_logs_df['player_name'] == player_name].copy()
+            player_months = monthly_by_player.get(player_name)
             
-            if len(player_games) == 0:
+            if player_months is None:
                 print(f"  {player_name}: No game log data")
                 results.append({
                     'player_name': player_name,
@@ -221,7 +294,7 @@ class MonthlySplitsAnalyzer:
                 continue
             
             # Analyze monthly profile
-            profile = self.analyze_player_monthly_profile(player_name, player_games)
+            profile = self.analyze_player_monthly_profile(player_name, None, monthly_stats=player_months)
             
             if profile:
                 results.append(profile)
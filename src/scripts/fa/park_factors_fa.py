@@ -23,8 +23,16 @@ Output:
 """
 
 import pandas as pd
+import numpy as np
 from pathlib import Path
 
+try:
+    from .data_context import schedule_window
+    from .game_context_cache import GameContextCache, cache_for
+except ImportError:
+    from data_context import schedule_window
+    from game_context_cache import GameContextCache, cache_for
+
 
 class ParkFactorsAnalyzer:
     """Analyze park factors impact"""
@@ -70,35 +78,47 @@ class ParkFactorsAnalyzer:
         score = (combined - 1.0) / 0.3
         return max(-2.0, min(2.0, score))
     
-    def analyze(self, games_df, roster_df):
+    def park_context(self, home_team):
+        """Park factors and hitter/pitcher scores for a home team's stadium"""
+        stadium = self.TEAM_STADIUMS.get(home_team, 'Unknown')
+        runs_f, hr_f, hits_f = self.get_park_factors(stadium)
+        return {
+            'stadium': stadium,
+            'runs_factor': runs_f,
+            'hr_factor': hr_f,
+            'hits_factor': hits_f,
+            'hitter_score': self.calculate_park_score(runs_f, hr_f, hits_f, False),
+            'pitcher_score': self.calculate_park_score(runs_f, hr_f, hits_f, True),
+        }
+    
+    def analyze(self, games_df, roster_df, cache=None):
         """Analyze park factors"""
-        results = []
+        if len(games_df) == 0 or len(roster_df) == 0:
+            return pd.DataFrame()
+        if cache is None:
+            cache = GameContextCache()
+        
+        # One park context per stadium, broadcast to every player in each game
+        home_teams = games_df['home_team'] if 'home_team' in games_df.columns else [''] * len(games_df)
+        games = pd.DataFrame([
+            cache.get('park', home_team, lambda home_team=home_team: self.park_context(home_team))
+            for home_team in home_teams
+        ])
+        games.insert(0, 'game_date', games_df['game_date'].values)
         
-        for _, game in games_df.iterrows():
-            game_date = game['game_date']
-            home_team = game.get('home_team', '')
-            stadium = self.TEAM_STADIUMS.get(home_team, 'Unknown')
-            
-            runs_f, hr_f, hits_f = self.get_park_factors(stadium)
-            
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                is_pitcher = player.get('position', '') in ['SP', 'RP', 'P']
-                
-                park_score = self.calculate_park_score(runs_f, hr_f, hits_f, is_pitcher)
-                
-                results.append({
-                    'player_name': player_name,
-                    'game_date': game_date,
-                    'stadium': stadium,
-                    'runs_factor': runs_f,
-                    'hr_factor': hr_f,
-                    'hits_factor': hits_f,
-                    'score': park_score
-                })
+        positions = roster_df['position'] if 'position' in roster_df.columns else pd.Series('', index=roster_df.index)
+        players = pd.DataFrame({
+            'player_name': roster_df['player_name'].values,
+            'is_pitcher': positions.isin(['SP', 'RP', 'P']).values,
+        })
         
-        return pd.DataFrame(results)
+        results = games.merge(players, how='cross')
+        results['score'] = np.where(results['is_pitcher'], results['pitcher_score'], results['hitter_score'])
+        return results[['player_name', 'game_date', 'stadium', 'runs_factor', 'hr_factor', 'hits_factor', 'score']]
     
-    def analyze_roster(self, roster_df, schedule_df, teams_df):
+    def analyze_roster(self, roster_df, schedule_df, teams_df=None, context=None,
+                       target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, roster_df)
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        return self.analyze(schedule_df, roster_df, cache_for(context))
@@ -22,6 +22,11 @@ Output:
 import pandas as pd
 from pathlib import Path
 
+try:
+    from .data_context import schedule_window
+except ImportError:
+    from data_context import schedule_window
+
 
 class PitchMixAnalyzer:
     """Analyze pitch mix and its impact on matchups"""
@@ -232,14 +237,11 @@ class PitchMixAnalyzer:
             return "Difficult matchup - facing mostly troublesome pitch types"
 
 
-    def analyze_roster(self, roster_df, schedule_df, players_df=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None,
+                       target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        if players_df is None and context is not None:
+            players_df = context.players
         return self.analyze(schedule_df, players_df, roster_df)
-    
-    def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
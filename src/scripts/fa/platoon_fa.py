@@ -23,9 +23,17 @@ Output:
 """
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 
+try:
+    from .stable_random import keyed_uniforms
+    from .data_context import schedule_window
+    from .game_log_loader import load_game_logs
+except ImportError:
+    from stable_random import keyed_uniforms
+    from data_context import schedule_window
+    from game_log_loader import load_game_logs
+
 
 class PlatoonFactorAnalyzer:
     """Analyze platoon matchup advantages"""
@@ -34,27 +42,29 @@ class PlatoonFactorAnalyzer:
         self.data_dir = Path(data_dir)
         self.player_handedness = {}
     
+    def load_player_handedness(self, player_names):
+        """Generate synthetic handedness for many players at once (~25% L, ~10% S, ~65% R)"""
+        names = [name for name in dict.fromkeys(player_names) if name not in self.player_handedness]
+        
+        for name, (rand, throw_rand) in zip(names, keyed_uniforms(names, n=2)):
+            bats = 'L' if rand < 0.25 else ('S' if rand < 0.35 else 'R')
+            throws = 'L' if throw_rand < 0.25 else 'R'
+            self.player_handedness[name] = (bats, throws)
+    
     def get_player_handedness(self, player_name):
         """Get or generate player handedness"""
-        if player_name in self.player_handedness:
-            return self.player_handedness[player_name]
-        
-        # Generate synthetic (~25% L, ~10% S, ~65% R)
-        np.random.seed(hash(player_name) % 2**32)
-        rand = np.random.random()
-        bats = 'L' if rand < 0.25 else ('S' if rand < 0.35 else 'R')
-        throws = 'L' if np.random.random() < 0.25 else 'R'
-        np.random.seed(None)
-        
-        self.player_handedness[player_name] = (bats, throws)
-        return (bats, throws)
+        if player_name not in self.player_handedness:
+            self.load_player_handedness([player_name])
+        return self.player_handedness[player_name]
+    
+    def pitcher_hand_key(self, opponent, game_date):
+        """Stable RNG key for a game's starting pitcher"""
+        return f"{opponent}|{pd.Timestamp(game_date).strftime('%Y-%m-%d')}"
     
     def get_pitcher_handedness(self, opponent, game_date):
         """Determine pitcher handedness (synthetic)"""
-        np.random.seed(hash(str(opponent) + str(game_date)) % 2**32)
-        pitcher_hand = 'L' if np.random.random() < 0.25 else 'R'
-        np.random.seed(None)
-        return pitcher_hand
+        rand = keyed_uniforms([self.pitcher_hand_key(opponent, game_date)])[0, 0]
+        return 'L' if rand < 0.25 else 'R'
     
     def calculate_platoon_score(self, bats, pitcher_hand, vs_lhp_ba, vs_rhp_ba, sample_size):
         """Calculate platoon advantage score"""
@@ -85,14 +95,22 @@ class PlatoonFactorAnalyzer:
         """Analyze platoon advantages"""
         results = []
         
-        # Convert dates once
-        games_df['game_date'] = pd.to_datetime(games_df['game_date'])
-        if len(game_logs_df) > 0:
-            game_logs_df['game_date'] = pd.to_datetime(game_logs_df['game_date'])
+        # Convert dates once (on local copies; the inputs are shared with other analyzers)
+        games_df = games_df.assign(game_date=pd.to_datetime(games_df['game_date']))
+        if len(game_logs_df) > 0 and not pd.api.types.is_datetime64_any_dtype(game_logs_df['game_date']):
+            game_logs_df = game_logs_df.assign(game_date=pd.to_datetime(game_logs_df['game_date']))
+        
+        # Draw every synthetic handedness up front
+        self.load_player_handedness(roster_df['player_name'])
+        opponents = games_df['opponent'] if 'opponent' in games_df.columns else pd.Series('', index=games_df.index)
+        pitcher_hand_draws = keyed_uniforms([
+            self.pitcher_hand_key(opponent, game_date)
+            for opponent, game_date in zip(opponents, games_df['game_date'])
+        ])[:, 0]
         
-        for _, game in games_df.iterrows():
+        for game_idx, (_, game) in enumerate(games_df.iterrows()):
             game_date = game['game_date']
-            opponent = game.get('opponent', '')
+            pitcher_hand = 'L' if pitcher_hand_draws[game_idx] < 0.25 else 'R'
             
             for _, player in roster_df.iterrows():
                 player_name = player['player_name']
@@ -103,7 +121,6 @@ class PlatoonFactorAnalyzer:
                     continue
                 
                 bats, throws = self.get_player_handedness(player_name)
-                pitcher_hand = self.get_pitcher_handedness(opponent, game_date)
                 
                 # Get historical splits
                 player_history = game_logs_df[
@@ -139,14 +156,15 @@ class PlatoonFactorAnalyzer:
         return pd.DataFrame(results)
 
 
-    def analyze_roster(self, roster_df, schedule_df, players_df=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None,
+                       target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, self._load_gamelogs(), roster_df)
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        return self.analyze(schedule_df, self._load_gamelogs(context), roster_df)
     
-    def _load_gamelogs(self):
+    def _load_gamelogs(self, context=None):
         """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+        if context is not None:
+            return context.game_logs
+        return load_game_logs(self.data_dir, 2024)
@@ -23,6 +23,13 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime, timedelta
 
+try:
+    from .game_log_index import GameLogIndex
+    from .game_log_loader import read_game_logs
+except ImportError:
+    from game_log_index import GameLogIndex
+    from game_log_loader import read_game_logs
+
 
 class RecentFormAnalyzer:
     """Analyze player recent form and streaks"""
@@ -32,7 +39,15 @@ class RecentFormAnalyzer:
     
     def calculate_rolling_stats(self, player_stats, window_days):
         """Calculate rolling statistics for a time window"""
-        if len(player_stats) == 0:
+        totals = {
+            col: player_stats[col].sum()
+            for col in GameLogIndex.STAT_COLUMNS if col in player_stats.columns
+        }
+        return self.stats_from_totals(totals, len(player_stats))
+    
+    def stats_from_totals(self, totals, games):
+        """Calculate rolling statistics from pre-summed stat totals over `games` games"""
+        if games == 0:
             return {
                 'games': 0,
                 'avg': 0.0,
@@ -46,11 +61,11 @@ class RecentFormAnalyzer:
             }
         
         # Calculate basic stats
-        total_ab = player_stats['AB'].sum()
-        total_h = player_stats['H'].sum()
-        total_bb = player_stats['BB'].sum()
-        total_hbp = player_stats['HBP'].sum() if 'HBP' in player_stats.columns else 0
-        total_sf = player_stats['SF'].sum() if 'SF' in player_stats.columns else 0
+        total_ab = totals['AB']
+        total_h = totals['H']
+        total_bb = totals.get('BB', 0)
+        total_hbp = totals.get('HBP', 0)
+        total_sf = totals.get('SF', 0)
         
         # Calculate AVG
         avg = total_h / total_ab if total_ab > 0 else 0.0
@@ -61,93 +76,133 @@ class RecentFormAnalyzer:
         
         # Calculate SLG (simplified - would need singles, doubles, triples, HR breakdown)
         total_tb = (
-            player_stats['1B'].sum() if '1B' in player_stats.columns else 0 +
-            player_stats['2B'].sum() * 2 if '2B' in player_stats.columns else 0 +
-            player_stats['3B'].sum() * 3 if '3B' in player_stats.columns else 0 +
-            player_stats['HR'].sum() * 4
+            totals['1B'] if '1B' in totals else 0 +
+            totals['2B'] * 2 if '2B' in totals else 0 +
+            totals['3B'] * 3 if '3B' in totals else 0 +
+            totals['HR'] * 4
         )
         slg = total_tb / total_ab if total_ab > 0 else 0.0
         
         return {
-            'games': len(player_stats),
+            'games': games,
             'avg': round(avg, 3),
             'obp': round(obp, 3),
             'slg': round(slg, 3),
             'ops': round(obp + slg, 3),
-            'hr': int(player_stats['HR'].sum()) if 'HR' in player_stats.columns else 0,
-            'rbi': int(player_stats['RBI'].sum()) if 'RBI' in player_stats.columns else 0,
-            'runs': int(player_stats['R'].sum()) if 'R' in player_stats.columns else 0,
-            'sb': int(player_stats['SB'].sum()) if 'SB' in player_stats.columns else 0
+            'hr': int(totals['HR']) if 'HR' in totals else 0,
+            'rbi': int(totals['RBI']) if 'RBI' in totals else 0,
+            'runs': int(totals['R']) if 'R' in totals else 0,
+            'sb': int(totals['SB']) if 'SB' in totals else 0
         }
     
-    def detect_hot_streak(self, recent_games):
-        """Detect if player is on a hot streak"""
-        if len(recent_games) < 5:
-            return False, 0
-        
-        # Check last 5-10 games for hitting streak
-        last_10 = recent_games.head(10)
+    def longest_runs(self, weights, breaks, group_starts, n_groups):
+        """
+        Run-length encoding over concatenated per-player rows: the largest sum
+        of weights in a run, per player. A run starts at each player's first
+        row and at every row where breaks is True (that row opens the new run).
+        """
+        new_run = breaks.copy()
+        new_run[group_starts[group_starts < len(new_run)]] = True
+        
+        run_ids = np.cumsum(new_run) - 1
+        run_sums = np.bincount(run_ids, weights=weights, minlength=int(new_run.sum())).astype(np.int64)
+        run_groups = np.repeat(np.arange(n_groups), np.diff(np.append(group_starts, len(new_run))))[new_run]
+        
+        longest = np.zeros(n_groups, dtype=np.int64)
+        np.maximum.at(longest, run_groups, run_sums)
+        return longest
+    
+    def streak_flags(self, h, ab, lengths):
+        """
+        Hot and cold streaks for many players in one pass
+        
+        h, ab: per-game hits and at-bats, each player's games concatenated
+        most recent first; lengths: number of games per player.
+        Returns (is_hot, hit_streak, is_cold, slump_length) arrays, one entry per player.
+        """
+        h = np.asarray(h)
+        ab = np.asarray(ab)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        n = len(lengths)
+        
+        group_starts = np.cumsum(lengths) - lengths
+        groups = np.repeat(np.arange(n), lengths)
+        position = np.arange(len(h)) - np.repeat(group_starts, lengths)
         
         # Hot streak criteria:
-        # 1. Hit in 5+ consecutive games, OR
+        # 1. Hit in 5+ consecutive games (last 10), OR
         # 2. Batting .350+ over last 7 games with 20+ ABs
+        hit = (h > 0) & (position < 10)
+        hit_streak = self.longest_runs(hit.astype(np.int64), ~hit, group_starts, n)
         
-        consecutive_hits = 0
-        max_streak = 0
-        
-        for _, game in last_10.iterrows():
-            if game.get('H', 0) > 0:
-                consecutive_hits += 1
-                max_streak = max(max_streak, consecutive_hits)
-            else:
-                consecutive_hits = 0
-        
-        # Check batting average hot streak
-        last_7 = recent_games.head(7)
-        total_ab = last_7['AB'].sum() if 'AB' in last_7.columns else 0
-        total_h = last_7['H'].sum() if 'H' in last_7.columns else 0
-        recent_avg = total_h / total_ab if total_ab >= 20 else 0
-        
-        is_hot = max_streak >= 5 or (recent_avg >= 0.350 and total_ab >= 20)
+        # Cold streak criteria:
+        # 1. 0-for-10 or worse in recent ABs (last 15 games), OR
+        # 2. Batting under .150 in last 7 games with 20+ ABs
+        #
+        # Each game's at-bats read as its hits then its outs, so a hitless run
+        # is the outs of one game plus those of the following hitless games
+        ab_counted = np.where(position < 15, np.maximum(ab, 0), 0)
+        game_hits = np.clip(h, 0, ab_counted)
+        slump_length = self.longest_runs(ab_counted - game_hits, game_hits > 0, group_starts, n)
+        
+        last_7 = position < 7
+        total_ab = np.bincount(groups, weights=np.where(last_7, ab, 0), minlength=n)
+        total_h = np.bincount(groups, weights=np.where(last_7, h, 0), minlength=n)
+        with np.errstate(divide='ignore', invalid='ignore'):
+            recent_avg = np.where(total_ab >= 20, total_h / total_ab, 0.0)
+        
+        enough = lengths >= 5
+        is_hot = enough & ((hit_streak >= 5) | ((recent_avg >= 0.350) & (total_ab >= 20)))
+        is_cold = enough & ((slump_length >= 10) | ((recent_avg < 0.150) & (total_ab >= 20)))
+        
+        return is_hot, np.where(enough, hit_streak, 0), is_cold, np.where(enough, slump_length, 0)
+    
+    def streak_table(self, index, players, as_of_date):
+        """{player: (is_hot, hit_streak, is_cold, slump_length)} over each player's last 15 games before as_of_date"""
+        ends = []
+        lengths = []
+        for player in players:
+            start, end = index.window(player, None, as_of_date)
+            ends.append(end)
+            lengths.append(min(end - start, 15))
+        ends = np.asarray(ends, dtype=np.int64)
+        lengths = np.asarray(lengths, dtype=np.int64)
+        
+        # Row positions of each player's recent games, most recent first
+        offsets = np.repeat(np.cumsum(lengths) - lengths, lengths)
+        rows = np.repeat(ends - 1, lengths) - (np.arange(lengths.sum()) - offsets)
+        
+        h = index.df['H'].values[rows]
+        ab = index.df['AB'].values[rows]
+        
+        flags = self.streak_flags(h, ab, lengths)
+        return {
+            player: (bool(hot), int(streak), bool(cold), int(slump))
+            for player, hot, streak, cold, slump in zip(players, *flags)
+        }
+    
+    def _recent_arrays(self, recent_games):
+        """H and AB of recent games (zeros for a missing column)"""
+        zeros = np.zeros(len(recent_games), dtype=np.int64)
+        h = recent_games['H'].values if 'H' in recent_games.columns else zeros
+        ab = recent_games['AB'].values if 'AB' in recent_games.columns else zeros
+        return h, ab
+    
+    def detect_hot_streak(self, recent_games):
+        """Detect if player is on a hot streak (recent_games most recent first)"""
+        if len(recent_games) < 5:
+            return False, 0
         
-        return is_hot, max_streak
+        is_hot, hit_streak, _, _ = self.streak_flags(*self._recent_arrays(recent_games), [len(recent_games)])
+        return bool(is_hot[0]), int(hit_streak[0])
     
     def detect_cold_streak(self, recent_games):
-        """Detect if player is in a slump"""
+        """Detect if player is in a slump (recent_games most recent first)"""
         if len(recent_games) < 5:
             return False, 0
         
-        # Cold streak criteria:
-        # 1. 0-for-10 or worse in recent ABs, OR
-        # 2. Batting under .150 in last 7 games with 20+ ABs
-        
-        # Check hitless at-bats
-        recent_abs = []
-        for _, game in recent_games.head(15).iterrows():
-            ab = game.get('AB', 0)
-            h = game.get('H', 0)
-            if ab > 0:
-                recent_abs.extend([1 if i < h else 0 for i in range(ab)])
-        
-        # Count consecutive hitless ABs
-        consecutive_outs = 0
-        max_slump = 0
-        for ab in recent_abs:
-            if ab == 0:
-                consecutive_outs += 1
-                max_slump = max(max_slump, consecutive_outs)
-            else:
-                consecutive_outs = 0
-        
-        # Check batting average slump
-        last_7 = recent_games.head(7)
-        total_ab = last_7['AB'].sum() if 'AB' in last_7.columns else 0
-        total_h = last_7['H'].sum() if 'H' in last_7.columns else 0
-        recent_avg = total_h / total_ab if total_ab >= 20 else 0.300  # Assume average if small sample
-        
-        is_cold = max_slump >= 10 or (recent_avg < 0.150 and total_ab >= 20)
-        
-        return is_cold, max_slump
+        _, _, is_cold, slump_length = self.streak_flags(*self._recent_arrays(recent_games), [len(recent_games)])
+        return bool(is_cold[0]), int(slump_length[0])
     
     def calculate_form_score(self, recent_stats, season_stats):
         """Calculate form score comparing recent performance to season average"""
@@ -168,36 +223,41 @@ class RecentFormAnalyzer:
         
         return round(form_score, 2)
     
-    def analyze_player_form(self, player_name, player_stats_df, as_of_date=None):
-        """Analyze recent form for a single player"""
+    def analyze_player_form(self, player_name, player_stats_df, as_of_date=None, index=None, streaks=None):
+        """Analyze recent form for a single player
+        
+        Pass a GameLogIndex (covering this player) as `index` to skip
+        re-sorting the player's games; player_stats_df is then ignored.
+        streaks: the player's entry from streak_table, if already computed.
+        """
         if as_of_date is None:
             as_of_date = datetime.now()
         
-        # Filter to games before as_of_date
-        player_stats_df['game_date'] = pd.to_datetime(player_stats_df['game_date'])
-        recent_games = player_stats_df[player_stats_df['game_date'] < as_of_date].copy()
-        recent_games = recent_games.sort_values('game_date', ascending=False)
+        if index is None:
+            index = GameLogIndex(player_stats_df.assign(player_name=player_name))
         
-        if len(recent_games) == 0:
-            return None
+        # Games before as_of_date, and the 7/14/30 day windows within them
+        season_start, season_end = index.window(player_name, None, as_of_date)
         
-        # Calculate rolling windows
-        cutoff_7 = as_of_date - timedelta(days=7)
-        cutoff_14 = as_of_date - timedelta(days=14)
-        cutoff_30 = as_of_date - timedelta(days=30)
+        if season_end == season_start:
+            return None
         
-        last_7_days = recent_games[recent_games['game_date'] >= cutoff_7]
-        last_14_days = recent_games[recent_games['game_date'] >= cutoff_14]
-        last_30_days = recent_games[recent_games['game_date'] >= cutoff_30]
+        windows = {}
+        for days in (7, 14, 30):
+            start, end = index.window(player_name, as_of_date - timedelta(days=days), as_of_date)
+            windows[days] = self.stats_from_totals(index.totals(start, end), end - start)
         
-        stats_7 = self.calculate_rolling_stats(last_7_days, 7)
-        stats_14 = self.calculate_rolling_stats(last_14_days, 14)
-        stats_30 = self.calculate_rolling_stats(last_30_days, 30)
-        season_stats = self.calculate_rolling_stats(recent_games, 365)
+        stats_7 = windows[7]
+        stats_14 = windows[14]
+        stats_30 = windows[30]
+        season_stats = self.stats_from_totals(
+            index.totals(season_start, season_end), season_end - season_start
+        )
         
-        # Detect streaks
-        is_hot, hit_streak = self.detect_hot_streak(recent_games)
-        is_cold, slump_length = self.detect_cold_streak(recent_games)
+        # Detect streaks (last 15 games)
+        if streaks is None:
+            streaks = self.streak_table(index, [player_name], as_of_date)[player_name]
+        is_hot, hit_streak, is_cold, slump_length = streaks
         
         # Calculate form score
         form_score = self.calculate_form_score(stats_7, season_stats)
@@ -261,7 +321,7 @@ class RecentFormAnalyzer:
         else:
             return 'Cold'
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, target_date=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, target_date=None, context=None):
         """Analyze recent form for all players on roster"""
         if target_date is None:
             target_date = datetime.now()
@@ -271,7 +331,15 @@ class RecentFormAnalyzer:
         # Load game logs
         game_log_file = self.data_dir / "mlb_game_logs_2024.csv"
         
-        if not game_log_file.exists():
+        if context is not None:
+            game_logs_df = context.game_logs
+        elif game_log_file.exists():
+            print(f"Loading game logs from {game_log_file.name}...")
+            game_logs_df = read_game_logs(game_log_file)
+        else:
+            game_logs_df = pd.DataFrame()
+        
+        if game_logs_df.empty:
             print(f"⚠️  Game log file not found: {game_log_file.name}")
             print("   Run: python src/scripts/scrape/gamelog_scrape.py")
             print("   Using placeholder data for now...\n")
@@ -291,20 +359,21 @@ class RecentFormAnalyzer:
                 })
             return pd.DataFrame(results)
         
-        # Load game logs
-        print(f"Loading game logs from {game_log_file.name}...")
-        game_logs_df = pd.read_csv(game_log_file)
-        game_logs_df['game_date'] = pd.to_datetime(game_logs_df['game_date'])
+        # Per-player sorted index (shared across batches when a context is given)
+        if context is not None:
+            index = context.game_log_index
+        else:
+            index = GameLogIndex(game_logs_df)
+        
+        # Streaks for every roster player at once
+        streaks = self.streak_table(index, [p for p in roster_df['player_name'] if p in index], target_date)
         
         results = []
         
         for _, player in roster_df.iterrows():
             player_name = player['player_name']
             
-            # Get player's game log
-            player_games = game_logs_df[game_logs_df['player_name'] == player_name].copy()
-            
-            if len(player_games) == 0:
+            if player_name not in index:
                 print(f"  {player_name}: No game log data found")
                 results.append({
                     'player_name': player_name,
@@ -316,7 +385,8 @@ class RecentFormAnalyzer:
                 continue
             
             # Analyze player form
-            form_data = self.analyze_player_form(player_name, player_games, target_date)
+            form_data = self.analyze_player_form(player_name, None, target_date, index=index,
+                                                 streaks=streaks[player_name])
             
             if form_data:
                 results.append(form_data)
@@ -19,9 +19,19 @@ Output:
 - Rested vs back-to-back splits
 """
 
+import numpy as np
 import pandas as pd
 from pathlib import Path
 
+try:
+    from .data_context import schedule_window
+    from .game_log_index import DAY_NS, GameLogIndex
+    from .game_log_loader import load_game_logs
+except ImportError:
+    from data_context import schedule_window
+    from game_log_index import DAY_NS, GameLogIndex
+    from game_log_loader import load_game_logs
+
 
 class RestDayFactorAnalyzer:
     """Analyze rest day performance impacts"""
@@ -30,88 +40,73 @@ class RestDayFactorAnalyzer:
         self.data_dir = Path(data_dir)
     
     def calculate_rest_score(self, rested_ba, b2b_ba, is_rested, sample_size):
-        """Calculate rest advantage score"""
-        if rested_ba == 0 and b2b_ba == 0:
-            return 0.0
-        
+        """Calculate rest advantage score (all arguments may be arrays)"""
         ba_diff = rested_ba - b2b_ba
+        rest_score = np.where(is_rested, ba_diff, -ba_diff) * 10
         
-        if is_rested:
-            rest_score = ba_diff * 10
-        else:
-            rest_score = -ba_diff * 10
-        
-        confidence = min(sample_size / 10, 1.0)
+        confidence = np.minimum(sample_size / 10, 1.0)
         rest_score *= confidence
         
-        return max(-2.0, min(2.0, rest_score))
+        rest_score = np.clip(rest_score, -2.0, 2.0)
+        return np.where((rested_ba == 0) & (b2b_ba == 0), 0.0, rest_score)
     
-    def analyze(self, games_df, game_logs_df, roster_df):
-        """Analyze rest day advantages"""
-        results = []
+    def analyze(self, games_df, game_logs_df, roster_df, index=None):
+        """Analyze rest day advantages
+        
+        Rested (2+ days off) and back-to-back totals before each game come
+        from the GameLogIndex 'rested' split (index built here unless the
+        run's shared index is passed in). Of a doubleheader, the game listed
+        first in the logs carries the days off and the second one is back-to-back.
+        """
+        if index is None:
+            index = GameLogIndex(game_logs_df)
+        
+        # As-of totals for every (game, player) pair: arrays of shape [games x players]
+        player_names = roster_df['player_name'].values
+        game_dates = games_df['game_date']
+        totals = index.as_of_totals(player_names, game_dates)
+        rested = index.as_of_totals(player_names, game_dates, split=index.REST_SPLIT)
+        last_dates = index.as_of_last_dates(player_names, game_dates)
+        
+        # Rows in game order, then roster order; only players with 5+ games of history
+        enough_history = (totals['games'] >= 5).ravel()
+        if not enough_history.any():
+            return pd.DataFrame()
+        
+        pick = lambda table: table.ravel()[enough_history]
+        rested_ab, rested_hits = pick(rested['AB']), pick(rested['H'])
+        b2b_ab, b2b_hits = pick(totals['AB']) - rested_ab, pick(totals['H']) - rested_hits
+        
+        with np.errstate(divide='ignore', invalid='ignore'):
+            rested_ba = np.where(rested_ab > 0, rested_hits / rested_ab, 0)
+            b2b_ba = np.where(b2b_ab > 0, b2b_hits / b2b_ab, 0)
+        
+        # Days since last game
+        date_values = pd.to_datetime(game_dates).values.astype('datetime64[ns]').astype(np.int64)
+        days_since = (np.repeat(date_values, len(player_names))[enough_history] - pick(last_dates)) // DAY_NS
+        is_rested = days_since >= 2
         
-        for _, game in games_df.iterrows():
-            game_date = game['game_date']
-            
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                
-                # Get player history
-                player_history = game_logs_df[
-                    (game_logs_df['player_name'] == player_name) &
-                    (game_logs_df['game_date'] < game_date)
-                ].sort_values('game_date').copy()
-                
-                # Ensure game_date is datetime
-                player_history['game_date'] = pd.to_datetime(player_history['game_date'])
-                
-                if len(player_history) >= 5:
-                    # Calculate days between games
-                    player_history['days_rest'] = (
-                        player_history['game_date'] - player_history['game_date'].shift(1)
-                    ).dt.days.fillna(0)
-                    
-                    # Rested games (2+ days)
-                    rested = player_history[player_history['days_rest'] >= 2]
-                    rested_ab = rested['AB'].sum()
-                    rested_hits = rested['H'].sum()
-                    rested_ba = rested_hits / rested_ab if rested_ab > 0 else 0
-                    
-                    # Back-to-back games (0-1 days)
-                    b2b = player_history[player_history['days_rest'] <= 1]
-                    b2b_ab = b2b['AB'].sum()
-                    b2b_hits = b2b['H'].sum()
-                    b2b_ba = b2b_hits / b2b_ab if b2b_ab > 0 else 0
-                    
-                    # Days since last game
-                    last_game = player_history['game_date'].max()
-                    days_since = (pd.to_datetime(game_date) - last_game).days
-                    is_rested = days_since >= 2
-                    
-                    rest_score = self.calculate_rest_score(
-                        rested_ba, b2b_ba, is_rested, len(player_history)
-                    )
-                    
-                    results.append({
-                        'player_name': player_name,
-                        'game_date': game_date,
-                        'days_since_last_game': days_since,
-                        'rested_ba': round(rested_ba, 3),
-                        'back_to_back_ba': round(b2b_ba, 3),
-                        'rest_score': rest_score
-                    })
+        rest_score = self.calculate_rest_score(rested_ba, b2b_ba, is_rested, pick(totals['games']))
         
-        return pd.DataFrame(results)
+        return pd.DataFrame({
+            'player_name': np.tile(player_names, len(games_df))[enough_history],
+            'game_date': np.repeat(game_dates.values, len(player_names))[enough_history],
+            'days_since_last_game': days_since,
+            'rested_ba': np.round(rested_ba, 3),
+            'back_to_back_ba': np.round(b2b_ba, 3),
+            'rest_score': rest_score
+        })
 
 
-    def analyze_roster(self, roster_df, schedule_df, ):
+    def analyze_roster(self, roster_df, schedule_df, context=None, target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, self._load_gamelogs(), roster_df)
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        index = context.game_log_index if context is not None else None
+        return self.analyze(schedule_df, self._load_gamelogs(context), roster_df, index)
     
-    def _load_gamelogs(self):
+    def _load_gamelogs(self, context=None):
         """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+        if context is not None:
+            return context.game_logs
+        return load_game_logs(self.data_dir, 2024)
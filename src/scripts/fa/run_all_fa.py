@@ -2,54 +2,290 @@
 """
 Run All Factor Analyses
 
-Executes all 20 factor analyses and saves results to CSV files.
+Executes the factor analyses declared in factor_registry.py (all 20 by
+default) and saves results to CSV files.
 This is a wrapper that runs each FA module and saves outputs.
 
 Usage:
     python src/scripts/run_all_fa.py
     python src/scripts/run_all_fa.py --date 2025-09-28
+    python src/scripts/run_all_fa.py --all-players --workers 8
+    python src/scripts/run_all_fa.py --date 2025-09-28 --window-days 1   # only that day's games
+    python src/scripts/run_all_fa.py --factors wind,park,temperature      # a subset of factors
+    python src/scripts/run_all_fa.py --all-players --resume               # continue an interrupted run
+
+Every run is checkpointed: fa_run_<suffix>_<timestamp>.json records the run's
+settings, and each factor's CSV is streamed with a per-batch checkpoint (see
+factor_output.py). --resume picks up the latest unfinished run of the same
+mode, keeps its timestamp and settings, skips factors whose CSV is complete and
+continues partial factors from their last finished batch.
 """
 
 import sys
+import json
+import time
+import hashlib
 import pandas as pd
 from pathlib import Path
 from datetime import datetime
 import argparse
+from collections import Counter
+from concurrent.futures import ProcessPoolExecutor, as_completed
 
 # Add src to path
 sys.path.insert(0, str(Path(__file__).parent.parent))
 
-from scripts.fa import (
-    wind_analysis,
-    matchup_fa,
-    home_away_fa,
-    rest_day_fa,
-    injury_fa,
-    umpire_fa,
-    platoon_fa,
-    temperature_fa,
-    pitch_mix_fa,
-    park_factors_fa,
-    lineup_position_fa,
-    time_of_day_fa,
-    defensive_positions_fa,
-    recent_form_fa,
-    bullpen_fatigue_fa,
-    humidity_elevation_fa,
-    monthly_splits_fa,
-    team_momentum_fa,
-    statcast_metrics_fa,
-    vegas_odds_fa
-)
-
-
-def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False):
-    """Run all 17 factor analyses and save outputs
+from scripts.fa.data_context import FactorDataContext, schedule_window
+from scripts.fa.factor_matrix import build_factor_matrix, save_factor_matrix
+from scripts.fa.factor_output import FactorOutputWriter, read_factor_scores
+from scripts.fa.factor_registry import get_factor, select_factors, required_inputs
+from scripts.fa.game_context_cache import format_cache_stats
+
+
+# A full run succeeds if at least this many factors complete; a --factors run needs all of them
+MIN_FACTORS_COMPLETED = 17
+
+
+def format_minutes(seconds):
+    """Rough duration for progress lines"""
+    if seconds < 90:
+        return f"{seconds:.0f}s"
+    return f"{seconds / 60:.1f} min"
+
+
+def process_in_batches(analyzer_func, roster_df, batch_size, writer, *args, **kwargs):
+    """
+    Process roster in batches, appending each batch's results to writer as it finishes
+    
+    Batches the writer already holds (writer.batches, when resuming) are skipped.
+    Returns the number of batches computed.
+    """
+    num_batches = (len(roster_df) + batch_size - 1) // batch_size
+    if num_batches <= 1:
+        if writer.batches:
+            return 0
+        writer.append(analyzer_func(roster_df, *args, **kwargs))
+        return 1
+    
+    first_batch = writer.batches
+    start_time = time.perf_counter()
+    for batch_num in range(first_batch, num_batches):
+        start_idx = batch_num * batch_size
+        end_idx = min((batch_num + 1) * batch_size, len(roster_df))
+        batch_roster = roster_df.iloc[start_idx:end_idx].copy()
+        
+        writer.append(analyzer_func(batch_roster, *args, **kwargs))
+        
+        if batch_num % 5 == 4:  # Progress every 5 batches, ETA from this factor's measured batch time
+            per_batch = (time.perf_counter() - start_time) / (batch_num + 1 - first_batch)
+            eta = format_minutes(per_batch * (num_batches - batch_num - 1))
+            print(f"    [{batch_num + 1}/{num_batches} batches, ~{eta} left]", end='\r')
+    
+    print(f"    [{num_batches}/{num_batches} batches] ✓" + (f" (resumed at batch {first_batch + 1})" if first_batch else ""))
+    return num_batches - first_batch
+
+
+def run_factor(spec, job):
+    """
+    Run one factor analysis over the roster, streaming its CSV batch by batch
+    
+    Returns (output path, (scores_df, score column), cache counts, batches computed) -
+    the scores narrowed for the factor matrix (see factor_matrix.factor_scores)
+    and this factor's game context cache hits/misses. When resuming, a factor
+    whose CSV is already complete is not run again: its scores are read back.
+    """
+    context = job['context']
+    args = spec.roster_args(context)
+    kwargs = spec.roster_kwargs(context, job['as_of_date'], job['window_days'])
+    
+    output_file = job['data_dir'] / f"{spec.output_prefix}_{job['file_suffix']}_{job['timestamp']}.csv"
+    if job['resume'] and output_file.exists():
+        return output_file, read_factor_scores(output_file, spec.score_column), Counter(), 0
+    
+    if job['resume']:
+        writer = FactorOutputWriter.resume(output_file, spec.score_column)
+    else:
+        writer = FactorOutputWriter(output_file, spec.score_column, checkpoint=True)
+    
+    analyzer = spec.create(job['data_dir'])
+    cache_before = context.game_cache.snapshot()
+    batches_run = process_in_batches(analyzer.analyze_roster, job['roster_df'], job['batch_size'], writer, *args, **kwargs)
+    cache_counts = context.game_cache.snapshot() - cache_before
+    
+    return writer.close(), writer.scores(), cache_counts, batches_run
+
+
+class RunProgress:
+    """Run-level ETA from the measured time per (factor, batch) unit computed so far"""
+    
+    def __init__(self, num_factors, num_batches):
+        self.num_batches = num_batches
+        self.remaining = num_factors * num_batches
+        self.computed = 0
+        self.start_time = time.perf_counter()
+    
+    def factor_done(self, batches_run):
+        """Record a finished (or failed) factor; returns an ETA line for the rest, or None"""
+        self.remaining -= self.num_batches
+        self.computed += batches_run
+        if not self.computed or not self.remaining:
+            return None
+        per_unit = (time.perf_counter() - self.start_time) / self.computed
+        return f"⏱  ~{format_minutes(per_unit * self.remaining)} left ({per_unit:.2f}s per factor batch)"
+
+
+def run_factors_sequential(job, specs):
+    """Run the factor analyses one after another in registry order; returns (output files, scores, cache counts)"""
+    results = {}
+    scores = {}
+    cache_counts = Counter()
+    total = len(specs)
+    progress = RunProgress(total, job['num_batches'])
+    
+    for i, spec in enumerate(specs, 1):
+        print(f"{i}/{total} {spec.label}...")
+        batches_run = 0
+        try:
+            output_file, scores[spec.key], counts, batches_run = run_factor(spec, job)
+            results[spec.key] = output_file
+            cache_counts += counts
+            print(f"  ✓ Saved to {output_file.name}" if batches_run else f"  ✓ Already complete: {output_file.name}")
+        except Exception as e:
+            print(f"  ✗ Error: {e}")
+        eta = progress.factor_done(batches_run)
+        if eta and job['num_batches'] > 1:
+            print(f"  {eta}")
+    
+    return results, scores, cache_counts
+
+
+# Shared inputs for pool workers, set once per process by _init_worker
+_worker_job = None
+
+
+def _init_worker(job):
+    """Receive the shared inputs once per worker process instead of once per task"""
+    global _worker_job
+    _worker_job = job
+
+
+def _run_factor_in_worker(key):
+    """Pool task: run one factor and report (key, (output file, scores, cache counts, batches computed), error)"""
+    try:
+        return key, run_factor(get_factor(key), _worker_job), None
+    except Exception as e:
+        return key, None, str(e)
+
+
+def run_factors_parallel(job, specs, workers):
+    """Fan the factor analyses out over a process pool, collecting them as they finish"""
+    results = {}
+    scores = {}
+    cache_counts = Counter()
+    total = len(specs)
+    progress = RunProgress(total, job['num_batches'])
+    print(f"⚡ Running {total} factor analyses on {workers} worker processes\n")
+    
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(job,)) as executor:
+        futures = {executor.submit(_run_factor_in_worker, spec.key): spec for spec in specs}
+        
+        for done, future in enumerate(as_completed(futures), 1):
+            spec = futures[future]
+            try:
+                _, outcome, error = future.result()
+            except Exception as e:
+                # Worker process died (e.g. out of memory)
+                outcome, error = None, f"Worker error: {e}"
+            
+            batches_run = 0
+            if error is None:
+                output_file, scores[spec.key], counts, batches_run = outcome
+                results[spec.key] = output_file
+                cache_counts += counts
+                status = "Saved to" if batches_run else "Already complete:"
+                print(f"[{done}/{total}] {spec.label}: ✓ {status} {output_file.name}")
+            else:
+                print(f"[{done}/{total}] {spec.label}: ✗ Error: {error}")
+            
+            eta = progress.factor_done(batches_run)
+            if eta and job['num_batches'] > 1:
+                print(f"    {eta}")
+    
+    return results, scores, cache_counts
+
+
+def save_run_factor_matrix(job, results, scores):
+    """Combine the completed factors' scores into one matrix file plus run manifest"""
+    # Factor matrix columns follow registry order, whatever order they finished in
+    keys = [spec.key for spec in job['factors'] if spec.key in scores and scores[spec.key][0] is not None]
+    matrix = build_factor_matrix({k: scores[k][0] for k in keys}, job['roster_df'], job['context'].players)
+    
+    manifest = {
+        'timestamp': job['timestamp'],
+        'as_of_date': job['as_of_date'].strftime('%Y-%m-%d'),
+        'mode': job['file_suffix'],
+        'window_days': job['window_days'],
+        'score_columns': {k: scores[k][1] for k in keys},
+        'source_files': {k: results[k].name for k in keys},
+        'failed_factors': [spec.key for spec in job['factors'] if spec.key not in results],
+        'no_score_factors': [k for k in results if k not in keys],
+    }
+    return save_factor_matrix(matrix, job['data_dir'], job['file_suffix'], job['timestamp'], manifest)
+
+
+def run_checkpoint_file(data_dir, file_suffix, timestamp):
+    """Path of a run's checkpoint: its settings and whether every factor finished"""
+    return data_dir / f"fa_run_{file_suffix}_{timestamp}.json"
+
+
+def roster_digest(roster_df):
+    """Fingerprint of the analyzed players, so a resumed run batches the same roster"""
+    names = roster_df['player_name'].astype(str) if 'player_name' in roster_df.columns else pd.Series(dtype=str)
+    return hashlib.sha1('\n'.join(names).encode()).hexdigest()
+
+
+def save_run_checkpoint(job, factors, complete=False):
+    """Write the run's settings so --resume can continue it with the same timestamp"""
+    state = {
+        'timestamp': job['timestamp'],
+        'as_of_date': job['as_of_date'].strftime('%Y-%m-%d'),
+        'mode': job['file_suffix'],
+        'window_days': job['window_days'],
+        'factors': factors,
+        'batch_size': job['batch_size'],
+        'players': len(job['roster_df']),
+        'roster_digest': roster_digest(job['roster_df']),
+        'complete': complete,
+    }
+    with open(run_checkpoint_file(job['data_dir'], job['file_suffix'], job['timestamp']), 'w') as f:
+        json.dump(state, f, indent=2)
+
+
+def latest_unfinished_run(data_dir, file_suffix):
+    """Checkpoint of the most recent run of this mode if it did not finish, else None"""
+    checkpoints = sorted(data_dir.glob(f"fa_run_{file_suffix}_*.json"))
+    if not checkpoints:
+        return None
+    with open(checkpoints[-1]) as f:
+        state = json.load(f)
+    return None if state['complete'] else state
+
+
+def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False, workers=1, window_days=None,
+                            factors=None, resume=False):
+    """Run the factor analyses and save outputs
     
     Args:
         data_dir: Path to data directory
         as_of_date: Target date for analysis (datetime or str). Defaults to today.
         all_players: If True, analyze all MLB players. If False, analyze only rostered players.
+        workers: Number of worker processes. 1 (default) runs the analyzers one after another.
+        window_days: Only analyze games from as_of_date through as_of_date + window_days - 1.
+                     None (default) analyzes the whole season schedule.
+        factors: Factor keys to run (list or 'wind,park' string, see factor_registry).
+                 None (default) runs every factor. Only the inputs they need are loaded.
+        resume: Continue the latest unfinished run of this mode (its date, window and
+                factors replace the arguments). Starts a new run if there is none.
     """
     
     # Parse as_of_date
@@ -60,6 +296,27 @@ def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False):
     
     timestamp = datetime.now().strftime("%Y%m%d_%H%M%S")
     
+    # Determine output file suffix
+    file_suffix = "all_players" if all_players else "roster"
+    
+    resume_state = latest_unfinished_run(data_dir, file_suffix) if resume else None
+    if resume and resume_state is None:
+        print(f"⚠️  No unfinished {file_suffix} run to resume - starting a new run")
+    elif resume_state:
+        timestamp = resume_state['timestamp']
+        as_of_date = datetime.strptime(resume_state['as_of_date'], "%Y-%m-%d")
+        window_days = resume_state['window_days']
+        factors = resume_state['factors']
+        print(f"↻ Resuming run {timestamp} (date {resume_state['as_of_date']}, "
+              f"window {window_days or 'whole season'}, factors {', '.join(factors) if factors else 'all'})")
+    
+    try:
+        specs = select_factors(factors)
+        inputs = required_inputs(specs)
+    except ValueError as e:
+        print(f"❌ {e}")
+        return False
+    
     # Load required data
     print(f"Loading data files for analysis date: {as_of_date.strftime('%Y-%m-%d')}...")
     
@@ -122,16 +379,31 @@ def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False):
         if 'name' in roster_df.columns and 'player_name' not in roster_df.columns:
             roster_df['player_name'] = roster_df['name']
     
-    # Load other data files
+    if resume_state and roster_digest(roster_df) != resume_state['roster_digest']:
+        print(f"❌ The players to analyze changed since run {timestamp} - cannot resume it")
+        return False
+    
+    if factors is not None:
+        print(f"Factors: {', '.join(spec.key for spec in specs)} (inputs: {', '.join(inputs)})")
+    
+    # Load the inputs the selected factors declare, once; every analyzer shares the same context
     try:
-        schedule_2025 = pd.read_csv(data_dir / "mlb_2025_schedule.csv")
-        weather = pd.read_csv(data_dir / "mlb_stadium_weather.csv")
-        players_complete = pd.read_csv(data_dir / "mlb_all_players_complete.csv")
-        teams = pd.read_csv(data_dir / "mlb_all_teams.csv")
+        context = FactorDataContext(data_dir).preload(inputs)
+        schedule_2025 = context.schedule
         
         print(f"✓ Loaded {len(schedule_2025)} games from 2025 schedule")
-        print(f"✓ Loaded weather for {len(weather)} stadiums")
-        print(f"✓ Loaded {len(players_complete)} player records")
+        if window_days:
+            window_games = schedule_window(schedule_2025, as_of_date, window_days)
+            print(f"✓ Window: {len(window_games)} games in {window_days} day(s) from {as_of_date.strftime('%Y-%m-%d')}")
+        if 'weather' in inputs:
+            print(f"✓ Loaded weather for {len(context.weather)} stadiums")
+        if 'players' in inputs:
+            print(f"✓ Loaded {len(context.players)} player records")
+        if 'game_logs' in inputs:
+            if context.game_logs.empty:
+                print(f"⚠️  No {context.gamelog_season} game logs found (history-based factors will be neutral)")
+            else:
+                print(f"✓ Loaded {len(context.game_logs)} game log rows from {context.gamelog_season}")
         
     except Exception as e:
         print(f"❌ Error loading data files: {e}")
@@ -145,284 +417,53 @@ def run_all_factor_analyses(data_dir: Path, as_of_date=None, all_players=False):
     
     if all_players and num_batches > 1:
         print(f"📦 Processing {len(roster_df)} players in {num_batches} batches of {batch_size}")
-        print(f"   This will take approximately {num_batches * 2} minutes\n")
-    
-    # Track results
-    results = {}
-    
-    # Determine output file suffix
-    file_suffix = "all_players" if all_players else "roster"
-    
-    # Helper function to process in batches
-    def process_in_batches(analyzer_func, *args, **kwargs):
-        """Process roster in batches and combine results"""
-        if num_batches == 1:
-            return analyzer_func(*args, **kwargs)
-        
-        all_results = []
-        for batch_num in range(num_batches):
-            start_idx = batch_num * batch_size
-            end_idx = min((batch_num + 1) * batch_size, len(roster_df))
-            batch_roster = roster_df.iloc[start_idx:end_idx].copy()
-            
-            # Replace first positional argument (roster_df) with batch
-            new_args = list(args)
-            new_args[0] = batch_roster
-            
-            batch_result = analyzer_func(*new_args, **kwargs)
-            all_results.append(batch_result)
-            
-            if batch_num % 5 == 4:  # Progress every 5 batches
-                print(f"    [{batch_num + 1}/{num_batches} batches]", end='\r')
-        
-        if num_batches > 1:
-            print(f"    [{num_batches}/{num_batches} batches] ✓")
-        
-        return pd.concat(all_results, ignore_index=True)
-    
-    # 1. Wind Analysis
-    print("1/20 Wind Analysis...")
-    try:
-        analyzer = wind_analysis.WindAnalyzer(data_dir)
-        wind_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, weather)
-        output_file = data_dir / f"wind_analysis_{file_suffix}_{timestamp}.csv"
-        wind_df.to_csv(output_file, index=False)
-        results['wind'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 2. Matchup Analysis  
-    print("2/20 Historical Matchup Analysis...")
-    try:
-        analyzer = matchup_fa.MatchupFactorAnalyzer(data_dir)
-        matchup_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"matchup_analysis_{file_suffix}_{timestamp}.csv"
-        matchup_df.to_csv(output_file, index=False)
-        results['matchup'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 3. Home/Away Analysis
-    print("3/20 Home/Away Venue Analysis...")
-    try:
-        analyzer = home_away_fa.HomeAwayFactorAnalyzer(data_dir)
-        venue_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"home_away_analysis_{file_suffix}_{timestamp}.csv"
-        venue_df.to_csv(output_file, index=False)
-        results['home_away'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 4. Rest Day Analysis
-    print("4/20 Rest Day Impact Analysis...")
-    try:
-        analyzer = rest_day_fa.RestDayFactorAnalyzer(data_dir)
-        rest_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025)
-        output_file = data_dir / f"rest_day_analysis_{file_suffix}_{timestamp}.csv"
-        rest_df.to_csv(output_file, index=False)
-        results['rest'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 5. Injury/Recovery Analysis
-    print("5/20 Injury/Recovery Analysis...")
-    try:
-        analyzer = injury_fa.InjuryFactorAnalyzer(data_dir)
-        injury_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"injury_analysis_{file_suffix}_{timestamp}.csv"
-        injury_df.to_csv(output_file, index=False)
-        results['injury'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 6. Umpire Analysis
-    print("6/20 Umpire Strike Zone Analysis...")
-    try:
-        analyzer = umpire_fa.UmpireFactorAnalyzer(data_dir)
-        umpire_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025)
-        output_file = data_dir / f"umpire_analysis_{file_suffix}_{timestamp}.csv"
-        umpire_df.to_csv(output_file, index=False)
-        results['umpire'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 7. Platoon Analysis
-    print("7/20 Platoon Advantage Analysis...")
-    try:
-        analyzer = platoon_fa.PlatoonFactorAnalyzer(data_dir)
-        platoon_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"platoon_analysis_{file_suffix}_{timestamp}.csv"
-        platoon_df.to_csv(output_file, index=False)
-        results['platoon'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 8. Temperature Analysis
-    print("8/20 Temperature Analysis...")
-    try:
-        analyzer = temperature_fa.TemperatureAnalyzer(data_dir)
-        temp_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, weather)
-        output_file = data_dir / f"temperature_analysis_{file_suffix}_{timestamp}.csv"
-        temp_df.to_csv(output_file, index=False)
-        results['temperature'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 9. Pitch Mix Analysis
-    print("9/20 Pitch Mix Analysis...")
-    try:
-        analyzer = pitch_mix_fa.PitchMixAnalyzer(data_dir)
-        pitch_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"pitch_mix_analysis_{file_suffix}_{timestamp}.csv"
-        pitch_df.to_csv(output_file, index=False)
-        results['pitch_mix'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 10. Park Factors Analysis
-    print("10/20 Park Factors Analysis...")
-    try:
-        analyzer = park_factors_fa.ParkFactorsAnalyzer(data_dir)
-        park_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, teams)
-        output_file = data_dir / f"park_factors_analysis_{file_suffix}_{timestamp}.csv"
-        park_df.to_csv(output_file, index=False)
-        results['park'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 11. Lineup Position Analysis
-    print("11/20 Lineup Position Analysis...")
-    try:
-        analyzer = lineup_position_fa.LineupPositionAnalyzer(data_dir)
-        lineup_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025)
-        output_file = data_dir / f"lineup_position_analysis_{file_suffix}_{timestamp}.csv"
-        lineup_df.to_csv(output_file, index=False)
-        results['lineup'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 12. Time of Day Analysis
-    print("12/20 Time of Day Analysis...")
-    try:
-        analyzer = time_of_day_fa.TimeOfDayAnalyzer(data_dir)
-        time_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"time_of_day_analysis_{file_suffix}_{timestamp}.csv"
-        time_df.to_csv(output_file, index=False)
-        results['time'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 13. Defensive Positions Analysis
-    print("13/20 Defensive Positions Analysis...")
-    try:
-        analyzer = defensive_positions_fa.DefensivePositionsFactorAnalyzer(data_dir)
-        defense_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, teams)
-        output_file = data_dir / f"defensive_positions_analysis_{file_suffix}_{timestamp}.csv"
-        defense_df.to_csv(output_file, index=False)
-        results['defense'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 14. Recent Form / Streaks Analysis
-    print("14/20 Recent Form / Streaks Analysis...")
-    try:
-        analyzer = recent_form_fa.RecentFormAnalyzer(data_dir)
-        form_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete, target_date=as_of_date)
-        output_file = data_dir / f"recent_form_analysis_{file_suffix}_{timestamp}.csv"
-        form_df.to_csv(output_file, index=False)
-        results['recent_form'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
-    
-    # 15. Bullpen Fatigue Analysis
-    print("15/20 Bullpen Fatigue Detection...")
-    try:
-        analyzer = bullpen_fatigue_fa.BullpenFatigueAnalyzer(data_dir)
-        bullpen_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"bullpen_fatigue_analysis_{file_suffix}_{timestamp}.csv"
-        bullpen_df.to_csv(output_file, index=False)
-        results['bullpen'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
+        print(f"   ETA is reported from measured batch times as factors finish\n")
+    
+    job = {
+        'data_dir': data_dir,
+        'roster_df': roster_df,
+        'context': context,
+        'as_of_date': as_of_date,
+        'batch_size': batch_size,
+        'file_suffix': file_suffix,
+        'timestamp': timestamp,
+        'window_days': window_days,
+        'factors': specs,
+        'num_batches': num_batches,
+        'resume': resume_state is not None,
+    }
     
-    # 16. Humidity & Elevation Analysis
-    print("16/20 Humidity & Elevation Analysis...")
-    try:
-        analyzer = humidity_elevation_fa.HumidityElevationAnalyzer(data_dir)
-        humidity_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, weather)
-        output_file = data_dir / f"humidity_elevation_analysis_{file_suffix}_{timestamp}.csv"
-        humidity_df.to_csv(output_file, index=False)
-        results['humidity'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
+    # Factor keys as requested (None = all) so a resumed run applies the same success threshold
+    factor_keys = None if factors is None else [spec.key for spec in specs]
+    save_run_checkpoint(job, factor_keys)
     
-    # 17. Monthly Splits Analysis
-    print("17/20 Monthly Splits Analysis...")
-    try:
-        analyzer = monthly_splits_fa.MonthlySplitsAnalyzer(data_dir)
-        monthly_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete)
-        output_file = data_dir / f"monthly_splits_analysis_{file_suffix}_{timestamp}.csv"
-        monthly_df.to_csv(output_file, index=False)
-        results['monthly'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
+    # Track results
+    if workers and workers > 1:
+        results, scores, cache_counts = run_factors_parallel(job, specs, workers)
+    else:
+        results, scores, cache_counts = run_factors_sequential(job, specs)
     
-    # 18. Team Momentum Analysis
-    print("18/20 Team Momentum Analysis...")
-    try:
-        analyzer = team_momentum_fa.TeamOffensiveMomentumAnalyzer(data_dir)
-        momentum_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, teams)
-        output_file = data_dir / f"team_momentum_analysis_{file_suffix}_{timestamp}.csv"
-        momentum_df.to_csv(output_file, index=False)
-        results['momentum'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
+    print(f"\n✓ Completed {len(results)}/{len(specs)} factor analyses")
     
-    # 19. Statcast Metrics Analysis
-    print("19/20 Statcast Metrics Analysis...")
-    try:
-        analyzer = statcast_metrics_fa.StatcastMetricsAnalyzer(data_dir)
-        statcast_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete, as_of_date=as_of_date)
-        output_file = data_dir / f"statcast_metrics_analysis_{file_suffix}_{timestamp}.csv"
-        statcast_df.to_csv(output_file, index=False)
-        results['statcast'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
-    except Exception as e:
-        print(f"  ✗ Error: {e}")
+    if cache_counts:
+        print("✓ Game context cache:")
+        for line in format_cache_stats(cache_counts):
+            print(f"    {line}")
     
-    # 20. Vegas Odds Analysis
-    print("20/20 Vegas Odds Analysis...")
+    # One combined player x factor score matrix for downstream consumers
     try:
-        analyzer = vegas_odds_fa.VegasOddsAnalyzer(data_dir)
-        vegas_df = process_in_batches(analyzer.analyze_roster, roster_df, schedule_2025, players_complete, as_of_date=as_of_date)
-        output_file = data_dir / f"vegas_odds_analysis_{file_suffix}_{timestamp}.csv"
-        vegas_df.to_csv(output_file, index=False)
-        results['vegas'] = output_file
-        print(f"  ✓ Saved to {output_file.name}")
+        matrix_file = save_run_factor_matrix(job, results, scores)
+        print(f"✓ Saved factor matrix to {matrix_file.name}")
     except Exception as e:
-        print(f"  ✗ Error: {e}")
+        print(f"⚠️  Could not save factor matrix: {e}")
     
-    print(f"\n✓ Completed {len(results)}/20 factor analyses")
+    # Incomplete runs stay resumable: --resume re-runs the failed factors only
+    save_run_checkpoint(job, factor_keys, complete=len(results) == len(specs))
+    if len(results) < len(specs):
+        print(f"↻ {len(specs) - len(results)} factor(s) incomplete - rerun with --resume to finish run {timestamp}")
     
-    return len(results) >= 17  # Success if at least 17 completed
+    required = MIN_FACTORS_COMPLETED if factors is None else len(specs)
+    return len(results) >= required
 
 
 def main():
@@ -430,6 +471,14 @@ def main():
     parser.add_argument('--date', type=str, help='Target date for analysis (YYYY-MM-DD)')
     parser.add_argument('--all-players', action='store_true', 
                        help='Analyze all MLB players instead of just rostered players (for waiver wire)')
+    parser.add_argument('--workers', type=int, default=1,
+                       help='Run factor analyses in parallel on N worker processes (default: 1)')
+    parser.add_argument('--window-days', type=int, default=None,
+                       help='Only analyze games from --date through the next N-1 days (default: whole season)')
+    parser.add_argument('--factors', type=str, default=None,
+                       help='Comma-separated factor keys to run, e.g. wind,park (default: all)')
+    parser.add_argument('--resume', action='store_true',
+                       help='Continue the latest unfinished run of this mode, skipping completed factors and batches')
     args = parser.parse_args()
     
     project_root = Path(__file__).parent.parent.parent
@@ -440,7 +489,9 @@ def main():
     print("="*80 + "\n")
     
     try:
-        success = run_all_factor_analyses(data_dir, as_of_date=args.date, all_players=args.all_players)
+        success = run_all_factor_analyses(data_dir, as_of_date=args.date, all_players=args.all_players,
+                                          workers=args.workers, window_days=args.window_days,
+                                          factors=args.factors, resume=args.resume)
         sys.exit(0 if success else 1)
     except Exception as e:
         print(f"\n❌ Error: {e}")
@@ -0,0 +1,79 @@
+#!/usr/bin/env python3
+"""
+Stable Random
+
+Reproducible pseudo-random draws keyed by a string (player name, team, game).
+
+Several analyzers fill in synthetic values (handedness, umpire assignment,
+defensive ratings) for data that isn't scraped yet. Seeding the global NumPy
+RNG with Python's hash() made those values change between runs and between
+--workers processes, because hash() is salted per process, and every draw
+reseeded shared global state. Here every draw is derived from a BLAKE2
+digest of its key, so a key always yields the same draws in any process, in
+any order:
+
+- keyed_uniforms hashes the keys once and mixes the digests with SplitMix64
+  in NumPy, so the uniforms for all keys come from one vectorized pass
+- keyed_draws is for other distributions (normal, beta, ...): it builds one
+  np.random.Generator per distinct key, a Python-level loop over the keys
+
+Usage:
+    rng = keyed_rng('Aaron Judge')
+    draws = keyed_uniforms(['Aaron Judge', 'Mookie Betts'], n=2)   # shape (2, 2)
+    ratings = keyed_draws(teams, lambda rng: rng.normal(0.5, 0.15))  # {team: value}
+"""
+
+import hashlib
+
+import numpy as np
+
+
+def stable_hash(key):
+    """64-bit integer digest of str(key), identical in every process"""
+    digest = hashlib.blake2b(str(key).encode('utf-8'), digest_size=8).digest()
+    return int.from_bytes(digest, 'little')
+
+
+def keyed_rng(key):
+    """np.random.Generator seeded from the stable hash of key"""
+    return np.random.default_rng(stable_hash(key))
+
+
+def keyed_draws(keys, draw):
+    """
+    Call draw(rng) once per distinct key with that key's generator; returns {key: value}
+
+    One Generator is built per key, so this costs a Python call per key; use
+    keyed_uniforms when uniform draws are enough.
+    """
+    return {key: draw(keyed_rng(key)) for key in dict.fromkeys(keys)}
+
+
+def splitmix64(values):
+    """SplitMix64 finalizer over a uint64 array (wrapping arithmetic)"""
+    z = values.astype(np.uint64)
+    z = (z ^ (z >> np.uint64(30))) * np.uint64(0xBF58476D1CE4E5B9)
+    z = (z ^ (z >> np.uint64(27))) * np.uint64(0x94D049BB133111EB)
+    return z ^ (z >> np.uint64(31))
+
+
+def keyed_uniforms(keys, n=1):
+    """
+    n uniform [0, 1) draws per key, as an array of shape (len(keys), n)
+
+    Draw j of a key is SplitMix64(digest + (j + 1) * golden ratio constant),
+    computed for every key and draw at once.
+    """
+    keys = list(keys)
+    if not keys:
+        return np.empty((0, n))
+
+    digests = dict.fromkeys(keys)
+    for key in digests:
+        digests[key] = stable_hash(key)
+    seeds = np.array([digests[key] for key in keys], dtype=np.uint64)
+
+    steps = np.arange(1, n + 1, dtype=np.uint64) * np.uint64(0x9E3779B97F4A7C15)
+    bits = splitmix64(seeds[:, None] + steps[None, :])
+    # Top 53 bits -> double in [0, 1)
+    return (bits >> np.uint64(11)).astype(np.float64) * 2.0 ** -53
@@ -41,14 +41,25 @@ Data Source: MLB Statcast (Baseball Savant) - FREE
 
 import pandas as pd
 from pathlib import Path
+
+try:
+    from .game_log_loader import read_game_logs
+    from .game_log_index import GameLogIndex
+except ImportError:
+    from game_log_loader import read_game_logs
+    from game_log_index import GameLogIndex
 from datetime import datetime, timedelta
 
 
 class StatcastMetricsAnalyzer:
     """Analyze Statcast quality-of-contact metrics"""
     
+    # Game log columns the 30-day window needs; logs without them score every player neutral
+    WINDOW_COLUMNS = ['player_name', 'player_id', 'game_date', 'AB', 'H', 'HR', '2B', '3B']
+    
     def __init__(self, data_dir):
         self.data_dir = Path(data_dir)
+        self._seasons = {}  # season -> parsed logs and name lookup (see load_season_logs)
     
     def calculate_statcast_score(self, avg_ev, barrel_rate, hard_hit_rate, 
                                   xba_diff=0, xslg_diff=0):
@@ -124,107 +135,154 @@ class StatcastMetricsAnalyzer:
         # Normalize to -2 to +2 range
         return max(-2.0, min(2.0, score))
     
-    def get_player_statcast_data(self, player_name, player_id, as_of_date):
+    def load_season_logs(self, season, context=None):
+        """
+        Load a season's game logs once, with a name -> player_id lookup
+        
+        Returns a dict with the parsed logs ('logs'), a GameLogIndex keyed by
+        player_id ('index': each player's rows, date-sorted, with prefix sums),
+        exact name lookup ('name_to_id', first id seen per name) and the
+        distinct names in file order ('names') for the partial-match fallback.
+        A logs file missing any WINDOW_COLUMNS gives empty lookups, so every
+        player scores neutral.
+        """
+        if season in self._seasons:
+            return self._seasons[season]
+        
+        if context is not None:
+            game_logs = context.get_game_logs(season)
+        else:
+            game_log_file = self.data_dir / f'mlb_game_logs_{season}.csv'
+            if game_log_file.exists():
+                game_logs = read_game_logs(game_log_file)
+            else:
+                game_logs = pd.DataFrame()
+        
+        if game_logs.empty or not set(self.WINDOW_COLUMNS) <= set(game_logs.columns):
+            game_logs = pd.DataFrame(columns=self.WINDOW_COLUMNS)
+            name_to_id = {}
+        else:
+            first_seen = game_logs.drop_duplicates('player_name')
+            name_to_id = dict(zip(first_seen['player_name'], first_seen['player_id']))
+        
+        self._seasons[season] = {
+            'logs': game_logs,
+            'index': GameLogIndex(game_logs, key='player_id'),
+            'name_to_id': name_to_id,
+            'names': [(str(name).lower(), name) for name in name_to_id],
+        }
+        return self._seasons[season]
+    
+    def resolve_player_id(self, player_name, player_id, season_data):
+        """Player id from the roster, else exact name match, else first partial name match"""
+        if player_id is not None and not pd.isna(player_id):
+            return player_id
+        
+        if player_name in season_data['name_to_id']:
+            return season_data['name_to_id'][player_name]
+        
+        needle = str(player_name).lower()
+        for lowered, name in season_data['names']:
+            if needle in lowered:
+                return season_data['name_to_id'][name]
+        
+        return None
+    
+    def window_totals(self, index, player_ids, as_of_date, days=30):
+        """
+        AB/H/HR/2B/3B sums per player (rows indexed by player_id) over the `days`
+        days up to and including as_of_date; players without games are left out
+        """
+        columns = ['AB', 'H', 'HR', '2B', '3B']
+        cutoff_date = pd.Timestamp(as_of_date) - timedelta(days=days)
+        # window() excludes its end date; one nanosecond past as_of_date keeps games on that date
+        end_date = pd.Timestamp(as_of_date) + pd.Timedelta(1, 'ns')
+        
+        totals = {}
+        for player_id in dict.fromkeys(player_ids):
+            start, end = index.window(player_id, cutoff_date, end_date)
+            if end > start:
+                window = index.totals(start, end)
+                totals[player_id] = [window[col] for col in columns]
+        
+        return pd.DataFrame.from_dict(totals, orient='index', columns=columns)
+    
+    def get_player_statcast_data(self, player_name, player_id, as_of_date, context=None):
         """
         Get Statcast data for a player from game logs
         
         Uses recent performance stats to approximate Statcast metrics
         """
-        # Load game logs for the season
-        year = as_of_date.year
-        game_log_file = self.data_dir / f'mlb_game_logs_{year}.csv'
+        season_data = self.load_season_logs(as_of_date.year, context)
+        player_id = self.resolve_player_id(player_name, player_id, season_data)
+        if player_id is None:
+            return None
         
-        if not game_log_file.exists():
+        totals = self.window_totals(season_data['index'], [player_id], as_of_date)
+        if player_id not in totals.index:
             return None
-            
-        try:
-            game_logs = pd.read_csv(game_log_file)
-            game_logs['game_date'] = pd.to_datetime(game_logs['game_date'])
-            
-            # If player_id not provided, try to find by name
-            if player_id is None or pd.isna(player_id):
-                # Try exact name match first
-                name_matches = game_logs[game_logs['player_name'] == player_name]
-                if len(name_matches) == 0:
-                    # Try partial match
-                    name_matches = game_logs[game_logs['player_name'].str.contains(player_name, case=False, na=False)]
-                
-                if len(name_matches) > 0:
-                    player_id = name_matches.iloc[0]['player_id']
-                else:
-                    return None
-            
-            # Filter for this player's recent games (last 30 days)
-            cutoff_date = as_of_date - timedelta(days=30)
-            player_logs = game_logs[
-                (game_logs['player_id'] == player_id) & 
-                (game_logs['game_date'] <= as_of_date) &
-                (game_logs['game_date'] >= cutoff_date)
-            ]
-            
-            if len(player_logs) == 0:
-                return None
-            
-            # Calculate approximations from available stats
-            total_ab = player_logs['AB'].sum()
-            if total_ab < 10:  # Need minimum sample
-                return None
-                
-            total_h = player_logs['H'].sum()
-            total_hr = player_logs['HR'].sum()
-            total_2b = player_logs['2B'].sum()
-            total_3b = player_logs['3B'].sum()
-            
-            # Calculate SLG components
-            singles = total_h - total_2b - total_3b - total_hr
-            total_bases = singles + (2 * total_2b) + (3 * total_3b) + (4 * total_hr)
-            
-            actual_ba = total_h / total_ab if total_ab > 0 else 0
-            actual_slg = total_bases / total_ab if total_ab > 0 else 0
-            
-            # Approximate quality metrics based on power output
-            # HR rate correlates with exit velocity and barrel rate
-            hr_rate = total_hr / total_ab if total_ab > 0 else 0
-            extra_base_rate = (total_2b + total_3b + total_hr) / total_ab if total_ab > 0 else 0
-            
-            # Estimate exit velocity from power (HR rate)
-            # Elite: ~95+ mph (8%+ HR rate), Average: ~88 mph (2-3% HR rate)
-            avg_exit_velocity = 85.0 + (hr_rate * 200)  # Scales roughly with power
-            avg_exit_velocity = min(95.0, max(82.0, avg_exit_velocity))
-            
-            # Estimate barrel rate from HR + extra bases
-            barrel_rate = (hr_rate * 100) + (extra_base_rate * 20)  # HR strongly correlate with barrels
-            barrel_rate = min(20.0, max(2.0, barrel_rate))
-            
-            # Estimate hard hit rate from extra base hits
-            hard_hit_rate = 30.0 + (extra_base_rate * 60)
-            hard_hit_rate = min(55.0, max(25.0, hard_hit_rate))
-            
-            # For expected stats, use recent trend (simplified)
-            # If player is hitting well, assume meeting expectations
-            xba = actual_ba * 1.02  # Slight expected boost
-            xslg = actual_slg * 1.02
-            
-            return {
-                'avg_exit_velocity': round(avg_exit_velocity, 1),
-                'max_exit_velocity': round(min(115.0, avg_exit_velocity + 22.0), 1),
-                'barrel_rate': round(barrel_rate, 1),
-                'hard_hit_rate': round(hard_hit_rate, 1),
-                'sweet_spot_rate': round((hard_hit_rate + barrel_rate) / 2, 1),
-                'xba': round(xba, 3),
-                'xslg': round(xslg, 3),
-                'xwoba': round((xba + xslg) / 2, 3),
-                'actual_ba': round(actual_ba, 3),
-                'actual_slg': round(actual_slg, 3),
-                'actual_woba': round((actual_ba + actual_slg) / 2, 3),
-                'launch_angle': 12.0,  # Default
-                'batted_ball_count': int(total_ab)
-            }
-        except Exception as e:
-            print(f"Error loading statcast data for {player_name}: {e}")
+        
+        return self.statcast_from_totals(totals.loc[player_id])
+    
+    def statcast_from_totals(self, totals):
+        """Approximate Statcast metrics from a player's 30-day counting stat totals"""
+        # Calculate approximations from available stats
+        total_ab = totals['AB']
+        if total_ab < 10:  # Need minimum sample
             return None
+            
+        total_h = totals['H']
+        total_hr = totals['HR']
+        total_2b = totals['2B']
+        total_3b = totals['3B']
+        
+        # Calculate SLG components
+        singles = total_h - total_2b - total_3b - total_hr
+        total_bases = singles + (2 * total_2b) + (3 * total_3b) + (4 * total_hr)
+        
+        actual_ba = total_h / total_ab if total_ab > 0 else 0
+        actual_slg = total_bases / total_ab if total_ab > 0 else 0
+        
+        # Approximate quality metrics based on power output
+        # HR rate correlates with exit velocity and barrel rate
+        hr_rate = total_hr / total_ab if total_ab > 0 else 0
+        extra_base_rate = (total_2b + total_3b + total_hr) / total_ab if total_ab > 0 else 0
+        
+        # Estimate exit velocity from power (HR rate)
+        # Elite: ~95+ mph (8%+ HR rate), Average: ~88 mph (2-3% HR rate)
+        avg_exit_velocity = 85.0 + (hr_rate * 200)  # Scales roughly with power
+        avg_exit_velocity = min(95.0, max(82.0, avg_exit_velocity))
+        
+        # Estimate barrel rate from HR + extra bases
+        barrel_rate = (hr_rate * 100) + (extra_base_rate * 20)  # HR strongly correlate with barrels
+        barrel_rate = min(20.0, max(2.0, barrel_rate))
+        
+        # Estimate hard hit rate from extra base hits
+        hard_hit_rate = 30.0 + (extra_base_rate * 60)
+        hard_hit_rate = min(55.0, max(25.0, hard_hit_rate))
+        
+        # For expected stats, use recent trend (simplified)
+        # If player is hitting well, assume meeting expectations
+        xba = actual_ba * 1.02  # Slight expected boost
+        xslg = actual_slg * 1.02
+        
+        return {
+            'avg_exit_velocity': round(avg_exit_velocity, 1),
+            'max_exit_velocity': round(min(115.0, avg_exit_velocity + 22.0), 1),
+            'barrel_rate': round(barrel_rate, 1),
+            'hard_hit_rate': round(hard_hit_rate, 1),
+            'sweet_spot_rate': round((hard_hit_rate + barrel_rate) / 2, 1),
+            'xba': round(xba, 3),
+            'xslg': round(xslg, 3),
+            'xwoba': round((xba + xslg) / 2, 3),
+            'actual_ba': round(actual_ba, 3),
+            'actual_slg': round(actual_slg, 3),
+            'actual_woba': round((actual_ba + actual_slg) / 2, 3),
+            'launch_angle': 12.0,  # Default
+            'batted_ball_count': int(total_ab)
+        }
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, as_of_date=None, context=None):
         """
         Analyze Statcast metrics for all roster players
         
@@ -233,6 +291,7 @@ class StatcastMetricsAnalyzer:
             schedule_df: DataFrame of upcoming games
             players_df: DataFrame of all players with stats
             as_of_date: Date to analyze as of (defaults to today)
+            context: Optional FactorDataContext; season game logs are read from it once
         
         Returns:
             DataFrame with Statcast scores for each roster player
@@ -242,14 +301,28 @@ class StatcastMetricsAnalyzer:
         elif isinstance(as_of_date, str):
             as_of_date = pd.to_datetime(as_of_date)
         
-        results = []
+        # Resolve every roster player to a game log id, then sum each 30-day window from the index
+        season_data = self.load_season_logs(as_of_date.year, context)
         
+        roster = []
         for _, player in roster_df.iterrows():
             player_name = player.get('player_name', player.get('name', 'Unknown'))
             player_id = player.get('player_id', None)
-            
+            roster.append((player_name, player_id, self.resolve_player_id(player_name, player_id, season_data)))
+        
+        window_totals = self.window_totals(
+            season_data['index'],
+            [log_id for _, _, log_id in roster if log_id is not None],
+            as_of_date
+        )
+        
+        results = []
+        
+        for player_name, player_id, log_id in roster:
             # Get Statcast data for player
-            statcast = self.get_player_statcast_data(player_name, player_id, as_of_date)
+            statcast = None
+            if log_id is not None and log_id in window_totals.index:
+                statcast = self.statcast_from_totals(window_totals.loc[log_id])
             
             if statcast and statcast['batted_ball_count'] >= 20:
                 # Calculate differentials (expected vs actual)
@@ -24,6 +24,11 @@ import numpy as np
 from pathlib import Path
 from datetime import datetime
 
+try:
+    from .game_context_cache import cache_for
+except ImportError:
+    from game_context_cache import cache_for
+
 
 class TeamOffensiveMomentumAnalyzer:
     """Analyze team offensive momentum and trends"""
@@ -128,60 +133,55 @@ class TeamOffensiveMomentumAnalyzer:
         # If no file, return empty
         return pd.DataFrame()
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None):
+    def team_momentum_context(self, team, as_of_date):
+        """Momentum columns for a team as of a date (placeholder row if no game logs)"""
+        # Load team game logs
+        team_games = self.load_team_game_logs(team, as_of_date)
+        
+        if len(team_games) == 0:
+            # No data - use placeholder
+            return {
+                'team': team,
+                'games': 0,
+                'runs_per_game': 0.0,
+                'momentum_score': 0.0,
+                'momentum_rating': 'No Data',
+                'trend': 'Unknown',
+                'note': 'Team game logs not available'
+            }
+        
+        # Calculate momentum
+        momentum = self.calculate_team_momentum(team_games)
+        rating = self.get_momentum_rating(momentum['momentum_score'])
+        
+        return {
+            'team': team,
+            **momentum,
+            'momentum_rating': rating
+        }
+    
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, as_of_date=None, context=None):
         """Analyze team momentum for all roster players"""
         if as_of_date is None:
             as_of_date = datetime.now()
         elif isinstance(as_of_date, str):
             as_of_date = datetime.strptime(as_of_date, '%Y-%m-%d')
         
+        cache = cache_for(context)
         results = []
-        processed_teams = set()
         
         for _, player in roster_df.iterrows():
             player_name = player['player_name']
             team = player.get('team', 'Unknown')
             
-            # Skip if we've already analyzed this team
-            if team in processed_teams and team != 'Unknown':
-                existing = [r for r in results if r['team'] == team]
-                if existing:
-                    results.append({
-                        'player_name': player_name,
-                        **existing[0]
-                    })
-                    continue
-            
-            # Load team game logs
-            team_games = self.load_team_game_logs(team, as_of_date)
+            # Each team's momentum is computed once and shared by its players
+            team_momentum = cache.get('team_momentum', (team, as_of_date),
+                                      lambda team=team: self.team_momentum_context(team, as_of_date))
             
-            if len(team_games) == 0:
-                # No data - use placeholder
-                results.append({
-                    'player_name': player_name,
-                    'team': team,
-                    'games': 0,
-                    'runs_per_game': 0.0,
-                    'momentum_score': 0.0,
-                    'momentum_rating': 'No Data',
-                    'trend': 'Unknown',
-                    'note': 'Team game logs not available'
-                })
-                continue
-            
-            # Calculate momentum
-            momentum = self.calculate_team_momentum(team_games)
-            rating = self.get_momentum_rating(momentum['momentum_score'])
-            
-            result = {
+            results.append({
                 'player_name': player_name,
-                'team': team,
-                **momentum,
-                'momentum_rating': rating
-            }
-            
-            results.append(result)
-            processed_teams.add(team)
+                **team_momentum
+            })
         
         return pd.DataFrame(results)
 
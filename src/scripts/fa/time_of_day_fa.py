@@ -25,10 +25,16 @@ Output:
 """
 
 import pandas as pd
-import numpy as np
 from pathlib import Path
 from datetime import datetime, time as dt_time
 
+try:
+    from .stable_random import keyed_draws
+    from .data_context import schedule_window
+except ImportError:
+    from stable_random import keyed_draws
+    from data_context import schedule_window
+
 
 class TimeOfDayAnalyzer:
     """Analyze game time impact on fantasy production"""
@@ -63,6 +69,7 @@ class TimeOfDayAnalyzer:
     
     def __init__(self, data_dir):
         self.data_dir = Path(data_dir)
+        self.player_tendencies = {}
     
     def classify_game_time(self, game_time_str):
         """Classify game time as Day, Twilight, or Night"""
@@ -93,6 +100,13 @@ class TimeOfDayAnalyzer:
         except:
             return 'Unknown'
     
+    def load_player_tendencies(self, player_names):
+        """Draw synthetic day/night tendency and game counts for many players at once"""
+        names = [n for n in dict.fromkeys(player_names) if n not in self.player_tendencies]
+        self.player_tendencies.update(keyed_draws(
+            names, lambda rng: (int(rng.integers(0, 100)), int(rng.integers(20, 60)), int(rng.integers(80, 120)))
+        ))
+    
     def get_player_time_splits(self, player_name, mlb_df):
         """Get player's historical day/night performance splits"""
         # In reality, would query detailed split stats from MLB data
@@ -117,16 +131,18 @@ class TimeOfDayAnalyzer:
         base_era = player_stats.iloc[0].get('era', 4.00)
         
         # Add player-specific tendency (some prefer day, some night)
-        # Use player name hash for consistency
-        player_hash = hash(player_name) % 100
+        # Keyed on player name for consistency across runs
+        if player_name not in self.player_tendencies:
+            self.load_player_tendencies([player_name])
+        player_hash, day_games, night_games = self.player_tendencies[player_name]
         day_preference = (player_hash - 50) / 250  # -0.20 to +0.20 range
         
         day_mult = 1.0 + day_preference
         night_mult = 1.0 - day_preference
         
         return {
-            'day_games': np.random.randint(20, 60),
-            'night_games': np.random.randint(80, 120),
+            'day_games': day_games,
+            'night_games': night_games,
             'day_avg': round(base_avg * day_mult, 3),
             'night_avg': round(base_avg * night_mult, 3),
             'day_ops': round(0.750 * day_mult, 3),
@@ -239,6 +255,8 @@ class TimeOfDayAnalyzer:
         """Analyze time of day advantages for roster players"""
         results = []
         
+        self.load_player_tendencies(roster_df['player_name'])
+        
         for _, game in games_df.iterrows():
             game_date = game.get('game_date', '')
             game_time = game.get('game_time', 'N/A')
@@ -295,8 +313,13 @@ class TimeOfDayAnalyzer:
         else:
             return "Poor"
     
-    def analyze_roster(self, roster_df, schedule_df, players_df):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, context=None,
+                       target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        if players_df is None and context is not None:
+            players_df = context.players
         return self.analyze(schedule_df, players_df, roster_df)
 
 
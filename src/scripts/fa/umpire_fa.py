@@ -24,6 +24,15 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+try:
+    from .stable_random import keyed_uniforms
+    from .data_context import schedule_window
+    from .game_context_cache import GameContextCache, cache_for
+except ImportError:
+    from stable_random import keyed_uniforms
+    from data_context import schedule_window
+    from game_context_cache import GameContextCache, cache_for
+
 
 class UmpireFactorAnalyzer:
     """Analyze umpire strike zone impacts"""
@@ -61,51 +70,64 @@ class UmpireFactorAnalyzer:
         umpire_score = zone_score + favor_score + consistency_bonus
         return max(-1.5, min(1.5, umpire_score))
     
-    def analyze(self, games_df, roster_df):
+    def umpire_context(self, umpire_name):
+        """An umpire's profile with hitter and pitcher scores"""
+        umpire = self.UMPIRE_PROFILES[umpire_name]
+        scores = {
+            is_pitcher: self.calculate_umpire_score(
+                umpire['strike_zone_size'],
+                umpire['consistency'],
+                umpire['favor_pitcher'],
+                is_pitcher
+            )
+            for is_pitcher in (False, True)
+        }
+        return {
+            'strike_zone_size': umpire['strike_zone_size'],
+            'consistency': umpire['consistency'],
+            'hitter_score': scores[False],
+            'pitcher_score': scores[True],
+        }
+    
+    def analyze(self, games_df, roster_df, cache=None):
         """Analyze umpire strike zone advantages"""
-        results = []
+        if cache is None:
+            cache = GameContextCache()
+        
+        # Assign umpires (deterministic based on game), all games in one draw
+        umpire_names = list(self.UMPIRE_PROFILES.keys())
+        opponents = games_df['opponent'] if 'opponent' in games_df.columns else pd.Series('', index=games_df.index)
+        umpire_draws = keyed_uniforms([
+            f"{pd.Timestamp(game_date).strftime('%Y-%m-%d')}|{opponent}"
+            for game_date, opponent in zip(games_df['game_date'], opponents)
+        ])[:, 0]
         
-        for _, game in games_df.iterrows():
-            game_date = game['game_date']
-            opponent = game.get('opponent', '')
-            
-            # Assign umpire (deterministic based on game)
-            np.random.seed(hash(str(game_date) + opponent) % 2**32)
-            umpire_name = np.random.choice(list(self.UMPIRE_PROFILES.keys()))
-            umpire = self.UMPIRE_PROFILES[umpire_name]
-            
-            for _, player in roster_df.iterrows():
-                player_name = player['player_name']
-                is_pitcher = player.get('position', '') in ['SP', 'RP', 'P']
-                
-                umpire_score = self.calculate_umpire_score(
-                    umpire['strike_zone_size'],
-                    umpire['consistency'],
-                    umpire['favor_pitcher'],
-                    is_pitcher
-                )
-                
-                results.append({
-                    'player_name': player_name,
-                    'game_date': game_date,
-                    'umpire_name': umpire_name,
-                    'strike_zone_size': umpire['strike_zone_size'],
-                    'consistency': umpire['consistency'],
-                    'umpire_score': umpire_score
-                })
+        games = []
+        for game_date, draw in zip(games_df['game_date'], umpire_draws):
+            umpire_name = umpire_names[int(draw * len(umpire_names))]
+            games.append({
+                'game_date': game_date,
+                'umpire_name': umpire_name,
+                **cache.get('umpire', umpire_name, lambda umpire_name=umpire_name: self.umpire_context(umpire_name))
+            })
         
-        np.random.seed(None)
-        return pd.DataFrame(results)
+        positions = roster_df['position'] if 'position' in roster_df.columns else pd.Series('', index=roster_df.index)
+        players = pd.DataFrame({
+            'player_name': roster_df['player_name'].values,
+            'is_pitcher': positions.isin(['SP', 'RP', 'P']).values,
+        })
+        
+        if not games or players.empty:
+            return pd.DataFrame()
+        
+        # Broadcast each game's umpire to every player
+        results = pd.DataFrame(games).merge(players, how='cross')
+        results['umpire_score'] = np.where(results['is_pitcher'], results['pitcher_score'], results['hitter_score'])
+        return results[['player_name', 'game_date', 'umpire_name', 'strike_zone_size', 'consistency', 'umpire_score']]
 
 
-    def analyze_roster(self, roster_df, schedule_df, ):
+    def analyze_roster(self, roster_df, schedule_df, context=None, target_date=None, window_days=None):
         """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, roster_df)
-    
-    def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        return self.analyze(schedule_df, roster_df, cache_for(context))
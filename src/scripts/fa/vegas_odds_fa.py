@@ -46,6 +46,11 @@ from pathlib import Path
 from datetime import datetime, timedelta
 import os
 
+try:
+    from .data_context import schedule_window
+except ImportError:
+    from data_context import schedule_window
+
 
 class VegasOddsAnalyzer:
     """Analyze Vegas betting lines for scoring environment prediction"""
@@ -274,7 +279,8 @@ class VegasOddsAnalyzer:
                 'available': False
             }
     
-    def analyze_roster(self, roster_df, schedule_df, players_df, as_of_date=None):
+    def analyze_roster(self, roster_df, schedule_df, players_df=None, as_of_date=None, context=None,
+                       window_days=None):
         """
         Analyze Vegas odds for all roster players
         
@@ -283,6 +289,8 @@ class VegasOddsAnalyzer:
             schedule_df: DataFrame of upcoming games
             players_df: DataFrame of all players
             as_of_date: Date to analyze as of (defaults to today)
+            context: Optional FactorDataContext shared across analyzers
+            window_days: Number of days of games from as_of_date to analyze (default 1)
         
         Returns:
             DataFrame with Vegas scores for each roster player
@@ -294,16 +302,15 @@ class VegasOddsAnalyzer:
         
         results = []
         
-        # Ensure schedule has proper date format
+        # Ensure schedule has proper date format (on a local copy; the schedule is shared)
+        schedule_df = schedule_df.copy()
         if 'game_date' not in schedule_df.columns and 'date' in schedule_df.columns:
             schedule_df['game_date'] = pd.to_datetime(schedule_df['date'])
         else:
             schedule_df['game_date'] = pd.to_datetime(schedule_df['game_date'])
         
         # Filter to today's/target games
-        target_games = schedule_df[
-            schedule_df['game_date'].dt.date == as_of_date.date()
-        ]
+        target_games = schedule_window(schedule_df, as_of_date, window_days or 1)
         
         for _, player in roster_df.iterrows():
             player_name = player.get('player_name', player.get('name', 'Unknown'))
@@ -0,0 +1,265 @@
+#!/usr/bin/env python3
+"""
+Venue Conditions
+
+Weather-driven conditions for every venue in the stadium weather snapshot,
+computed once per run with NumPy.
+
+The humidity/elevation, temperature and wind factors each used to look up a
+game's venue weather on their own - humidity once per player, temperature once
+per venue through the game context cache - and score it with scalar Python.
+The weather snapshot has one row per ballpark, so all three now join players
+to the same ~30-row table:
+
+- Temperature: Celsius/Fahrenheit, category, hitter advantage and impact text
+- Wind: tailwind and crosswind components against the park's orientation,
+  hitter advantage
+- Air: humidity and temperature for air density
+
+Elevation belongs to the ballpark a game is actually played in (the schedule's
+venue, which can differ from the team's weather row), so the humidity factor
+applies air_conditions() to its own per-team game table instead of reading it
+from here.
+
+Usage:
+    conditions = venue_conditions_for(context, weather_df)   # one row per venue
+    games = schedule_df.merge(conditions, on='venue', how='inner')
+"""
+
+import numpy as np
+import pandas as pd
+
+
+# MLB Ballpark Elevations (in feet)
+BALLPARK_ELEVATIONS = {
+    'Coors Field': 5200,           # Denver - Highest
+    'Chase Field': 1086,            # Arizona
+    'Globe Life Field': 550,        # Texas
+    'Kauffman Stadium': 910,        # Kansas City
+    'Busch Stadium': 535,           # St. Louis
+    'Guaranteed Rate Field': 595,   # Chicago White Sox
+    'Wrigley Field': 595,           # Chicago Cubs
+    'T-Mobile Park': 10,            # Seattle - Sea level
+    'Oracle Park': 10,              # San Francisco - Sea level
+    'Petco Park': 20,               # San Diego - Sea level
+    'Tropicana Field': 10,          # Tampa Bay
+    'Fenway Park': 20,              # Boston
+    'Yankee Stadium': 55,           # New York Yankees
+    'Citi Field': 10,               # New York Mets
+    'Citizens Bank Park': 10,       # Philadelphia
+    'Nationals Park': 25,           # Washington
+    'Truist Park': 1050,            # Atlanta
+    'loanDepot park': 10,           # Miami
+    'Oriole Park': 33,              # Baltimore
+    'Progressive Field': 660,       # Cleveland
+    'Comerica Park': 585,           # Detroit
+    'Target Field': 840,            # Minnesota
+    'Rogers Centre': 300,           # Toronto
+    'American Family Field': 635,   # Milwaukee
+    'Great American Ball Park': 550, # Cincinnati
+    'PNC Park': 730,                # Pittsburgh
+    'Dodger Stadium': 340,          # Los Angeles
+    'Angel Stadium': 160,           # Los Angeles Angels
+    'Oakland Coliseum': 25,         # Oakland
+    'Minute Maid Park': 22,         # Houston
+}
+
+# Elevation assumed for parks not in the table
+DEFAULT_ELEVATION_FT = 500
+
+# Stadium orientations (pitcher mound → home plate direction in degrees)
+STADIUM_ORIENTATIONS = {
+    'Chase Field': 20,
+    'Truist Park': 15,
+    'Oriole Park at Camden Yards': 54,
+    'Fenway Park': 287,
+    'Wrigley Field': 190,
+    'Guaranteed Rate Field': 18,
+    'Great American Ball Park': 235,
+    'Progressive Field': 95,
+    'Coors Field': 5,
+    'Comerica Park': 55,
+    'Minute Maid Park': 350,
+    'Kauffman Stadium': 80,
+    'Angel Stadium': 210,
+    'Dodger Stadium': 330,
+    'LoanDepot Park': 235,
+    'American Family Field': 205,
+    'Target Field': 235,
+    'Citi Field': 45,
+    'Yankee Stadium': 282,
+    'Oakland Coliseum': 325,
+    'Citizens Bank Park': 5,
+    'PNC Park': 325,
+    'Petco Park': 320,
+    'Oracle Park': 310,
+    'T-Mobile Park': 47,
+    'Busch Stadium': 240,
+    'Tropicana Field': 5,
+    'Globe Life Field': 355,
+    'Rogers Centre': 198,
+    'Nationals Park': 325,
+    'Sutter Health Park': 45,
+}
+
+# Temperature bands: (upper bound in Celsius, category, hitter advantage, impact)
+TEMPERATURE_BANDS = [
+    (13, "Cold", -2.0, "Significant advantage for pitchers - ball doesn't carry"),   # < 55°F
+    (18, "Cool", -1.0, "Slight advantage for pitchers"),                              # < 65°F
+    (21, "Moderate", -0.5, "Neutral conditions, slight pitcher advantage"),           # < 70°F
+    (24, "Comfortable", 0.0, "Neutral conditions"),                                   # < 75°F
+    (29, "Warm", 1.5, "Favorable for hitters - ball carries well"),                   # < 85°F
+    (35, "Hot", 2.0, "Very favorable for hitters - maximum ball flight"),             # < 95°F
+]
+VERY_HOT = ("Very Hot", 1.0, "Favorable for hitters but extreme heat affects stamina")
+
+# Air density score thresholds for the conditions rating (checked in order)
+AIR_DENSITY_RATINGS = [
+    (0.8, 'Very Favorable'),
+    (0.3, 'Favorable'),
+    (-0.3, 'Neutral'),
+    (-0.8, 'Unfavorable'),
+]
+
+# Weather assumed when a venue has none
+DEFAULT_HUMIDITY_PCT = 50
+DEFAULT_TEMPERATURE_C = 20
+
+
+def celsius_to_fahrenheit(celsius):
+    """Convert Celsius to Fahrenheit"""
+    return (celsius * 9/5) + 32
+
+
+def temperature_advantages(temp_celsius):
+    """Category, hitter advantage and impact text for an array of temperatures"""
+    temp_celsius = np.asarray(temp_celsius, dtype=float)
+    conditions = [temp_celsius < upper for upper, _, _, _ in TEMPERATURE_BANDS]
+
+    return {
+        'temp_fahrenheit': celsius_to_fahrenheit(temp_celsius),
+        'category': np.select(conditions, [band[1] for band in TEMPERATURE_BANDS], default=VERY_HOT[0]),
+        'advantage_score': np.select(conditions, [band[2] for band in TEMPERATURE_BANDS], default=VERY_HOT[1]),
+        'impact': np.select(conditions, [band[3] for band in TEMPERATURE_BANDS], default=VERY_HOT[2]),
+    }
+
+
+def wind_components(wind_direction, wind_speed, stadium_orientation):
+    """Tailwind/crosswind components and hitter advantage for arrays of venues"""
+    wind_direction = np.asarray(wind_direction, dtype=float)
+    wind_speed = np.asarray(wind_speed, dtype=float)
+
+    relative_direction = (wind_direction - np.asarray(stadium_orientation, dtype=float)) % 360
+    relative_direction = np.where(relative_direction > 180, relative_direction - 360, relative_direction)
+
+    radians = np.radians(relative_direction)
+    wind_component = np.cos(radians) * wind_speed
+    crosswind = np.abs(np.sin(radians) * wind_speed)
+
+    advantage_score = np.select(
+        [wind_component > 10, wind_component > 5, wind_component > -5, wind_component > -10],
+        [2.0, 1.0, 0.0, -1.0],
+        default=-2.0
+    )
+
+    return {
+        'wind_component_kmh': wind_component,
+        'crosswind_kmh': crosswind,
+        'advantage_score': advantage_score,
+        'relative_wind_dir': relative_direction
+    }
+
+
+def humidity_scores(humidity_pct, temperature_c):
+    """Hitting advantage from humidity, stronger the warmer it is (-1.0 to +1.0)"""
+    humidity_pct = np.asarray(humidity_pct, dtype=float)
+    temp_f = celsius_to_fahrenheit(np.asarray(temperature_c, dtype=float))
+
+    # No effect below 50°F, full effect from 90°F, proportional in between
+    temp_factor = np.where(temp_f >= 90, 1.0, (temp_f - 50) / 40)
+    humidity_boost = np.where(temp_f < 50, 0.0, ((humidity_pct - 50) / 40) * temp_factor)
+
+    return np.clip(humidity_boost, -1.0, 1.0)
+
+
+def elevation_scores(elevation_ft):
+    """Hitting advantage from elevation, Coors = 1.0, sea level = -0.3"""
+    elevation_ft = np.asarray(elevation_ft, dtype=float)
+    return np.select(
+        [elevation_ft >= 5000, elevation_ft >= 1000, elevation_ft < 100],
+        [1.0, (elevation_ft - 500) / 4500, -0.3],
+        default=(elevation_ft - 100) / 900 * 0.3
+    )
+
+
+def air_density_scores(humidity_pct, temperature_c, elevation_ft):
+    """Combined air density effect; higher = thinner air, ball travels further"""
+    temp_factor = (celsius_to_fahrenheit(np.asarray(temperature_c, dtype=float)) - 60) / 30
+    humidity_factor = (np.asarray(humidity_pct, dtype=float) - 50) / 50
+    elevation_factor = np.asarray(elevation_ft, dtype=float) / 5200
+
+    combined = (
+        temp_factor * 0.35 +
+        humidity_factor * 0.25 +
+        elevation_factor * 0.40
+    )
+
+    return np.clip(combined, -1.5, 1.5)
+
+
+def air_conditions(humidity_pct, temperature_c, elevation_ft):
+    """Humidity, elevation and air density scores with their rating, for arrays of games"""
+    air_density = air_density_scores(humidity_pct, temperature_c, elevation_ft)
+    rating = np.select([air_density >= threshold for threshold, _ in AIR_DENSITY_RATINGS],
+                       [label for _, label in AIR_DENSITY_RATINGS], default='Very Unfavorable')
+
+    return {
+        'humidity_score': humidity_scores(humidity_pct, temperature_c).round(2),
+        # Python's round (correctly rounded) rather than np.round, which can differ in the last digit
+        'elevation_score': np.array([round(score, 2) for score in elevation_scores(elevation_ft).tolist()]),
+        'air_density_score': air_density.round(2),
+        'rating': rating,
+        'expected_distance_change_ft': (air_density * 20).round(1),  # Est. feet
+    }
+
+
+def venue_conditions_table(weather_df):
+    """Temperature, wind and air inputs for every venue in the weather snapshot (one row per venue)"""
+    if weather_df is None or 'venue' not in weather_df.columns:
+        weather_df = pd.DataFrame(columns=['venue', 'team'])
+
+    venues = weather_df.drop_duplicates('venue').reset_index(drop=True)
+    table = pd.DataFrame({
+        'venue': venues['venue'],
+        'team': venues['team'] if 'team' in venues.columns else None,
+    })
+
+    def column(name, default):
+        return venues[name] if name in venues.columns else pd.Series(default, index=venues.index)
+
+    table['humidity_pct'] = column('humidity_pct', DEFAULT_HUMIDITY_PCT)
+    table['temperature_c'] = column('temperature_c', DEFAULT_TEMPERATURE_C)
+
+    temperature = temperature_advantages(table['temperature_c'])
+    table['temp_fahrenheit'] = temperature['temp_fahrenheit'].round(1)
+    table['temp_category'] = temperature['category']
+    table['temp_advantage'] = temperature['advantage_score']
+    table['temp_impact'] = temperature['impact']
+
+    wind = wind_components(column('wind_direction_degrees', 0), column('wind_speed_kmh', 0),
+                           table['venue'].map(STADIUM_ORIENTATIONS).fillna(0))
+    table['wind_speed_kmh'] = column('wind_speed_kmh', 0)
+    table['wind_direction'] = column('wind_direction_cardinal', '')
+    table['wind_component_kmh'] = wind['wind_component_kmh']
+    table['crosswind_kmh'] = wind['crosswind_kmh']
+    table['relative_wind_dir'] = wind['relative_wind_dir']
+    table['wind_advantage'] = wind['advantage_score']
+
+    return table
+
+
+def venue_conditions_for(context, weather_df):
+    """The run's shared venue table when weather_df is the run's weather, else a fresh one"""
+    if context is not None and weather_df is context.weather:
+        return context.venue_conditions
+    return venue_conditions_table(weather_df)
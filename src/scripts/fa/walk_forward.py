@@ -0,0 +1,289 @@
+#!/usr/bin/env python3
+"""
+Walk-Forward Factor Snapshots
+
+Runs the real factor analyzers (factor_registry.py) day by day over a date
+range, as of each date, and stores every day's factor matrix.
+
+Backtesting weights used to score history with simplified per-game
+stand-ins in backtest_weights.py (several of them random), because running
+the analyzers once per historical date was too slow. The engine keeps it
+affordable:
+
+- One FactorDataContext per season, shared by every date and factor of that
+  season: the schedule, players, teams and game logs are read and indexed once
+- Windowed factors only score the date's games (window_days=1); factors that
+  score the whole schedule are narrowed to the date afterwards
+- Each date's matrix is saved once and reused; a later run only computes the
+  dates - and the factors of a date - that are not stored yet
+
+History factors read the previous season's game logs (gamelog_season =
+season - 1), so nothing from the snapshot's own season leaks in. Weather is
+the stadium snapshot in the data directory; there is no historical weather.
+
+Snapshots (data/factor_snapshots/):
+- factor_matrix_snapshot_<YYYYMMDD>.npz / .json - the factor_matrix.py format,
+  one row per player with a game that day (game_date = the snapshot date)
+
+Usage:
+    python src/scripts/fa/walk_forward.py --start-date 2024-04-01 --end-date 2024-09-30
+    python src/scripts/fa/walk_forward.py --season 2024 --factors wind,park,platoon
+
+    engine = WalkForwardEngine(data_dir)
+    engine.run('2024-04-01', '2024-04-30')
+    history = SnapshotStore(data_dir).load_range('2024-04-01', '2024-04-30')
+"""
+
+import io
+import sys
+import time
+import argparse
+import contextlib
+import pandas as pd
+from pathlib import Path
+
+# Add src to path
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.fa.data_context import FactorDataContext, schedule_window
+from scripts.fa.factor_matrix import (
+    build_factor_matrix, save_factor_matrix, load_factor_matrix, load_factor_manifest, factor_scores
+)
+from scripts.fa.factor_registry import select_factors, required_inputs
+
+
+SNAPSHOT_DIR = 'factor_snapshots'
+SNAPSHOT_SUFFIX = 'snapshot'
+
+
+class SnapshotStore:
+    """Per-date factor matrices under data/factor_snapshots/"""
+
+    def __init__(self, data_dir):
+        self.directory = Path(data_dir) / SNAPSHOT_DIR
+
+    def path(self, date):
+        """Matrix file of a date"""
+        stamp = pd.Timestamp(date).strftime('%Y%m%d')
+        return self.directory / f"factor_matrix_{SNAPSHOT_SUFFIX}_{stamp}.npz"
+
+    def factors(self, date):
+        """Factor keys stored for a date (empty if the date has no complete snapshot)"""
+        try:
+            # The manifest is written after the matrix, so it only exists for complete snapshots
+            return load_factor_manifest(self.path(date))['factors']
+        except (OSError, ValueError, KeyError):
+            return []
+
+    def version(self, date):
+        """Modification time (ns) of a date's manifest, which is rewritten with every save; 0 if not stored"""
+        try:
+            return self.path(date).with_suffix('.json').stat().st_mtime_ns
+        except OSError:
+            return 0
+
+    def dates(self):
+        """Stored snapshot dates, oldest first"""
+        prefix = f"factor_matrix_{SNAPSHOT_SUFFIX}_"
+        return sorted(pd.Timestamp(f.stem[len(prefix):])
+                      for f in self.directory.glob(f"{prefix}*.json"))
+
+    def load(self, date):
+        """One date's matrix [player_id, player_name, game_date, <factor>...]"""
+        return load_factor_matrix(self.path(date))
+
+    def save(self, date, matrix, manifest):
+        """Write a date's matrix and manifest; returns the .npz path"""
+        self.directory.mkdir(parents=True, exist_ok=True)
+        return save_factor_matrix(matrix, self.directory, SNAPSHOT_SUFFIX,
+                                  pd.Timestamp(date).strftime('%Y%m%d'), manifest)
+
+    def load_range(self, start_date=None, end_date=None):
+        """All stored snapshots between two dates (inclusive) as one frame; factors a date lacks are NaN"""
+        dates = [d for d in self.dates()
+                 if (start_date is None or d >= pd.Timestamp(start_date)) and
+                    (end_date is None or d <= pd.Timestamp(end_date))]
+        frames = [self.load(d) for d in dates]
+        if not frames:
+            return pd.DataFrame(columns=['player_id', 'player_name', 'game_date'])
+        return pd.concat(frames, ignore_index=True)
+
+
+def season_roster(context, season):
+    """Players of a season from the all-players table, with the team columns the analyzers expect"""
+    players = context.players
+    roster_df = players[players['season'] == season].copy() if 'season' in players.columns else players.copy()
+    if 'team_name' in roster_df.columns:
+        roster_df['team'] = roster_df['team_name']
+        roster_df['mlb_team'] = roster_df['team_name']
+    return roster_df.reset_index(drop=True)
+
+
+def matrix_scores(matrix, factors):
+    """Stored matrix columns back to factor_scores frames (player_name, game_date, score)"""
+    return {
+        key: matrix[['player_name', 'game_date']].assign(score=matrix[key]).dropna(subset=['score'])
+        for key in factors
+    }
+
+
+class WalkForwardEngine:
+    """Computes and stores per-date factor snapshots over a date range"""
+
+    def __init__(self, data_dir, factors=None, roster_df=None):
+        """
+        Args:
+            data_dir: Data directory (schedules, players, teams, game logs)
+            factors: Factor keys (list or 'wind,park' string); None runs every factor
+            roster_df: Players to score; defaults to each season's players
+        """
+        self.data_dir = Path(data_dir)
+        self.specs = select_factors(factors)
+        self.inputs = required_inputs(self.specs)
+        self.roster_df = roster_df
+        self.store = SnapshotStore(self.data_dir)
+        self._contexts = {}
+
+    def context_for(self, season):
+        """The season's shared data context (history from the season before), loaded once"""
+        if season not in self._contexts:
+            context = FactorDataContext(self.data_dir, schedule_season=season, gamelog_season=season - 1)
+            self._contexts[season] = context.preload(self.inputs)
+        return self._contexts[season]
+
+    def game_dates(self, start_date, end_date):
+        """Dates between start and end (inclusive) with at least one scheduled game"""
+        start, end = pd.Timestamp(start_date).normalize(), pd.Timestamp(end_date).normalize()
+        dates = set()
+        for season in range(start.year, end.year + 1):
+            if not (self.data_dir / f"mlb_{season}_schedule.csv").exists():
+                continue
+            game_dates = pd.to_datetime(self.context_for(season).schedule['game_date']).dt.normalize()
+            dates.update(game_dates[(game_dates >= start) & (game_dates <= end)])
+        return sorted(dates)
+
+    def score_factors(self, date, specs, context, roster_df):
+        """
+        Run factors as of a date; returns ({key: scores narrowed to the date}, failed keys)
+
+        A factor that raises is left out (its column stays NaN) so one broken
+        analyzer does not cost the whole date.
+        """
+        date_str = date.strftime('%Y-%m-%d')
+        scores = {}
+        failed = []
+        for spec in specs:
+            try:
+                analyzer = spec.create(self.data_dir)
+                with contextlib.redirect_stdout(io.StringIO()):
+                    df = analyzer.analyze_roster(roster_df, *spec.roster_args(context),
+                                                 **spec.roster_kwargs(context, date, window_days=1))
+                factor_df, _ = factor_scores(df, spec.score_column)
+            except Exception:
+                factor_df = None
+            if factor_df is None:
+                failed.append(spec.key)
+                continue
+            scores[spec.key] = factor_df[factor_df['game_date'].isin(['', date_str])]
+        return scores, failed
+
+    def snapshot(self, date, force=False):
+        """
+        Compute and store one date's snapshot (only the factors it is missing)
+
+        Returns the list of factor keys computed (empty if the snapshot was
+        complete), or None if every factor that still had to run failed - the
+        date is then left as it was, to be retried on the next run.
+        """
+        date = pd.Timestamp(date).normalize()
+        date_str = date.strftime('%Y-%m-%d')
+        stored = [] if force else self.store.factors(date)
+        specs = [spec for spec in self.specs if spec.key not in stored]
+        if not specs:
+            return []
+
+        context = self.context_for(date.year)
+        roster_df = self.roster_df if self.roster_df is not None else season_roster(context, date.year)
+        scores, failed = self.score_factors(date, specs, context, roster_df)
+        if not scores:
+            return None
+
+        previous = {}
+        if stored:
+            previous = matrix_scores(self.store.load(date), stored)
+        all_scores = {**previous, **scores}
+        factor_keys = [spec.key for spec in select_factors(list(all_scores))]
+        matrix = build_factor_matrix({key: all_scores[key] for key in factor_keys}, roster_df, context.players)
+
+        # Keep players with a game that day; player-level scores take the date of that game
+        todays_games = schedule_window(context.schedule, date, 1)
+        playing = set(todays_games['home_team']) | set(todays_games['away_team'])
+        team_of = dict(zip(roster_df['player_name'], roster_df['team'])) if 'team' in roster_df.columns else {}
+        undated = (matrix['game_date'] == '') & matrix['player_name'].map(team_of).isin(playing)
+        matrix.loc[undated, 'game_date'] = date_str
+        matrix = matrix[matrix['game_date'] == date_str].reset_index(drop=True)
+
+        manifest = {
+            'as_of_date': date_str,
+            'schedule_season': context.schedule_season,
+            'gamelog_season': context.gamelog_season,
+            'failed_factors': failed,
+        }
+        self.store.save(date, matrix, manifest)
+        return list(scores)
+
+    def run(self, start_date, end_date, force=False):
+        """Snapshot every game date in the range; returns {date: factor keys computed} for the dates that stored something"""
+        dates = self.game_dates(start_date, end_date)
+        computed = {}
+        start_time = time.perf_counter()
+
+        for i, date in enumerate(dates, 1):
+            date_str = date.strftime('%Y-%m-%d')
+            keys = self.snapshot(date, force=force)
+            if keys is None:
+                print(f"[{i}/{len(dates)}] ❌ {date_str}: every factor failed, nothing stored")
+                continue
+            if not keys:
+                print(f"[{i}/{len(dates)}] ⏭️  {date_str}: nothing new to store")
+                continue
+
+            computed[date] = keys
+            per_date = (time.perf_counter() - start_time) / len(computed)
+            print(f"[{i}/{len(dates)}] ✓ {date_str}: {len(keys)} factor(s) "
+                  f"({per_date:.1f}s per date, ~{per_date * (len(dates) - i) / 60:.1f} min left)")
+
+        return computed
+
+
+def main():
+    parser = argparse.ArgumentParser(description='Store per-date factor snapshots for walk-forward backtests')
+    parser.add_argument('--start-date', type=str, help='First date (YYYY-MM-DD)')
+    parser.add_argument('--end-date', type=str, help='Last date (YYYY-MM-DD)')
+    parser.add_argument('--season', type=int, help='Snapshot a whole season instead of a date range')
+    parser.add_argument('--factors', type=str, help='Comma-separated factor keys (default: all)')
+    parser.add_argument('--force', action='store_true', help='Recompute dates that are already stored')
+    args = parser.parse_args()
+
+    if args.season:
+        start_date, end_date = f"{args.season}-01-01", f"{args.season}-12-31"
+    elif args.start_date and args.end_date:
+        start_date, end_date = args.start_date, args.end_date
+    else:
+        parser.error('give --season or both --start-date and --end-date')
+
+    data_dir = Path(__file__).parent.parent.parent.parent / 'data'
+
+    try:
+        engine = WalkForwardEngine(data_dir, factors=args.factors)
+    except ValueError as e:
+        print(f"❌ {e}")
+        sys.exit(1)
+
+    print(f"📅 Walk-forward snapshots {start_date} to {end_date}: {', '.join(spec.key for spec in engine.specs)}")
+    computed = engine.run(start_date, end_date, force=args.force)
+    print(f"\n✅ Computed {len(computed)} date(s); snapshots in {engine.store.directory}")
+
+
+if __name__ == '__main__':
+    main()
@@ -22,128 +22,83 @@ import pandas as pd
 import numpy as np
 from pathlib import Path
 
+try:
+    from .venue_conditions import STADIUM_ORIENTATIONS, venue_conditions_for, venue_conditions_table, wind_components
+    from .data_context import schedule_window
+except ImportError:
+    from venue_conditions import STADIUM_ORIENTATIONS, venue_conditions_for, venue_conditions_table, wind_components
+    from data_context import schedule_window
+
 
 class WindAnalyzer:
     """Analyze wind impact on player performance"""
     
     # Stadium orientations (pitcher mound → home plate direction in degrees)
-    STADIUM_ORIENTATIONS = {
-        'Chase Field': 20,
-        'Truist Park': 15,
-        'Oriole Park at Camden Yards': 54,
-        'Fenway Park': 287,
-        'Wrigley Field': 190,
-        'Guaranteed Rate Field': 18,
-        'Great American Ball Park': 235,
-        'Progressive Field': 95,
-        'Coors Field': 5,
-        'Comerica Park': 55,
-        'Minute Maid Park': 350,
-        'Kauffman Stadium': 80,
-        'Angel Stadium': 210,
-        'Dodger Stadium': 330,
-        'LoanDepot Park': 235,
-        'American Family Field': 205,
-        'Target Field': 235,
-        'Citi Field': 45,
-        'Yankee Stadium': 282,
-        'Oakland Coliseum': 325,
-        'Citizens Bank Park': 5,
-        'PNC Park': 325,
-        'Petco Park': 320,
-        'Oracle Park': 310,
-        'T-Mobile Park': 47,
-        'Busch Stadium': 240,
-        'Tropicana Field': 5,
-        'Globe Life Field': 355,
-        'Rogers Centre': 198,
-        'Nationals Park': 325,
-        'Sutter Health Park': 45,
-    }
+    STADIUM_ORIENTATIONS = STADIUM_ORIENTATIONS
     
     def __init__(self, data_dir):
         self.data_dir = Path(data_dir)
     
-    def calculate_wind_advantage(self, wind_direction, wind_speed, stadium_orientation):
-        """Calculate wind advantage for hitting/pitching"""
-        relative_direction = (wind_direction - stadium_orientation) % 360
-        if relative_direction > 180:
-            relative_direction -= 360
+    def calculate_wind_components(self, wind_direction, wind_speed, stadium_orientation):
+        """Wind components and advantage scores over arrays of venues (see venue_conditions.py)"""
+        return wind_components(wind_direction, wind_speed, stadium_orientation)
+    
+    def venue_wind_table(self, weather_df, venue_conditions=None):
+        """Wind components for every venue in the weather snapshot (one row per venue)"""
+        if venue_conditions is None:
+            venue_conditions = venue_conditions_table(weather_df)
+        return venue_conditions[['venue', 'wind_speed_kmh', 'wind_direction', 'wind_component_kmh',
+                                 'crosswind_kmh', 'wind_advantage']].rename(columns={'wind_advantage': 'advantage_score'})
+    
+    def analyze(self, games_df, weather_df, roster_df, venue_conditions=None):
+        """Analyze wind advantages for games"""
+        columns = ['player_name', 'game_date', 'venue', 'wind_speed_kmh', 'wind_direction',
+                   'wind_component_kmh', 'crosswind_kmh', 'wind_score']
         
-        wind_component = np.cos(np.radians(relative_direction)) * wind_speed
+        # Games with weather for their venue
+        venue_wind = self.venue_wind_table(weather_df, venue_conditions)
+        games = games_df[['game_date', 'venue', 'home_team', 'away_team']].reset_index(drop=True)
+        games['game_order'] = np.arange(len(games))
+        games = games.merge(venue_wind, on='venue', how='inner')
         
-        if wind_component > 10:
-            advantage_score = 2.0
-        elif wind_component > 5:
-            advantage_score = 1.0
-        elif wind_component > -5:
-            advantage_score = 0.0
-        elif wind_component > -10:
-            advantage_score = -1.0
-        else:
-            advantage_score = -2.0
+        # One row per (game, team) so players join to the games their team plays in
+        team_games = pd.concat([
+            games.rename(columns={'home_team': 'team'}).drop(columns='away_team'),
+            games.rename(columns={'away_team': 'team'}).drop(columns='home_team'),
+        ], ignore_index=True)
         
-        crosswind = abs(np.sin(np.radians(relative_direction)) * wind_speed)
+        # Players with a known team
+        team_col = 'team' if 'team' in roster_df.columns else 'mlb_team'
+        players = pd.DataFrame({
+            'player_name': roster_df['player_name'].values,
+            'team': roster_df[team_col].values if team_col in roster_df.columns else '',
+            'mlb_team': roster_df['mlb_team'].values if 'mlb_team' in roster_df.columns else '',
+            'position': roster_df['position'].values if 'position' in roster_df.columns else '',
+            'player_order': np.arange(len(roster_df)),
+        })
+        players = players[players['mlb_team'].fillna('').astype(bool)]
         
-        return {
-            'wind_component_kmh': wind_component,
-            'crosswind_kmh': crosswind,
-            'advantage_score': advantage_score,
-            'relative_wind_dir': relative_direction
-        }
-    
-    def analyze(self, games_df, weather_df, roster_df):
-        """Analyze wind advantages for games"""
-        results = []
+        results = team_games.merge(players, on='team', how='inner')
+        if results.empty:
+            return pd.DataFrame(columns=columns)
+        
+        results = results.sort_values(['game_order', 'player_order'], kind='stable')
         
-        for _, game in games_df.iterrows():
-            venue = game['venue']
-            venue_weather = weather_df[weather_df['venue'] == venue]
-            
-            if venue_weather.empty:
-                continue
-            
-            weather = venue_weather.iloc[0]
-            orientation = self.STADIUM_ORIENTATIONS.get(venue, 0)
-            
-            advantage = self.calculate_wind_advantage(
-                weather['wind_direction_degrees'],
-                weather['wind_speed_kmh'],
-                orientation
-            )
-            
-            # Find roster players in this game
-            for _, player in roster_df.iterrows():
-                player_team = player.get('mlb_team', '')
-                if not player_team:
-                    continue
-                
-                # Match player to game (simplified)
-                is_pitcher = player.get('position', '') in ['SP', 'RP', 'P']
-                score = -advantage['advantage_score'] if is_pitcher else advantage['advantage_score']
-                
-                results.append({
-                    'player_name': player['player_name'],
-                    'game_date': game['game_date'],
-                    'venue': venue,
-                    'wind_speed_kmh': weather['wind_speed_kmh'],
-                    'wind_direction': weather['wind_direction_cardinal'],
-                    'wind_component_kmh': advantage['wind_component_kmh'],
-                    'crosswind_kmh': advantage['crosswind_kmh'],
-                    'wind_score': score
-                })
+        is_pitcher = results['position'].isin(['SP', 'RP', 'P'])
+        results['wind_score'] = np.where(is_pitcher, -results['advantage_score'], results['advantage_score'])
         
-        return pd.DataFrame(results)
+        return results[columns].reset_index(drop=True)
 
 
-    def analyze_roster(self, roster_df, schedule_df, weather_df=None):
-        """Wrapper for analyze to match interface"""
-        return self.analyze(schedule_df, weather_df, roster_df)
-    
-    def _load_gamelogs(self):
-        """Helper to load game logs if needed"""
-        game_logs_file = self.data_dir / "mlb_game_logs_2024.csv"
-        if game_logs_file.exists():
-            import pandas as pd
-            return pd.read_csv(game_logs_file)
-        return pd.DataFrame()
+    def analyze_roster(self, roster_df, schedule_df, weather_df=None, context=None,
+                       target_date=None, window_days=None):
+        """Wrapper for analyze to match interface
+        
+        When target_date is given, only games from target_date through
+        target_date + window_days - 1 (default: that day only) are analyzed.
+        """
+        if weather_df is None and context is not None:
+            weather_df = context.weather
+        if target_date is not None:
+            schedule_df = schedule_window(schedule_df, target_date, window_days or 1)
+        return self.analyze(schedule_df, weather_df, roster_df, venue_conditions_for(context, weather_df))
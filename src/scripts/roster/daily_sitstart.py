@@ -32,6 +32,9 @@ sys.path.insert(0, str(Path(__file__).parent.parent.parent))
 # Import waiver wire analyzer
 from scripts.waiver.waiver_wire import WaiverWireAnalyzer
 
+# Factor score column lookup shared with the FA runner
+from scripts.fa.factor_matrix import find_score_column
+
 
 class DailySitStartManager:
     """Manages daily sit/start decision process"""
@@ -162,12 +165,14 @@ class DailySitStartManager:
             print(f"  ✗ Error running all-players analysis: {e}")
             all_players_success = False
         
-        # Second run: Rostered players only (for sit/start)
+        # Second run: Rostered players only (for sit/start), limited to the target day/week's games
+        window_days = 7 if self.week_mode else 1
         print(f"\n▶ Running analyses for ROSTERED players (for sit/start)...")
         
         try:
             result = subprocess.run(
-                [sys.executable, str(script_path), "--date", target_date_str],
+                [sys.executable, str(script_path), "--date", target_date_str,
+                 "--window-days", str(window_days)],
                 cwd=str(self.project_root),
                 capture_output=True,
                 text=True,
@@ -203,10 +208,15 @@ class DailySitStartManager:
             print("    Using default weights for recommendations")
             return True
         
-        # Run backtest with optimize and save flags
+        # Run backtest with optimize and save flags; each player's weights are
+        # saved as soon as that player is done. Incremental: only players with
+        # enough new games are re-tuned, starting from their saved weights.
+        # One job: a player tunes in well under a second, while every worker
+        # process would get its own copy of the historical games
         try:
             result = subprocess.run(
-                [sys.executable, str(backtest_script), "--optimize", "--save"],
+                [sys.executable, str(backtest_script), "--optimize", "--save", "--incremental",
+                 "--jobs", "1"],
                 cwd=str(self.project_root),
                 capture_output=True,
                 text=True,
@@ -228,7 +238,8 @@ class DailySitStartManager:
                 return True
                 
         except subprocess.TimeoutExpired:
-            print("⚠️  Weight tuning timed out - using default weights")
+            print("⚠️  Weight tuning timed out - players tuned before the timeout keep their new weights,")
+            print("    the rest use default/existing weights")
             return True
         except Exception as e:
             print(f"⚠️  Weight tuning error: {e}")
@@ -320,6 +331,13 @@ class DailySitStartManager:
             'vegas': self._get_latest_file('vegas_odds_analysis_*.csv'),
         }
         
+        # Read each factor file once into a score lookup
+        score_lookups = {
+            factor_name: self._load_factor_scores(file_path)
+            for factor_name, file_path in fa_files.items()
+            if file_path and file_path.exists()
+        }
+        
         # Load player-specific weights if they exist
         weights = self._load_weights()
         
@@ -332,11 +350,10 @@ class DailySitStartManager:
             
             # Get scores from each factor
             scores = {}
-            for factor_name, file_path in fa_files.items():
-                if file_path and file_path.exists():
-                    score = self._get_player_score(file_path, player_name, player_id)
-                    if score is not None:
-                        scores[factor_name] = score
+            for factor_name, lookup in score_lookups.items():
+                score = self._get_player_score(lookup, player_name, player_id)
+                if score is not None:
+                    scores[factor_name] = score
             
             if scores:
                 # Get player-specific weights or use defaults
@@ -354,57 +371,53 @@ class DailySitStartManager:
         
         return recommendations
     
-    def _get_player_score(self, file_path: Path, player_name: str, player_id: Optional[int]) -> Optional[float]:
-        """Extract player's score from a factor analysis file"""
+    def _load_factor_scores(self, file_path: Path) -> Optional[Dict]:
+        """Read a factor analysis file once into {'names': {name: score}, 'ids': {player_id: score}}"""
         try:
             df = pd.read_csv(file_path)
+            score_col = find_score_column(df)
+            if score_col is None or 'player_name' not in df.columns:
+                return None
             
-            # Try matching by name
-            mask = df['player_name'].str.contains(player_name, case=False, na=False)
-            if mask.any():
-                row = df[mask].iloc[0]
-                # Look for score column (check multiple patterns)
-                score_columns = [
-                    'score', 'final_score', 'advantage_score', 'impact_score',
-                    'platoon_score', 'temp_score', 'pitch_mix_score', 'park_score',
-                    'lineup_score', 'time_score', 'defense_score', 'form_score',
-                    'bullpen_score', 'humidity_score', 'monthly_score', 'momentum_score',
-                    'statcast_score', 'vegas_score', 'wind_score', 'umpire_score'
-                ]
-                # Also check for any column ending with '_score'
-                for col in df.columns:
-                    if col.endswith('_score') and col not in score_columns:
-                        score_columns.append(col)
-                
-                for col in score_columns:
-                    if col in df.columns:
-                        return float(row[col])
+            # First row per player wins (per-game files list the earliest game first); dicts keep
+            # file order, so the partial-name fallback also finds the first matching row
+            rows = pd.DataFrame({
+                'name': df['player_name'].astype(str).str.strip().str.lower(),
+                'score': pd.to_numeric(df[score_col], errors='coerce'),
+            })
+            first = rows.drop_duplicates('name')
+            by_name = dict(zip(first['name'], first['score']))
             
-            # Try matching by ID if available
-            if player_id and 'player_id' in df.columns:
-                mask = df['player_id'] == player_id
-                if mask.any():
-                    row = df[mask].iloc[0]
-                    score_columns = [
-                        'score', 'final_score', 'advantage_score', 'impact_score',
-                        'platoon_score', 'temp_score', 'pitch_mix_score', 'park_score',
-                        'lineup_score', 'time_score', 'defense_score', 'form_score',
-                        'bullpen_score', 'humidity_score', 'monthly_score', 'momentum_score',
-                        'statcast_score', 'vegas_score', 'wind_score', 'umpire_score'
-                    ]
-                    for col in df.columns:
-                        if col.endswith('_score') and col not in score_columns:
-                            score_columns.append(col)
-                    
-                    for col in score_columns:
-                        if col in df.columns:
-                            return float(row[col])
+            by_id = {}
+            if 'player_id' in df.columns:
+                rows['id'] = pd.to_numeric(df['player_id'], errors='coerce')
+                first = rows.dropna(subset=['id']).drop_duplicates('id')
+                by_id = dict(zip(first['id'], first['score']))
             
-            return None
+            return {'names': by_name, 'ids': by_id}
             
         except Exception:
             return None
     
+    def _get_player_score(self, lookup: Optional[Dict], player_name: str, player_id: Optional[int]) -> Optional[float]:
+        """Look up a player's score in a factor score lookup (by name, then ID, then partial name)"""
+        if not lookup:
+            return None
+        
+        name_key = str(player_name).strip().lower()
+        if name_key in lookup['names']:
+            return float(lookup['names'][name_key])
+        
+        if player_id is not None and pd.notna(player_id) and player_id in lookup['ids']:
+            return float(lookup['ids'][player_id])
+        
+        # Fall back to a partial match (e.g. roster "Luis Garcia" vs "Luis Garcia Jr.")
+        for name, score in lookup['names'].items():
+            if name_key and name_key in name:
+                return float(score)
+        
+        return None
+    
     def _load_weights(self) -> Dict:
         """Load player-specific weights from config"""
         weight_file = self.config_dir / "player_weights.json"
@@ -10,9 +10,22 @@ Usage:
     python src/scripts/backtest_weights.py                    # Run for entire roster
     python src/scripts/backtest_weights.py --player "Ohtani"  # Run for specific player
     python src/scripts/backtest_weights.py --save             # Save tuned weights
+    python src/scripts/backtest_weights.py --optimize --maxiter 200 --popsize 30   # Longer search
+    python src/scripts/backtest_weights.py --optimize --save --jobs 8               # 8 players at a time
+    python src/scripts/backtest_weights.py --optimize --save --incremental          # Daily re-tune
+    python src/scripts/backtest_weights.py --optimize --snapshots   # Tune on walk-forward factor snapshots
+
+--snapshots scores history with the real factor analyzers: the per-date factor
+matrices stored by src/scripts/fa/walk_forward.py, joined with each player's
+actual fantasy points from the game logs. Without it the simplified analyze_*
+stand-ins below are used.
 """
 
+import io
+import os
+import re
 import sys
+import contextlib
 import pandas as pd
 import numpy as np
 from pathlib import Path
@@ -20,10 +33,33 @@ from datetime import datetime
 import json
 from typing import Dict, List
 import argparse
+from concurrent.futures import ProcessPoolExecutor, as_completed
 from scipy.optimize import differential_evolution
 
 # Add src to path for imports
-sys.path.insert(0, str(Path(__file__).parent.parent))
+sys.path.insert(0, str(Path(__file__).parent.parent.parent))
+
+from scripts.fa.game_log_loader import load_game_logs
+from scripts.fa.walk_forward import SnapshotStore
+
+# Differential evolution settings (generations, and population size per weight)
+DEFAULT_MAXITER = 20
+DEFAULT_POPSIZE = 10
+
+# Incremental mode: re-tune a player only once this many new games have arrived
+DEFAULT_MIN_NEW_GAMES = 3
+
+# Walk-forward snapshot columns (factor registry keys) of the tuner's factors, where the names differ
+SNAPSHOT_FACTOR_KEYS = {
+    'park_factors': 'park',
+    'rest_day': 'rest',
+    'lineup_position': 'lineup',
+    'time_of_day': 'time',
+    'defensive_positions': 'defense',
+}
+
+# Fantasy points per game log stat (the scoring of get_actual_performance)
+GAME_LOG_POINTS = {'1B': 3, '2B': 5, '3B': 8, 'HR': 10, 'RBI': 2, 'R': 2, 'SB': 5, 'BB': 2, 'SO': -1}
 
 
 class WeightTuner:
@@ -55,6 +91,7 @@ class WeightTuner:
         # Load existing weights if available
         self.weights_file = self.config_dir / "factor_weights.json"
         self.player_weights_file = self.config_dir / "player_weights.json"
+        self.score_cache_dir = self.data_dir / "weight_cache"
         
         self.global_weights = self.load_weights(self.weights_file, self.default_weights)
         self.player_weights = self.load_player_weights()
@@ -81,12 +118,15 @@ class WeightTuner:
                 return {}
         return {}
     
-    def save_weights(self, weights: Dict, file_path: Path):
-        """Save weights to JSON file"""
+    def save_weights(self, weights: Dict, file_path: Path, quiet: bool = False):
+        """Save weights to JSON file (written to a temp file and renamed, so it is never half-written)"""
         try:
-            with open(file_path, 'w') as f:
+            tmp_path = file_path.with_name(file_path.name + '.tmp')
+            with open(tmp_path, 'w') as f:
                 json.dump(weights, f, indent=2)
-            print(f"✓ Saved weights to {file_path}")
+            os.replace(tmp_path, file_path)
+            if not quiet:
+                print(f"✓ Saved weights to {file_path}")
         except Exception as e:
             print(f"✗ Error saving weights to {file_path}: {e}")
     
@@ -128,6 +168,60 @@ class WeightTuner:
         print(f"\n✓ Loaded {len(games_df)} completed games from {start_year}-{current_year}")
         return games_df
     
+    def load_snapshot_games(self, start_year: int = 2022) -> pd.DataFrame:
+        """
+        Walk-forward factor snapshots from start_year on, one row per player and
+        game date, with the actual fantasy points scored that day (rows without
+        a game log are dropped)
+        
+        Rows are joined to the game logs on player_id, and on player_name only
+        for players the snapshot has no id for. game_version fingerprints the
+        snapshot file and the actual points, so the incremental score cache
+        rescores a date when its snapshot is recomputed or a game log corrected.
+        """
+        store = SnapshotStore(self.data_dir)
+        snapshots = store.load_range(start_date=f"{start_year}-01-01")
+        if snapshots.empty:
+            print("⚠️  No factor snapshots found. Run src/scripts/fa/walk_forward.py first.")
+            return pd.DataFrame()
+        
+        game_logs = load_game_logs(self.data_dir, list(range(start_year, datetime.now().year + 1)))
+        if game_logs.empty:
+            print("⚠️  No game logs found to score the snapshots against")
+            return pd.DataFrame()
+        
+        by_name = snapshots['player_id'].isna() | ('player_id' not in game_logs.columns)
+        frames = [snapshots[by_name].merge(self.game_log_points(game_logs, 'player_name'),
+                                           on=['player_name', 'game_date'], how='inner')]
+        if not by_name.all():
+            frames.insert(0, snapshots[~by_name].astype({'player_id': np.int64}).merge(
+                self.game_log_points(game_logs, 'player_id'), on=['player_id', 'game_date'], how='inner'))
+        games_df = pd.concat(frames, ignore_index=True)
+        
+        # One row per player and date, so the date stands in for the game key (incremental score cache)
+        games_df['game_pk'] = games_df['game_date'].str.replace('-', '').astype(np.int64)
+        snapshot_versions = {date: store.version(date) for date in games_df['game_date'].unique()}
+        fingerprint = pd.DataFrame({'snapshot': games_df['game_date'].map(snapshot_versions),
+                                    'actual': games_df['actual']})
+        games_df['game_version'] = pd.util.hash_pandas_object(fingerprint, index=False).to_numpy().view(np.int64)
+        
+        print(f"\n✓ Loaded {len(games_df)} player games from {snapshots['game_date'].nunique()} factor snapshots")
+        return games_df
+    
+    def game_log_points(self, game_logs: pd.DataFrame, key: str = 'player_id') -> pd.DataFrame:
+        """Fantasy points per player and date (doubleheaders summed): key, game_date, actual"""
+        game_logs = game_logs.dropna(subset=[key])
+        stats = game_logs.reindex(columns=list(GAME_LOG_POINTS)).astype(float)
+        if '1B' not in game_logs.columns and 'H' in game_logs.columns:
+            stats['1B'] = game_logs['H'] - stats[['2B', '3B', 'HR']].fillna(0).sum(axis=1)
+        
+        points = pd.DataFrame({
+            key: game_logs[key].astype(np.int64 if key == 'player_id' else str),
+            'game_date': pd.to_datetime(game_logs['game_date']).dt.strftime('%Y-%m-%d'),
+            'actual': stats.fillna(0) @ pd.Series(GAME_LOG_POINTS),
+        })
+        return points.groupby([key, 'game_date'], as_index=False)['actual'].sum()
+    
     def load_player_stats(self) -> pd.DataFrame:
         """Load historical player statistics"""
         stats_file = self.data_dir / "mlb_all_players_complete.csv"
@@ -350,9 +444,161 @@ class WeightTuner:
         
         return fantasy_points
     
+    def find_player_games(self, player: str, games_df: pd.DataFrame) -> pd.DataFrame:
+        """Games involving a player"""
+        if 'player_name' in games_df.columns:
+            # Factor snapshot rows belong to one player each
+            return games_df[games_df['player_name'].str.lower() == player.lower()]
+        return games_df[
+            (games_df['home_team'].str.contains(player, case=False, na=False)) |
+            (games_df['away_team'].str.contains(player, case=False, na=False))
+        ]
+    
+    def factor_score_matrix(self, player: str, player_games: pd.DataFrame):
+        """
+        Unweighted factor scores and actual fantasy points for a player's games
+        
+        Returns (scores, actuals): a games x factors array with columns in
+        default_weights order, and one fantasy point total per game. The
+        composite score for a weight vector w is then scores @ w, so candidate
+        weights can be scored without re-running the analyses.
+        """
+        scores, actuals, _ = self.score_games(player, player_games)
+        return scores, actuals
+    
+    def score_games(self, player: str, player_games: pd.DataFrame):
+        """factor_score_matrix plus the game_pk of each scored row (games that fail are left out)"""
+        if 'actual' in player_games.columns:
+            # Factor snapshot rows already hold the scores and actual points; factors without a score are neutral
+            columns = [SNAPSHOT_FACTOR_KEYS.get(factor, factor) for factor in self.default_weights]
+            scores = np.nan_to_num(player_games.reindex(columns=columns).to_numpy(dtype=float))
+            return (scores, player_games['actual'].to_numpy(dtype=float),
+                    player_games['game_pk'].to_numpy(dtype=np.int64))
+        
+        unit_weights = dict.fromkeys(self.default_weights, 1.0)
+        rows = []
+        actuals = []
+        game_keys = []
+        
+        for game_data in player_games.to_dict('records'):
+            try:
+                factor_scores = self.calculate_factor_scores(player, game_data, unit_weights)
+                actual_performance = self.get_actual_performance(player, game_data)
+            except Exception as e:
+                print(f"⚠️  Error processing game {game_data.get('game_pk', '')}: {e}")
+                continue
+            
+            rows.append([factor_scores.get(factor, 0.0) for factor in self.default_weights])
+            actuals.append(actual_performance)
+            game_keys.append(game_data.get('game_pk', -1))
+        
+        scores = np.array(rows, dtype=float).reshape(len(rows), len(self.default_weights))
+        return scores, np.array(actuals, dtype=float), np.array(game_keys, dtype=np.int64)
+    
+    def score_cache_file(self, player: str) -> Path:
+        """On-disk factor score matrix of a player (incremental mode)"""
+        slug = re.sub(r'[^a-z0-9]+', '_', player.lower()).strip('_')
+        return self.score_cache_dir / f"{slug}.npz"
+    
+    def load_score_cache(self, player: str):
+        """
+        (scores, actuals, game_keys, game_versions, tuned) from a player's cache;
+        empty if missing or built for other factors
+        """
+        factors = np.array(list(self.default_weights))
+        cache_file = self.score_cache_file(player)
+        if cache_file.exists():
+            with np.load(cache_file) as cached:
+                if np.array_equal(cached['factors'], factors) and 'game_versions' in cached.files:
+                    return (cached['scores'], cached['actuals'], cached['game_keys'],
+                            cached['game_versions'], cached['tuned'])
+        return (np.empty((0, len(factors))), np.empty(0), np.empty(0, dtype=np.int64),
+                np.empty(0, dtype=np.int64), np.empty(0, dtype=bool))
+    
+    def save_score_cache(self, player: str, scores, actuals, game_keys, game_versions, tuned):
+        """Write a player's cache (to a temp file, then renamed)"""
+        cache_file = self.score_cache_file(player)
+        self.score_cache_dir.mkdir(parents=True, exist_ok=True)
+        tmp_file = cache_file.with_name(cache_file.name + '.tmp')
+        with open(tmp_file, 'wb') as f:
+            np.savez(f, factors=np.array(list(self.default_weights)), scores=scores, actuals=actuals,
+                     game_keys=game_keys, game_versions=game_versions, tuned=tuned)
+        os.replace(tmp_file, cache_file)
+    
+    def cached_factor_score_matrix(self, player: str, player_games: pd.DataFrame):
+        """
+        factor_score_matrix backed by a per-player cache under data/weight_cache
+        
+        Only games not in the cache are scored and appended; cached games that
+        are no longer in player_games are dropped. A game is identified by its
+        game_pk and, if player_games has one, its game_version (see
+        load_snapshot_games), so a game whose version changed is rescored and
+        counts as new. Returns ((scores, actuals), number of games the saved
+        weights were not tuned on).
+        """
+        scores, actuals, game_keys, game_versions, tuned = self.load_score_cache(player)
+        
+        if 'game_version' in player_games.columns:
+            current_versions = player_games['game_version'].to_numpy(dtype=np.int64)
+        else:
+            current_versions = np.zeros(len(player_games), dtype=np.int64)
+        current = pd.MultiIndex.from_arrays([player_games['game_pk'].to_numpy(dtype=np.int64), current_versions])
+        cached = pd.MultiIndex.from_arrays([game_keys, game_versions])
+        keep = cached.isin(current)
+        is_new = ~current.isin(cached)
+        new_games = player_games[is_new]
+        
+        if len(new_games) or not keep.all() or not self.score_cache_file(player).exists():
+            new_scores, new_actuals, new_keys = self.score_games(player, new_games)
+            version_of = dict(zip(new_games['game_pk'].to_numpy(dtype=np.int64), current_versions[is_new]))
+            scores = np.vstack([scores[keep], new_scores])
+            actuals = np.concatenate([actuals[keep], new_actuals])
+            game_keys = np.concatenate([game_keys[keep], new_keys])
+            game_versions = np.concatenate([game_versions[keep],
+                                            np.array([version_of.get(key, 0) for key in new_keys], dtype=np.int64)])
+            tuned = np.concatenate([tuned[keep], np.zeros(len(new_keys), dtype=bool)])
+            self.save_score_cache(player, scores, actuals, game_keys, game_versions, tuned)
+        
+        return (scores, actuals), int((~tuned).sum())
+    
+    def mark_score_cache_tuned(self, player: str):
+        """Record that the player's saved weights were tuned on every cached game"""
+        if self.score_cache_file(player).exists():
+            scores, actuals, game_keys, game_versions, tuned = self.load_score_cache(player)
+            self.save_score_cache(player, scores, actuals, game_keys, game_versions, np.ones_like(tuned))
+    
+    @staticmethod
+    def normalize_actuals(actuals: np.ndarray) -> np.ndarray:
+        """Standardize actual performance for comparison with composite scores"""
+        if actuals.std() > 0:
+            return (actuals - actuals.mean()) / actuals.std()
+        return actuals
+    
+    @staticmethod
+    def correlation(predictions: np.ndarray, actuals: np.ndarray) -> float:
+        """Pearson correlation, 0.0 when either side is constant"""
+        predictions = predictions - predictions.mean()
+        actuals = actuals - actuals.mean()
+        denominator = np.sqrt(np.dot(predictions, predictions) * np.dot(actuals, actuals))
+        if denominator == 0:
+            return 0.0
+        return float(np.dot(predictions, actuals) / denominator)
+    
+    @staticmethod
+    def correlations(predictions: np.ndarray, actuals: np.ndarray) -> np.ndarray:
+        """Pearson correlation of each column of a games x candidates matrix with actuals (0.0 where constant)"""
+        predictions = predictions - predictions.mean(axis=0)
+        actuals = actuals - actuals.mean()
+        denominator = np.sqrt(np.einsum('ij,ij->j', predictions, predictions) * np.dot(actuals, actuals))
+        covariance = actuals @ predictions
+        return np.divide(covariance, denominator, out=np.zeros_like(covariance), where=denominator != 0)
+    
     def backtest_player(self, player: str, games_df: pd.DataFrame, 
-                       weights: Dict) -> Dict:
-        """Backtest predictions for a single player"""
+                       weights: Dict, score_matrix=None) -> Dict:
+        """Backtest predictions for a single player
+        
+        score_matrix: (scores, actuals) from factor_score_matrix, if already computed
+        """
         
         print(f"\n{'='*60}")
         print(f"Backtesting: {player}")
@@ -369,56 +615,33 @@ class WeightTuner:
             'rmse': 0.0
         }
         
-        # Filter games for this player
-        player_games = games_df[
-            (games_df['home_team'].str.contains(player, case=False, na=False)) |
-            (games_df['away_team'].str.contains(player, case=False, na=False))
-        ].copy()
-        
-        if len(player_games) == 0:
-            print(f"⚠️  No games found for {player}")
-            return results
+        if score_matrix is None:
+            player_games = self.find_player_games(player, games_df)
+            if len(player_games) == 0:
+                print(f"⚠️  No games found for {player}")
+                return results
+            
+            print(f"Found {len(player_games)} games for {player}")
+            score_matrix = self.factor_score_matrix(player, player_games)
         
-        print(f"Found {len(player_games)} games for {player}")
+        scores, actuals = score_matrix
+        weight_vector = np.array([weights.get(factor, default) for factor, default in self.default_weights.items()])
+        weighted_scores = scores * weight_vector
+        predictions = weighted_scores.sum(axis=1)
         
-        for idx, game in player_games.iterrows():
-            try:
-                # Create game data dict
-                game_data = game.to_dict()
-                
-                # Calculate factor scores
-                factor_scores = self.calculate_factor_scores(player, game_data, weights)
-                
-                # Calculate composite score
-                composite_score = self.calculate_composite_score(factor_scores)
-                
-                # Get actual performance
-                actual_performance = self.get_actual_performance(player, game_data)
-                
-                # Store results
-                results['predictions'].append(composite_score)
-                results['actuals'].append(actual_performance)
-                results['scores'].append(factor_scores)
-                results['games_analyzed'] += 1
-                
-            except Exception as e:
-                print(f"⚠️  Error processing game {idx}: {e}")
-                continue
+        results['predictions'] = predictions.tolist()
+        results['actuals'] = actuals.tolist()
+        results['scores'] = [dict(zip(self.default_weights, row)) for row in weighted_scores.tolist()]
+        results['games_analyzed'] = len(predictions)
         
         # Calculate metrics
         if results['games_analyzed'] > 0:
-            predictions = np.array(results['predictions'])
-            actuals = np.array(results['actuals'])
-            
             # Normalize actual performance to -1 to 1 scale for comparison
-            if actuals.std() > 0:
-                actuals_normalized = (actuals - actuals.mean()) / actuals.std()
-            else:
-                actuals_normalized = actuals
+            actuals_normalized = self.normalize_actuals(actuals)
             
             # Calculate correlation (accuracy)
             if len(predictions) > 1:
-                results['accuracy'] = np.corrcoef(predictions, actuals_normalized)[0, 1]
+                results['accuracy'] = self.correlation(predictions, actuals_normalized)
             
             # Calculate error metrics
             results['mae'] = np.mean(np.abs(predictions - actuals_normalized))
@@ -431,19 +654,40 @@ class WeightTuner:
         
         return results
     
-    def optimize_weights(self, player: str, games_df: pd.DataFrame) -> Dict:
-        """Optimize weights for a specific player using differential evolution"""
+    def optimize_weights(self, player: str, games_df: pd.DataFrame, score_matrix=None,
+                         maxiter: int = DEFAULT_MAXITER, popsize: int = DEFAULT_POPSIZE,
+                         vectorized: bool = True, initial_weights: Dict = None) -> Dict:
+        """Optimize weights for a specific player using differential evolution
+        
+        The factor analyses run once per game (factor_score_matrix); each
+        candidate weight vector is then scored with one matrix product. With
+        vectorized=True the whole population is scored per generation in a
+        single games x popsize product. initial_weights (e.g. the player's
+        current weights) are seeded into the initial population.
+        """
         
         print(f"\n{'='*60}")
         print(f"Optimizing weights for: {player}")
         print(f"{'='*60}")
         
+        if score_matrix is None:
+            score_matrix = self.factor_score_matrix(player, self.find_player_games(player, games_df))
+        scores, actuals = score_matrix
+        actuals_normalized = self.normalize_actuals(actuals)
+        enough_games = len(actuals) > 1
+        
         def objective_function(weight_values):
             """Objective function to minimize (negative correlation)"""
-            weights = dict(zip(self.default_weights.keys(), weight_values))
-            results = self.backtest_player(player, games_df, weights)
+            if not enough_games:
+                return 0.0
             # Return negative accuracy (we want to maximize correlation)
-            return -results['accuracy']
+            return -self.correlation(scores @ weight_values, actuals_normalized)
+        
+        def population_objective(population):
+            """Negative correlation of every candidate (columns of a factors x candidates array)"""
+            if not enough_games:
+                return np.zeros(population.shape[1])
+            return -self.correlations(scores @ population, actuals_normalized)
         
         # Define bounds for each weight (0.0 to 0.3)
         bounds = [(0.0, 0.3) for _ in range(len(self.default_weights))]
@@ -451,16 +695,23 @@ class WeightTuner:
         # Constraint: weights should sum to approximately 1.0
         # We'll handle this by normalizing after optimization
         
-        print("\n🔧 Running optimization (this may take a few minutes)...")
+        print(f"\n🔧 Running optimization over {len(actuals)} games (maxiter={maxiter}, popsize={popsize})...")
+        
+        x0 = None
+        if initial_weights:
+            x0 = np.clip([initial_weights.get(factor, default) for factor, default in self.default_weights.items()],
+                         *zip(*bounds))
         
         result = differential_evolution(
-            objective_function,
+            population_objective if vectorized else objective_function,
             bounds,
-            maxiter=20,  # Reduced for faster testing
-            popsize=10,
+            x0=x0,
+            maxiter=maxiter,
+            popsize=popsize,
             tol=0.01,
             workers=1,
             updating='deferred',
+            vectorized=vectorized,
             seed=42
         )
         
@@ -478,8 +729,18 @@ class WeightTuner:
         return optimized_weights
     
     def run_backtest_suite(self, players: List[str], optimize: bool = False, 
-                          save: bool = False):
-        """Run backtesting for multiple players"""
+                          save: bool = False, maxiter: int = DEFAULT_MAXITER,
+                          popsize: int = DEFAULT_POPSIZE, jobs: int = 1,
+                          incremental: bool = False, min_new_games: int = DEFAULT_MIN_NEW_GAMES,
+                          snapshots: bool = False):
+        """Run backtesting for multiple players
+        
+        With save, each player's optimized weights are saved as soon as that
+        player finishes. jobs > 1 tunes players on that many processes.
+        incremental reuses cached factor scores and warm-starts from the saved
+        weights (see tune_player). snapshots backtests on the walk-forward
+        factor snapshots instead of the schedule (see load_snapshot_games).
+        """
         
         print("\n" + "="*80)
         print("FANTASY BASEBALL AI - WEIGHT BACKTESTING & TUNING".center(80))
@@ -488,7 +749,10 @@ class WeightTuner:
         # Load data
         print("\n📊 Loading historical data...")
         roster_df = self.load_roster()
-        games_df = self.load_historical_games(start_year=2022)
+        if snapshots:
+            games_df = self.load_snapshot_games(start_year=2022)
+        else:
+            games_df = self.load_historical_games(start_year=2022)
         _ = self.load_player_stats()
         
         if games_df.empty:
@@ -504,35 +768,131 @@ class WeightTuner:
                 print("❌ No roster data available. Specify players manually.")
                 return
         
-        all_results = {}
-        optimized_weights = {}
+        settings = {
+            'optimize': optimize,
+            'maxiter': maxiter,
+            'popsize': popsize,
+            'incremental': incremental,
+            'min_new_games': min_new_games,
+        }
         
-        for player in players:
-            try:
-                if optimize:
-                    # Optimize weights for this player
-                    player_weights = self.optimize_weights(player, games_df)
-                    optimized_weights[player] = player_weights
-                    
-                    # Run backtest with optimized weights
-                    results = self.backtest_player(player, games_df, player_weights)
-                else:
-                    # Use existing weights
-                    weights = self.player_weights.get(player, self.global_weights)
-                    results = self.backtest_player(player, games_df, weights)
-                
-                all_results[player] = results
+        if jobs and jobs > 1 and len(players) > 1:
+            all_results, optimized_weights = self.tune_players_parallel(players, games_df, settings, save, jobs)
+        else:
+            all_results = {}
+            optimized_weights = {}
+            
+            for player in players:
+                try:
+                    results, player_weights = self.tune_player(player, games_df, **settings)
+                except Exception as e:
+                    print(f"❌ Error processing {player}: {e}")
+                    continue
                 
-            except Exception as e:
-                print(f"❌ Error processing {player}: {e}")
-                continue
+                if results is not None:
+                    all_results[player] = results
+                if player_weights is not None:
+                    optimized_weights[player] = player_weights
+                    if save:
+                        self.save_player_weights(player, player_weights)
         
         # Display summary
         self.display_summary(all_results, optimized_weights)
         
-        # Save weights if requested
         if save and optimized_weights:
-            self.save_optimized_weights(optimized_weights)
+            print(f"\n✓ Saved optimized weights for {len(optimized_weights)} players to {self.player_weights_file}")
+    
+    def tune_player(self, player: str, games_df: pd.DataFrame, optimize: bool = False,
+                    maxiter: int = DEFAULT_MAXITER, popsize: int = DEFAULT_POPSIZE,
+                    incremental: bool = False, min_new_games: int = DEFAULT_MIN_NEW_GAMES):
+        """Backtest one player, optimizing their weights first if asked
+        
+        Incremental: factor scores come from the player's on-disk cache (only
+        new games are scored) and the optimizer starts from the saved weights.
+        A player with saved weights and fewer than min_new_games games since
+        they were saved is not re-tuned; the saved weights are backtested instead.
+        
+        Returns (backtest results, optimized weights); either is None when
+        there is nothing to report (no games / not optimizing / not re-tuned).
+        """
+        if not optimize:
+            # Use existing weights
+            weights = self.player_weights.get(player, self.global_weights)
+            return self.backtest_player(player, games_df, weights), None
+        
+        # Factor scores once per game, shared by the optimizer and the final backtest
+        player_games = self.find_player_games(player, games_df)
+        if len(player_games) == 0:
+            print(f"⚠️  No games found for {player}")
+            return None, None
+        initial_weights = None
+        if incremental:
+            score_matrix, new_games = self.cached_factor_score_matrix(player, player_games)
+            initial_weights = self.player_weights.get(player)
+            if initial_weights and new_games < min_new_games:
+                print(f"⏭️  {player}: {new_games} new game(s) since the weights were saved - keeping them")
+                return self.backtest_player(player, games_df, initial_weights, score_matrix), None
+        else:
+            score_matrix = self.factor_score_matrix(player, player_games)
+        
+        # Optimize weights for this player
+        player_weights = self.optimize_weights(player, games_df, score_matrix,
+                                               maxiter=maxiter, popsize=popsize,
+                                               initial_weights=initial_weights)
+        
+        # Run backtest with optimized weights
+        results = self.backtest_player(player, games_df, player_weights, score_matrix)
+        return results, player_weights
+    
+    def tune_players_parallel(self, players: List[str], games_df: pd.DataFrame, settings: Dict,
+                              save: bool, jobs: int):
+        """
+        Tune players concurrently on a process pool, collecting them as they finish
+        
+        Each player's weights are written to player_weights.json as soon as
+        that player is done, so an interrupted run keeps everyone finished so
+        far. Worker output is captured; one line is printed per player.
+        settings are tune_player's keyword arguments.
+        """
+        all_results = {}
+        optimized_weights = {}
+        total = len(players)
+        print(f"\n⚡ Tuning {total} players on {jobs} worker processes")
+        
+        with ProcessPoolExecutor(max_workers=jobs, initializer=_init_worker,
+                                 initargs=(self, games_df)) as executor:
+            futures = {
+                executor.submit(_tune_player_in_worker, player, settings): player
+                for player in players
+            }
+            for done, future in enumerate(as_completed(futures), 1):
+                player = futures[future]
+                try:
+                    _, results, player_weights, error = future.result()
+                except Exception as e:
+                    # Worker process died (e.g. out of memory)
+                    results, player_weights, error = None, None, f"Worker error: {e}"
+                
+                if error is not None:
+                    print(f"[{done}/{total}] ❌ {player}: {error}")
+                    continue
+                if results is None:
+                    print(f"[{done}/{total}] ⚠️  {player}: no games found")
+                    continue
+                
+                all_results[player] = results
+                if player_weights is not None:
+                    optimized_weights[player] = player_weights
+                    if save:
+                        self.save_player_weights(player, player_weights)
+                status = "" if player_weights is not None or not settings['optimize'] else ", kept saved weights"
+                print(f"[{done}/{total}] ✓ {player}: {results['games_analyzed']} games, "
+                      f"accuracy {results['accuracy']:.3f}{status}")
+        
+        # Report in the order the players were given
+        all_results = {player: all_results[player] for player in players if player in all_results}
+        optimized_weights = {player: optimized_weights[player] for player in players if player in optimized_weights}
+        return all_results, optimized_weights
     
     def display_summary(self, results: Dict, optimized_weights: Dict):
         """Display summary of backtest results"""
@@ -570,16 +930,33 @@ class WeightTuner:
                 for factor, weight in sorted(weights.items(), key=lambda x: x[1], reverse=True):
                     print(f"  {factor:25s}: {weight:.4f}")
     
-    def save_optimized_weights(self, optimized_weights: Dict):
-        """Save optimized player weights"""
-        
-        # Merge with existing player weights
-        self.player_weights.update(optimized_weights)
-        
-        # Save to file
-        self.save_weights(self.player_weights, self.player_weights_file)
-        
-        print(f"\n✓ Saved optimized weights for {len(optimized_weights)} players")
+    def save_player_weights(self, player: str, weights: Dict):
+        """Merge one player's optimized weights into player_weights.json right away"""
+        self.player_weights[player] = {factor: float(weight) for factor, weight in weights.items()}
+        self.save_weights(self.player_weights, self.player_weights_file, quiet=True)
+        self.mark_score_cache_tuned(player)
+
+
+# Tuner and historical games for pool workers, set once per process by _init_worker
+_worker_tuner = None
+_worker_games = None
+
+
+def _init_worker(tuner, games_df):
+    """Receive the tuner and the historical games once per worker process instead of once per task"""
+    global _worker_tuner, _worker_games
+    _worker_tuner = tuner
+    _worker_games = games_df
+
+
+def _tune_player_in_worker(player, settings):
+    """Pool task: tune one player and report (player, results, weights, error); its output is discarded"""
+    try:
+        with contextlib.redirect_stdout(io.StringIO()):
+            results, player_weights = _worker_tuner.tune_player(player, _worker_games, **settings)
+        return player, results, player_weights, None
+    except Exception as e:
+        return player, None, None, str(e)
 
 
 def main():
@@ -593,6 +970,10 @@ Examples:
   python src/scripts/backtest_weights.py --player "Ohtani"  # Backtest one player
   python src/scripts/backtest_weights.py --optimize         # Optimize weights
   python src/scripts/backtest_weights.py --optimize --save  # Optimize and save
+  python src/scripts/backtest_weights.py --optimize --maxiter 200 --popsize 30
+  python src/scripts/backtest_weights.py --optimize --save --jobs 8
+  python src/scripts/backtest_weights.py --optimize --save --incremental
+  python src/scripts/backtest_weights.py --optimize --snapshots
         """
     )
     
@@ -614,6 +995,46 @@ Examples:
         help='Save optimized weights to config file'
     )
     
+    parser.add_argument(
+        '--maxiter',
+        type=int,
+        default=DEFAULT_MAXITER,
+        help=f'Differential evolution generations (default: {DEFAULT_MAXITER})'
+    )
+    
+    parser.add_argument(
+        '--incremental',
+        action='store_true',
+        help='Reuse cached factor scores, warm-start from saved weights, skip players with few new games'
+    )
+    
+    parser.add_argument(
+        '--min-new-games',
+        type=int,
+        default=DEFAULT_MIN_NEW_GAMES,
+        help=f'With --incremental, re-tune a player only after this many new games (default: {DEFAULT_MIN_NEW_GAMES})'
+    )
+    
+    parser.add_argument(
+        '--snapshots',
+        action='store_true',
+        help='Backtest on walk-forward factor snapshots (src/scripts/fa/walk_forward.py) and game logs'
+    )
+    
+    parser.add_argument(
+        '--jobs',
+        type=int,
+        default=1,
+        help='Tune players in parallel on N worker processes (default: 1)'
+    )
+    
+    parser.add_argument(
+        '--popsize',
+        type=int,
+        default=DEFAULT_POPSIZE,
+        help=f'Differential evolution population size per weight (default: {DEFAULT_POPSIZE})'
+    )
+    
     args = parser.parse_args()
     
     # Get project root
@@ -630,7 +1051,13 @@ Examples:
         tuner.run_backtest_suite(
             players=players,
             optimize=args.optimize,
-            save=args.save
+            save=args.save,
+            maxiter=args.maxiter,
+            popsize=args.popsize,
+            jobs=args.jobs,
+            incremental=args.incremental,
+            min_new_games=args.min_new_games,
+            snapshots=args.snapshots
         )
         
         print("\n✅ Backtesting complete!")
@@ -0,0 +1,54 @@
+#!/usr/bin/env python3
+"""
+Bullpen Usage Table Tests
+
+Checks that the stored bullpen usage table is only reused for the
+lookback window it was built with.
+
+Usage:
+    python -m pytest test/test_bullpen_usage.py -q
+"""
+
+import sys
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scripts.fa.bullpen_fatigue_fa import BullpenFatigueAnalyzer
+
+
+def relief_logs():
+    dates = ['2024-04-01', '2024-04-03', '2024-04-06', '2024-04-08']
+    return pd.DataFrame({
+        'team': 'NYY',
+        'game_date': pd.to_datetime(dates),
+        'position': 'P',
+        'starter': False,
+        'innings_pitched': [1.0, 2.0, 1.0, 3.0],
+        'earned_runs': [0, 1, 0, 2],
+    })
+
+
+def recent_innings(usage, date):
+    row = usage[(usage['team'] == 'NYY') & (pd.to_datetime(usage['game_date']) == pd.Timestamp(date))]
+    return float(row['recent_innings'].iloc[0])
+
+
+def test_usage_table_is_rebuilt_for_a_new_lookback(tmp_path):
+    game_log_file = tmp_path / 'mlb_game_logs_2024.csv'
+    relief_logs().to_csv(game_log_file, index=False)
+    analyzer = BullpenFatigueAnalyzer(tmp_path)
+
+    week = analyzer.load_bullpen_usage(relief_logs(), game_log_file)
+    assert (tmp_path / 'bullpen_usage_7d_2024.csv').exists()
+    assert recent_innings(week, '2024-04-08') == 4.0   # 04-01, 04-03, 04-06
+
+    analyzer.lookback_days = 3
+    short = analyzer.load_bullpen_usage(relief_logs(), game_log_file)
+    assert (tmp_path / 'bullpen_usage_3d_2024.csv').exists()
+    assert recent_innings(short, '2024-04-08') == 1.0   # 04-06 only
+
+    # Each window's stored table is reused as is
+    analyzer.lookback_days = 7
+    assert recent_innings(analyzer.load_bullpen_usage(relief_logs(), game_log_file), '2024-04-08') == 4.0
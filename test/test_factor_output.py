@@ -0,0 +1,62 @@
+#!/usr/bin/env python3
+"""
+Factor Output Writer Tests
+
+Checks that a checkpointed factor CSV resumes after a crash without the
+rows of the batch that was cut short, and that scores are read back from
+the finished file.
+
+Usage:
+    python -m pytest test/test_factor_output.py -q
+"""
+
+import sys
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scripts.fa.factor_output import FactorOutputWriter
+
+
+def batch(names, score):
+    return pd.DataFrame({'player_name': names, 'game_date': '2024-04-01', 'wind_score': score})
+
+
+def test_resume_truncates_the_interrupted_batch(tmp_path):
+    path = tmp_path / 'wind_analysis_all_players.csv'
+    batches = [batch(['A', 'B'], 0.5), batch(['C'], -1.25), batch(['D', 'E'], 2.0)]
+
+    writer = FactorOutputWriter.resume(path, 'wind_score')
+    writer.append(batches[0])
+    writer.append(batches[1])
+
+    # Crash while the third batch is being written: rows on disk, no checkpoint
+    batches[2].iloc[:1].to_csv(writer.partial_path, mode='a', header=False, index=False)
+    with open(writer.partial_path, 'a') as f:
+        f.write('D,2024-04')
+
+    writer = FactorOutputWriter.resume(path, 'wind_score')
+    assert writer.batches == 2
+    assert writer.rows == 3
+    for df in batches[writer.batches:]:
+        writer.append(df)
+    assert writer.close() == path
+    assert not writer.checkpoint_path.exists()
+
+    expected = pd.concat(batches, ignore_index=True)
+    pd.testing.assert_frame_equal(pd.read_csv(path), expected)
+
+    scores, score_column = writer.scores()
+    assert score_column == 'wind_score'
+    assert scores['player_name'].tolist() == ['A', 'B', 'C', 'D', 'E']
+    assert scores['score'].tolist() == expected['wind_score'].tolist()
+
+
+def test_resume_without_checkpoint_starts_fresh(tmp_path):
+    path = tmp_path / 'wind_analysis_all_players.csv'
+    writer = FactorOutputWriter.resume(path, 'wind_score')
+    assert writer.batches == 0
+    writer.append(batch(['A'], 1.0))
+    writer.close()
+    assert pd.read_csv(path)['player_name'].tolist() == ['A']
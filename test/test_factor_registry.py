@@ -0,0 +1,31 @@
+#!/usr/bin/env python3
+"""
+Factor Registry Tests
+
+Checks that factor specs survive pickling (process pools under the spawn
+start method) and that a factor only requires the inputs it reads.
+
+Usage:
+    python -m pytest test/test_factor_registry.py -q
+"""
+
+import sys
+import pickle
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scripts.fa.factor_registry import required_inputs, select_factors
+
+
+def test_specs_pickle_and_resolve_their_analyzer():
+    specs = pickle.loads(pickle.dumps(select_factors()))
+    assert [spec.key for spec in specs] == [spec.key for spec in select_factors()]
+    assert all(spec.analyzer_class.__name__ == spec.class_name for spec in specs)
+
+
+def test_required_inputs_skip_unused_game_logs():
+    assert required_inputs(select_factors('wind')) == ['schedule', 'weather', 'venue_conditions']
+    assert 'game_logs' not in required_inputs(select_factors('umpire,temperature,pitch_mix'))
+    assert required_inputs(select_factors('rest')).index('game_logs') < \
+        required_inputs(select_factors('rest')).index('game_log_index')
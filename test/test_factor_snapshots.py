@@ -0,0 +1,100 @@
+#!/usr/bin/env python3
+"""
+Walk-Forward Snapshot Tests
+
+Round-trips per-date factor matrices through SnapshotStore and checks how
+the tuner joins snapshot rows with the game logs (--snapshots).
+
+Usage:
+    python -m pytest test/test_factor_snapshots.py -q
+"""
+
+import os
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scripts.fa.walk_forward import SnapshotStore, WalkForwardEngine
+from scripts.weight.backtest_weights import WeightTuner
+
+
+def snapshot_matrix(date, rows):
+    """[(player_id, player_name, wind, park)] as a factor matrix for one date"""
+    matrix = pd.DataFrame(rows, columns=['player_id', 'player_name', 'wind', 'park'])
+    matrix.insert(2, 'game_date', date)
+    return matrix
+
+
+def write_game_logs(data_dir, rows):
+    """[(player_id, player_name, game_date, H, HR)] as a season's game log CSV"""
+    logs = pd.DataFrame(rows, columns=['player_id', 'player_name', 'game_date', 'H', 'HR'])
+    logs.assign(AB=4, **{'2B': 0, '3B': 0}).to_csv(data_dir / 'mlb_game_logs_2024.csv', index=False)
+
+
+def test_snapshot_store_round_trip(tmp_path):
+    store = SnapshotStore(tmp_path)
+    first = snapshot_matrix('2024-04-01', [(1.0, 'A', 0.5, np.nan), (np.nan, 'B', -1.25, 2.0)])
+    second = snapshot_matrix('2024-04-02', [(1.0, 'A', 0.1, 0.2)])
+    store.save('2024-04-01', first, {'as_of_date': '2024-04-01'})
+    store.save('2024-04-02', second, {'as_of_date': '2024-04-02'})
+
+    pd.testing.assert_frame_equal(store.load('2024-04-01'), first, check_dtype=False)
+    assert store.factors('2024-04-01') == ['wind', 'park']
+    assert store.factors('2024-04-03') == []
+    assert store.dates() == [pd.Timestamp('2024-04-01'), pd.Timestamp('2024-04-02')]
+    assert len(store.load_range('2024-04-02')) == 1
+    assert len(store.load_range()) == 3
+    assert store.version('2024-04-03') == 0
+
+
+def test_snapshot_reports_a_date_where_every_factor_failed(tmp_path):
+    engine = WalkForwardEngine(tmp_path, factors='wind,park', roster_df=pd.DataFrame({'player_name': ['A']}))
+    engine.context_for = lambda season: None
+    engine.score_factors = lambda date, specs, context, roster_df: ({}, [spec.key for spec in specs])
+
+    assert engine.snapshot('2024-04-01') is None
+    assert engine.store.dates() == []
+
+
+def test_snapshot_games_join_on_player_id(tmp_path, capsys):
+    data_dir = tmp_path / 'data'
+    store = SnapshotStore(data_dir)
+    store.save('2024-04-01', snapshot_matrix('2024-04-01', [
+        (1.0, 'Will Smith', 1.0, 0.0),
+        (np.nan, 'No Id', 0.5, 0.5),
+    ]), {})
+    write_game_logs(data_dir, [
+        (1, 'Will Smith', '2024-04-01', 1, 0),
+        (2, 'Will Smith', '2024-04-01', 3, 2),   # same name, different player
+        (3, 'No Id', '2024-04-01', 2, 0),
+    ])
+
+    games = WeightTuner(tmp_path).load_snapshot_games(start_year=2024).set_index('player_name')
+
+    assert games.loc['Will Smith', 'actual'] == 3   # player 1's single only
+    assert games.loc['No Id', 'actual'] == 6        # joined on the name
+    assert games.loc['Will Smith', 'game_pk'] == 20240401
+
+
+def test_snapshot_games_version_follows_snapshot_and_actuals(tmp_path, capsys):
+    data_dir = tmp_path / 'data'
+    store = SnapshotStore(data_dir)
+    store.save('2024-04-01', snapshot_matrix('2024-04-01', [(1.0, 'A', 1.0, 0.0)]), {})
+    write_game_logs(data_dir, [(1, 'A', '2024-04-01', 1, 0)])
+    tuner = WeightTuner(tmp_path)
+    version = tuner.load_snapshot_games(start_year=2024)['game_version'].iloc[0]
+
+    assert tuner.load_snapshot_games(start_year=2024)['game_version'].iloc[0] == version
+
+    # Snapshot recomputed
+    manifest = store.path('2024-04-01').with_suffix('.json')
+    os.utime(manifest, ns=(manifest.stat().st_atime_ns, manifest.stat().st_mtime_ns + 10**9))
+    rescored = tuner.load_snapshot_games(start_year=2024)['game_version'].iloc[0]
+    assert rescored != version
+
+    # Game log corrected
+    write_game_logs(data_dir, [(1, 'A', '2024-04-01', 2, 0)])
+    assert tuner.load_snapshot_games(start_year=2024)['game_version'].iloc[0] != rescored
@@ -0,0 +1,122 @@
+#!/usr/bin/env python3
+"""
+Game Log Index Tests
+
+Checks GameLogIndex's window and as-of queries against a brute-force
+filter-and-sum over the same small game log frame.
+
+Usage:
+    python -m pytest test/test_game_log_index.py -q
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scripts.fa.game_log_index import GameLogIndex
+
+
+def sample_logs():
+    """Three players, unsorted, with a doubleheader and home/away games"""
+    rng = np.random.default_rng(3)
+    rows = []
+    for player, dates in (('A', ['2024-04-01', '2024-04-02', '2024-04-02', '2024-04-05', '2024-04-09']),
+                          ('B', ['2024-04-03', '2024-04-04', '2024-04-08']),
+                          ('C', ['2024-04-02'])):
+        for date in dates:
+            rows.append((player, date, int(rng.integers(0, 6)), int(rng.integers(0, 3)), bool(rng.integers(0, 2))))
+    logs = pd.DataFrame(rows, columns=['player_name', 'game_date', 'AB', 'H', 'is_home'])
+    logs['game_date'] = pd.to_datetime(logs['game_date'])
+    logs['AB'] = logs['AB'].astype(np.int16)
+    logs['H'] = logs['H'].astype(np.int16)
+    return logs.sample(frac=1, random_state=0).reset_index(drop=True)
+
+
+def brute_force(logs, player, before=None, start=None, home=None):
+    """Filter-and-sum reference: games and AB/H of a player's logs with start <= date < before"""
+    rows = logs[logs['player_name'] == player]
+    if start is not None:
+        rows = rows[rows['game_date'] >= pd.Timestamp(start)]
+    if before is not None:
+        rows = rows[rows['game_date'] < pd.Timestamp(before)]
+    if home is not None:
+        rows = rows[rows['is_home'] == home]
+    return len(rows), int(rows['AB'].sum()), int(rows['H'].sum())
+
+
+DATES = ['2024-03-31', '2024-04-01', '2024-04-02', '2024-04-03', '2024-04-05', '2024-04-06', '2024-04-10']
+
+
+def test_window_matches_filter_and_sum():
+    logs = sample_logs()
+    index = GameLogIndex(logs)
+    for player in ('A', 'B', 'C', 'Unknown'):
+        for start in DATES:
+            for end in DATES:
+                lo, hi = index.window(player, start, end)
+                totals = index.totals(lo, hi)
+                assert (hi - lo, totals['AB'], totals['H']) == brute_force(logs, player, before=end, start=start)
+
+
+def test_as_of_totals_are_strictly_before_each_date():
+    logs = sample_logs()
+    index = GameLogIndex(logs)
+    players = ['A', 'B', 'Unknown', 'C']
+    table = index.as_of_totals(players, DATES)
+    home = index.as_of_totals(players, DATES, split='is_home')
+
+    assert table['games'].shape == (len(DATES), len(players))
+    for i, date in enumerate(DATES):
+        for j, player in enumerate(players):
+            assert (table['games'][i, j], table['AB'][i, j], table['H'][i, j]) == \
+                brute_force(logs, player, before=date)
+            assert (home['games'][i, j], home['AB'][i, j], home['H'][i, j]) == \
+                brute_force(logs, player, before=date, home=True)
+
+    # A game on the as-of date itself is not counted: A played twice on 04-02
+    assert table['games'][DATES.index('2024-04-02'), 0] == 1
+    assert table['games'][DATES.index('2024-04-03'), 0] == 3
+
+
+def test_unknown_players_have_empty_ranges():
+    index = GameLogIndex(sample_logs())
+    assert 'Unknown' not in index
+    assert index.window('Unknown', '2024-04-01', '2024-05-01') == (0, 0)
+    start, ends = index.before('Unknown', DATES)
+    assert start == 0 and (ends == 0).all()
+    assert (index.as_of_totals(['Unknown'], DATES)['games'] == 0).all()
+
+
+def test_integer_stats_keep_an_integer_dtype():
+    index = GameLogIndex(sample_logs())
+    start, ends = index.before('A', DATES)
+    totals = index.totals(start, ends)
+    assert totals['AB'].dtype == np.int64
+    assert index.as_of_totals(['A', 'B'], DATES, split='is_home')['H'].dtype == np.int64
+
+    with_gaps = sample_logs().astype({'H': float})
+    with_gaps.loc[0, 'H'] = np.nan
+    assert GameLogIndex(with_gaps).prefix['H'].dtype == np.float64
+
+
+def test_last_dates_and_rested_split():
+    logs = sample_logs()
+    index = GameLogIndex(logs)
+    last = index.as_of_last_dates(['A', 'B'], DATES)
+    games = index.as_of_totals(['A', 'B'], DATES)['games']
+    for i, date in enumerate(DATES):
+        for j, player in enumerate(['A', 'B']):
+            if games[i, j]:
+                played = logs[(logs['player_name'] == player) & (logs['game_date'] < date)]['game_date']
+                assert last[i, j] == played.max().value
+
+    # A: 04-01, 04-02, 04-02 (doubleheader), 04-05 (3 days off), 04-09 (4 days off)
+    lo, hi = index.player_block('A')
+    np.testing.assert_array_equal(index.days_rest()[lo:hi], [0, 1, 0, 3, 4])
+    rested = index.as_of_totals(['A'], ['2024-04-10'], split='rested')
+    rows = index.rows(lo, hi).iloc[[3, 4]]
+    assert rested['games'][0, 0] == 2
+    assert rested['AB'][0, 0] == rows['AB'].sum()
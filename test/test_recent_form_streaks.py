@@ -0,0 +1,132 @@
+#!/usr/bin/env python3
+"""
+Recent Form Streak Tests
+
+Checks RecentFormAnalyzer's run-length encoded streak detection against
+the per-at-bat list logic it replaced, on hand-built logs.
+
+Usage:
+    python -m pytest test/test_recent_form_streaks.py -q
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scripts.fa.game_log_index import GameLogIndex
+from scripts.fa.recent_form_fa import RecentFormAnalyzer
+
+
+def list_hot_streak(recent_games):
+    """The former detect_hot_streak: walk the last 10 games one by one"""
+    if len(recent_games) < 5:
+        return False, 0
+    consecutive_hits = 0
+    max_streak = 0
+    for _, game in recent_games.head(10).iterrows():
+        if game.get('H', 0) > 0:
+            consecutive_hits += 1
+            max_streak = max(max_streak, consecutive_hits)
+        else:
+            consecutive_hits = 0
+    last_7 = recent_games.head(7)
+    total_ab = last_7['AB'].sum()
+    total_h = last_7['H'].sum()
+    recent_avg = total_h / total_ab if total_ab >= 20 else 0
+    return bool(max_streak >= 5 or (recent_avg >= 0.350 and total_ab >= 20)), max_streak
+
+
+def list_cold_streak(recent_games):
+    """The former detect_cold_streak: expand the last 15 games into per-at-bat 0/1 values"""
+    if len(recent_games) < 5:
+        return False, 0
+    recent_abs = []
+    for _, game in recent_games.head(15).iterrows():
+        ab = game.get('AB', 0)
+        h = game.get('H', 0)
+        if ab > 0:
+            recent_abs.extend([1 if i < h else 0 for i in range(ab)])
+    consecutive_outs = 0
+    max_slump = 0
+    for ab in recent_abs:
+        if ab == 0:
+            consecutive_outs += 1
+            max_slump = max(max_slump, consecutive_outs)
+        else:
+            consecutive_outs = 0
+    last_7 = recent_games.head(7)
+    total_ab = last_7['AB'].sum()
+    total_h = last_7['H'].sum()
+    recent_avg = total_h / total_ab if total_ab >= 20 else 0.300
+    return bool(max_slump >= 10 or (recent_avg < 0.150 and total_ab >= 20)), max_slump
+
+
+def games(h, ab):
+    """Recent games, most recent first"""
+    return pd.DataFrame({'H': h, 'AB': ab})
+
+
+CASES = {
+    'empty': games([], []),
+    'too_few': games([1, 0, 2], [4, 3, 4]),
+    'all_hits': games([1, 2, 1, 3, 1, 1, 2, 1, 1, 1, 1, 2], [4, 4, 3, 5, 4, 4, 4, 4, 3, 4, 4, 4]),
+    'all_hitless': games([0] * 15, [4] * 15),
+    'tied_runs': games([1, 1, 1, 0, 1, 1, 1, 0, 0, 1], [4, 4, 4, 4, 4, 4, 4, 4, 4, 4]),
+    'tied_slumps': games([0, 0, 1, 0, 0, 2, 0], [3, 2, 4, 3, 2, 4, 4]),
+    'zero_ab_games': games([0, 1, 0, 0, 1, 0], [0, 3, 0, 4, 2, 0]),
+    'hot_average': games([2, 2, 1, 2, 0, 2, 1, 0], [4, 4, 4, 4, 3, 4, 4, 4]),
+}
+
+
+def random_cases(n, seed=5):
+    rng = np.random.default_rng(seed)
+    for _ in range(n):
+        count = int(rng.integers(0, 20))
+        ab = rng.integers(0, 6, size=count)
+        yield games(np.minimum(rng.integers(0, 3, size=count), ab), ab)
+
+
+def test_single_player_flags_match_list_logic():
+    analyzer = RecentFormAnalyzer('.')
+    for recent in list(CASES.values()) + list(random_cases(200)):
+        assert analyzer.detect_hot_streak(recent) == list_hot_streak(recent)
+        assert analyzer.detect_cold_streak(recent) == list_cold_streak(recent)
+
+
+def test_batched_flags_match_list_logic():
+    analyzer = RecentFormAnalyzer('.')
+    players = list(CASES.values()) + list(random_cases(50, seed=8))
+    h = np.concatenate([p['H'].to_numpy(dtype=np.int64) for p in players])
+    ab = np.concatenate([p['AB'].to_numpy(dtype=np.int64) for p in players])
+    is_hot, hit_streak, is_cold, slump_length = analyzer.streak_flags(h, ab, [len(p) for p in players])
+
+    for i, recent in enumerate(players):
+        # streak_flags reports run lengths even below 5 games; detect_* gate them
+        if len(recent) >= 5:
+            assert (bool(is_hot[i]), int(hit_streak[i])) == list_hot_streak(recent)
+            assert (bool(is_cold[i]), int(slump_length[i])) == list_cold_streak(recent)
+        else:
+            assert not is_hot[i] and not is_cold[i]
+
+
+def test_streak_table_reads_the_last_15_games_before_the_date():
+    analyzer = RecentFormAnalyzer('.')
+    rows = []
+    for name, recent in CASES.items():
+        # Most recent first -> one game per day ending 2024-05-31
+        dates = pd.date_range(end='2024-05-31', periods=len(recent))[::-1]
+        rows.append(recent.assign(player_name=name, game_date=dates))
+    rows.append(games([3, 3], [3, 3]).assign(player_name='all_hits', game_date=pd.to_datetime(['2024-06-01'] * 2)))
+    index = GameLogIndex(pd.concat(rows, ignore_index=True))
+
+    table = analyzer.streak_table(index, list(CASES) + ['unknown'], pd.Timestamp('2024-06-01'))
+
+    assert table['unknown'] == (False, 0, False, 0)
+    for name, recent in CASES.items():
+        hot, streak, cold, slump = table[name]
+        if len(recent) >= 5:
+            assert (hot, streak) == list_hot_streak(recent.head(15))
+            assert (cold, slump) == list_cold_streak(recent.head(15))
@@ -0,0 +1,53 @@
+#!/usr/bin/env python3
+"""
+Rest Day Factor Tests
+
+Checks RestDayFactorAnalyzer's rested / back-to-back splits on hand-built
+logs, including which game of a doubleheader counts as rested.
+
+Usage:
+    python -m pytest test/test_rest_day_fa.py -q
+"""
+
+import sys
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scripts.fa.rest_day_fa import RestDayFactorAnalyzer
+
+
+def game_logs(rows):
+    """[(player_name, game_date, AB, H)] as a game log frame"""
+    return pd.DataFrame(rows, columns=['player_name', 'game_date', 'AB', 'H']).assign(
+        game_date=lambda df: pd.to_datetime(df['game_date']))
+
+
+def analyze(logs):
+    games = pd.DataFrame({'game_date': ['2024-04-10']})
+    roster = pd.DataFrame({'player_name': ['A', 'B']})
+    return RestDayFactorAnalyzer('.').analyze(games, logs, roster).set_index('player_name')
+
+
+def test_doubleheader_rest_goes_to_the_first_game_in_the_logs():
+    logs = game_logs([
+        ('A', '2024-04-01', 4, 1),
+        ('A', '2024-04-02', 4, 2),
+        ('A', '2024-04-05', 4, 1),   # 3 days off: rested
+        ('A', '2024-04-05', 4, 4),   # second game of the doubleheader: back-to-back
+        ('A', '2024-04-06', 4, 1),
+        ('B', '2024-04-01', 4, 1),   # too little history to score
+    ])
+
+    result = analyze(logs)
+    assert list(result.index) == ['A']
+    assert result.loc['A', 'days_since_last_game'] == 4
+    assert result.loc['A', 'rested_ba'] == 0.25
+    assert result.loc['A', 'back_to_back_ba'] == 0.5
+    assert abs(result.loc['A', 'rest_score'] - -1.25) < 1e-12
+
+    # Listing the doubleheader the other way round moves the rest to the 4-hit game
+    swapped = analyze(logs.iloc[[0, 1, 3, 2, 4, 5]])
+    assert swapped.loc['A', 'rested_ba'] == 1.0
+    assert swapped.loc['A', 'back_to_back_ba'] == 0.312
@@ -0,0 +1,110 @@
+#!/usr/bin/env python3
+"""
+Weight Tuner Tests
+
+Checks the WeightTuner kernels against their reference definitions: the
+column-wise correlation against np.corrcoef, the population-batched
+optimizer against the one-candidate-at-a-time objective, and the
+incremental score cache bookkeeping.
+
+Usage:
+    python -m pytest test/test_weight_tuning.py -q
+"""
+
+import sys
+import numpy as np
+import pandas as pd
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / 'src'))
+
+from scripts.weight.backtest_weights import SNAPSHOT_FACTOR_KEYS, WeightTuner
+
+
+def make_tuner(tmp_path):
+    return WeightTuner(tmp_path)
+
+
+def snapshot_games(tuner, game_pks, seed=0):
+    """Factor snapshot style rows (factor scores + actual points) for one player"""
+    rng = np.random.default_rng(seed)
+    columns = [SNAPSHOT_FACTOR_KEYS.get(factor, factor) for factor in tuner.default_weights]
+    games = pd.DataFrame(rng.normal(size=(len(game_pks), len(columns))), columns=columns)
+    games['actual'] = rng.normal(10, 4, size=len(game_pks))
+    games['game_pk'] = game_pks
+    games['player_name'] = 'Test Player'
+    return games
+
+
+def test_correlations_match_corrcoef():
+    rng = np.random.default_rng(1)
+    predictions = rng.normal(size=(40, 7))
+    predictions[:, 3] = 2.5  # constant candidate
+    actuals = rng.normal(size=40)
+
+    result = WeightTuner.correlations(predictions, actuals)
+
+    for j in range(predictions.shape[1]):
+        expected = 0.0 if j == 3 else np.corrcoef(predictions[:, j], actuals)[0, 1]
+        assert abs(result[j] - expected) < 1e-12
+        assert abs(WeightTuner.correlation(predictions[:, j], actuals) - expected) < 1e-12
+
+
+def test_vectorized_optimizer_matches_scalar(tmp_path, capsys):
+    tuner = make_tuner(tmp_path)
+    games = snapshot_games(tuner, np.arange(60))
+    scores, actuals, _ = tuner.score_games('Test Player', games)
+
+    vectorized = tuner.optimize_weights('Test Player', games, (scores, actuals), maxiter=5, popsize=5)
+    scalar = tuner.optimize_weights('Test Player', games, (scores, actuals), maxiter=5, popsize=5,
+                                    vectorized=False)
+
+    assert list(vectorized) == list(tuner.default_weights)
+    for factor in tuner.default_weights:
+        assert abs(vectorized[factor] - scalar[factor]) < 1e-8
+
+
+def test_score_cache_appends_drops_and_counts_untuned_games(tmp_path, capsys):
+    tuner = make_tuner(tmp_path)
+    games = snapshot_games(tuner, [20240401, 20240402, 20240403, 20240404, 20240405])
+
+    (scores, actuals), new_games = tuner.cached_factor_score_matrix('Test Player', games.iloc[:3])
+    assert scores.shape == (3, len(tuner.default_weights))
+    assert new_games == 3
+    assert tuner.score_cache_file('Test Player').exists()
+
+    # Saving weights marks every cached game as tuned
+    tuner.mark_score_cache_tuned('Test Player')
+    _, new_games = tuner.cached_factor_score_matrix('Test Player', games.iloc[:3])
+    assert new_games == 0
+
+    # New games are appended and count as untuned
+    (scores, actuals), new_games = tuner.cached_factor_score_matrix('Test Player', games)
+    assert new_games == 2
+    np.testing.assert_array_equal(actuals, games['actual'].to_numpy())
+
+    # Games no longer in the history are dropped
+    (scores, actuals), new_games = tuner.cached_factor_score_matrix('Test Player', games.iloc[1:])
+    assert new_games == 2
+    np.testing.assert_array_equal(actuals, games['actual'].to_numpy()[1:])
+    _, _, game_keys, _, tuned = tuner.load_score_cache('Test Player')
+    np.testing.assert_array_equal(game_keys, games['game_pk'].to_numpy()[1:])
+    np.testing.assert_array_equal(tuned, [True, True, False, False])
+
+
+def test_score_cache_rescores_games_whose_version_changed(tmp_path, capsys):
+    tuner = make_tuner(tmp_path)
+    games = snapshot_games(tuner, [20240401, 20240402, 20240403]).assign(game_version=7)
+    tuner.cached_factor_score_matrix('Test Player', games)
+    tuner.mark_score_cache_tuned('Test Player')
+
+    # The second date's snapshot was recomputed: new scores and a new version
+    changed = games.copy()
+    changed.loc[1, 'wind'] = 42.0
+    changed.loc[1, 'game_version'] = 8
+    (scores, actuals), new_games = tuner.cached_factor_score_matrix('Test Player', changed)
+
+    assert new_games == 1
+    assert len(scores) == 3
+    wind = list(tuner.default_weights).index('wind')
+    assert sorted(scores[:, wind])[-1] == 42.0